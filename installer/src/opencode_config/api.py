@@ -0,0 +1,373 @@
+"""
+Programmatic API for driving installations from Python.
+
+Every function takes explicit paths and configuration objects instead of
+reading ``~/.config/opencode``, and nothing here prints: warnings and errors
+are collected on the returned result. Calls share no state, so one process
+can run many operations, including concurrently from several threads.
+
+Example::
+
+    from pathlib import Path
+    from opencode_config import api
+    from opencode_config.config import Config
+
+    config = Config(Path("/srv/cfg.json"), data={"model_tiers": {...}})
+    result = api.install(Path("/srv/registry"), Path("/home/u/.config/opencode"), config)
+    if not result.success:
+        print(result.errors)
+"""
+
+import filecmp
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Config
+from .utils.bundles import resolve_bundles
+from .utils.catalog import Catalog, CatalogEntry
+from .utils.copy import CopyManager, build_tier_index
+from .utils.installed_db import InstalledDB
+from .utils.verify import record_files
+
+PACKAGE = "opencode"
+
+
+@dataclass
+class InstallPlan:
+    """Files an install would write, grouped by their effect on the target."""
+
+    target_dir: Path
+    create: List[Path] = field(default_factory=list)
+    overwrite: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def changes(self) -> List[Path]:
+        """Files whose content on disk would change."""
+        return sorted(self.create + self.overwrite)
+
+
+@dataclass
+class OperationResult:
+    """Outcome of an install, update or uninstall."""
+
+    target_dir: Path
+    success: bool
+    written: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    # Database delta from InstalledDB.sync_from_detected (empty without a db)
+    delta: Dict[str, List[str]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+class _Collector:
+    """CopyManager log callback that keeps warnings and errors."""
+
+    def __init__(self):
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+
+    def __call__(self, level: str, message: str):
+        if level == "error":
+            self.errors.append(message)
+        elif level == "warning":
+            self.warnings.append(message)
+
+
+def list_components(
+    registry_path: Path, component_type: Optional[str] = None, tag: Optional[str] = None
+) -> List[CatalogEntry]:
+    """
+    List registry components.
+
+    Args:
+        registry_path: Path to registry root
+        component_type: Only return components of this type
+        tag: Only return components with this tag
+
+    Returns:
+        Matching catalog entries
+    """
+    return Catalog.scan(registry_path).filter(component_type, tag)
+
+
+def detect(
+    target_dir: Path, config: Config, snapshot_path: Optional[Path] = None
+) -> Dict[str, List[str]]:
+    """
+    Detect components installed in a target directory.
+
+    Nothing is written unless ``snapshot_path`` is given, in which case
+    directory listings are cached there between calls.
+
+    Args:
+        target_dir: Installation directory
+        config: Config instance
+        snapshot_path: Detection snapshot file (no snapshot is used if None)
+
+    Returns:
+        Dictionary mapping component types to lists of component IDs
+    """
+    manager = CopyManager(Path(), target_dir, config, snapshot_path, log=_Collector())
+    return manager.detect_installed_components(use_snapshot=snapshot_path is not None)
+
+
+def plan(
+    registry_path: Path,
+    target_dir: Path,
+    config: Config,
+    model_override: Optional[str] = None,
+) -> InstallPlan:
+    """
+    Render the registry and compare it with a target without writing anything.
+
+    Args:
+        registry_path: Path to registry root
+        target_dir: Installation directory
+        config: Config instance used to resolve model tiers
+        model_override: Optional model replacing tier resolution
+
+    Returns:
+        Install plan for the target
+    """
+    collector = _Collector()
+    manager = CopyManager(registry_path, target_dir, config, log=collector)
+    result = InstallPlan(target_dir)
+
+    if not (registry_path / PACKAGE).exists():
+        result.errors.append(f"Package directory not found: {registry_path / PACKAGE}")
+        return result
+
+    rendered, _ = manager.render_package(PACKAGE, model_override)
+    for item in rendered:
+        dest = target_dir / item.rel_path
+        if not dest.exists():
+            result.create.append(item.rel_path)
+        elif _same_content(item.content, item.source, dest):
+            result.unchanged.append(item.rel_path)
+        else:
+            result.overwrite.append(item.rel_path)
+
+    result.errors.extend(collector.errors)
+    result.warnings.extend(collector.warnings)
+    return result
+
+
+def install(
+    registry_path: Path,
+    target_dir: Path,
+    config: Config,
+    db: Optional[InstalledDB] = None,
+    model_override: Optional[str] = None,
+    bundle: Optional[str] = None,
+) -> OperationResult:
+    """
+    Install the registry into a target directory.
+
+    Args:
+        registry_path: Path to registry root
+        target_dir: Installation directory
+        config: Config instance used to resolve model tiers
+        db: Database to record the install in (nothing is recorded if None)
+        model_override: Optional model replacing tier resolution
+        bundle: Only install this bundle's components, their dependencies and
+            the shared files
+
+    Returns:
+        Operation result
+
+    Raises:
+        ValueError: If the bundle does not exist in the registry or cannot be resolved
+    """
+    resolution = _resolve_bundle(registry_path, bundle) if bundle else None
+    components = None
+
+    collector = _Collector()
+    manager = CopyManager(registry_path, target_dir, config, log=collector)
+    result = OperationResult(target_dir, success=False)
+
+    if resolution is not None:
+        components = sorted({cid for layer in resolution["layers"] for cid in layer})
+        if resolution["unknown"]:
+            collector.warnings.append(
+                f"Not in the registry, skipped: {', '.join(resolution['unknown'])}"
+            )
+
+    if not (registry_path / PACKAGE).exists():
+        collector.errors.append(f"Package directory not found: {registry_path / PACKAGE}")
+    elif resolution is not None:
+        result.success = manager.install_components(
+            PACKAGE, resolution["layers"], model_override=model_override
+        )
+        result.written = manager.written
+    else:
+        rendered, render_ok = manager.render_package(PACKAGE, model_override)
+        manager.tier_index = build_tier_index(rendered)
+        result.written, write_ok = manager.write_rendered(rendered, target_dir)
+        result.success = render_ok and write_ok
+
+    if result.success and db is not None:
+        if bundle:
+            db.add_bundle(bundle, components)
+        result.delta = _sync(
+            db, manager, None, manager.tier_index, model_override, components=components
+        )
+        db.log_action(
+            "install",
+            [bundle] if bundle else result.delta["added"],
+            manager.install_method,
+            "success",
+        )
+
+    result.errors.extend(collector.errors)
+    result.warnings.extend(collector.warnings)
+    return result
+
+
+def update(
+    registry_path: Path,
+    target_dir: Path,
+    config: Config,
+    db: Optional[InstalledDB] = None,
+    model_override: Optional[str] = None,
+) -> OperationResult:
+    """
+    Rewrite a target from the registry, re-applying the current model tiers.
+
+    Installed component versions are refreshed from the registry manifests.
+
+    Args:
+        registry_path: Path to registry root
+        target_dir: Installation directory
+        config: Config instance used to resolve model tiers
+        db: Database to record the update in (nothing is recorded if None)
+        model_override: Optional model replacing tier resolution
+
+    Returns:
+        Operation result
+    """
+    collector = _Collector()
+    manager = CopyManager(registry_path, target_dir, config, log=collector)
+    result = OperationResult(target_dir, success=False)
+
+    if (registry_path / PACKAGE).exists():
+        # Render everything first so a render failure leaves the target untouched
+        rendered, render_ok = manager.render_package(PACKAGE, model_override)
+        manager.tier_index = build_tier_index(rendered)
+        if render_ok:
+            result.written, result.success = manager.write_rendered(rendered, target_dir)
+    else:
+        collector.errors.append(f"Package directory not found: {registry_path / PACKAGE}")
+
+    if result.success and db is not None:
+        versions = {e.manifest.id: e.manifest.version for e in Catalog.scan(registry_path).entries}
+        result.delta = _sync(db, manager, versions, manager.tier_index, model_override)
+        affected = result.delta["added"] + result.delta["updated"]
+        db.log_action("update", affected, manager.install_method, "success")
+
+    result.errors.extend(collector.errors)
+    result.warnings.extend(collector.warnings)
+    return result
+
+
+def uninstall(
+    registry_path: Path,
+    target_dir: Path,
+    config: Config,
+    db: Optional[InstalledDB] = None,
+    dry_run: bool = False,
+) -> OperationResult:
+    """
+    Remove registry files from a target directory.
+
+    Args:
+        registry_path: Path to registry root
+        target_dir: Installation directory
+        config: Config instance
+        db: Database to record the removal in (nothing is recorded if None)
+        dry_run: If True, only report what would be removed
+
+    Returns:
+        Operation result
+    """
+    collector = _Collector()
+    manager = CopyManager(registry_path, target_dir, config, log=collector)
+    result = OperationResult(target_dir, success=True)
+    result.removed = manager.remove_package_files(PACKAGE, dry_run=dry_run)
+
+    if not dry_run and db is not None:
+        with db.batch():
+            result.delta = _sync(db, manager)
+            db.forget_files(rel.as_posix() for rel in result.removed)
+            db.log_action("uninstall", result.delta["removed"], manager.install_method, "success")
+
+    result.errors.extend(collector.errors)
+    result.warnings.extend(collector.warnings)
+    return result
+
+
+def _sync(
+    db: InstalledDB,
+    manager: CopyManager,
+    component_versions: Optional[Dict[str, str]] = None,
+    tier_index: Optional[Dict[str, List[str]]] = None,
+    model_override: Optional[str] = None,
+    components: Optional[List[str]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Point db at manager's target and sync it with what is on disk there.
+
+    With ``components``, only the tiers and records of those components'
+    files and the shared files are replaced.
+    """
+    with db.batch():
+        if tier_index is not None and components is None:
+            db.set_tier_index(tier_index, model_override)
+        db.set_install_method(manager.install_method)
+        db.set_target_directory(str(manager.target_dir))
+        db.set_registry_path(str(manager.registry_path))
+
+        detected = manager.detect_installed_components()
+        delta = db.sync_from_detected(detected, manager.install_method, component_versions)
+        selected = set(components) if components is not None else None
+        files = [rel.as_posix() for _, rel in manager.collect_package_files(PACKAGE, selected)]
+        db.set_file_ownership(files)
+        records = record_files(manager.target_dir, files)
+        if components is not None:
+            file_tiers: Dict[str, List[str]] = {rel: [] for rel in files}
+            for tier, paths in (tier_index or {}).items():
+                for rel in paths:
+                    file_tiers.setdefault(rel, []).append(tier)
+            db.update_tier_index(file_tiers)
+            records = {**db.get_file_records(), **records}
+        db.set_file_records(records)
+    return delta
+
+
+def _resolve_bundle(registry_path: Path, bundle: str) -> Dict[str, Any]:
+    """
+    Resolve a bundle to its components in dependency order.
+
+    Raises:
+        ValueError: If the bundle does not exist or its dependencies form a cycle
+    """
+    resolution = resolve_bundles(registry_path).get(bundle)
+    if resolution is None:
+        raise ValueError(f"Bundle '{bundle}' not found in {registry_path / 'bundles'}")
+    if resolution["error"]:
+        raise ValueError(f"Cannot resolve bundle '{bundle}': {resolution['error']}")
+    return resolution
+
+
+def _same_content(content: Optional[str], source: Path, dest: Path) -> bool:
+    """Check whether a rendered file matches what is already installed."""
+    if content is None:
+        return filecmp.cmp(source, dest, shallow=False)
+    try:
+        return dest.read_text(encoding="utf-8") == content
+    except (OSError, UnicodeDecodeError):
+        return False
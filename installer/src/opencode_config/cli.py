@@ -2,17 +2,125 @@
 OpenCode Registry CLI - Manage OpenCode components with ease.
 """
 
+import importlib
+from typing import Dict, List, Optional, Tuple
+
 import click
-from rich.console import Console
 
-from .commands import install, list_cmd, status, info, uninstall, config, sync, update, models
+CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
+
+# Subcommands are imported only when invoked, so that `--help` and quick
+# commands such as `status` do not pay for rich/yaml/copy machinery they
+# never use. Each entry maps the command name to (import path, short help);
+# the short help is shown by `--help` without importing the module.
+LAZY_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "install": ("opencode_config.commands.install:install", "Install a component or bundle."),
+    "list": (
+        "opencode_config.commands.list_cmd:list_components",
+        "List all available components in the registry.",
+    ),
+    "status": (
+        "opencode_config.commands.status:status",
+        "Show installation status and installed components.",
+    ),
+    "info": ("opencode_config.commands.info:info", "Show detailed information about a component."),
+    "uninstall": (
+        "opencode_config.commands.uninstall:uninstall",
+        "Uninstall a component, bundle, or everything.",
+    ),
+    "update": (
+        "opencode_config.commands.update:update",
+        "Update installed components to latest available versions.",
+    ),
+    "sync": (
+        "opencode_config.commands.sync:sync",
+        "Sync database with actual installed components on disk.",
+    ),
+    "config": ("opencode_config.commands.config:config", "Manage opencode-config configuration."),
+    "models": ("opencode_config.commands.models:models", "Manage model tier configuration."),
+    "gc": (
+        "opencode_config.commands.gc:gc",
+        "Remove stored objects that no installation links to.",
+    ),
+    "analyze": (
+        "opencode_config.commands.analyze:analyze",
+        "Estimate the token cost of each component's prompt.",
+    ),
+    "lint": (
+        "opencode_config.commands.lint:lint",
+        "Check registry components, references and bundles for problems.",
+    ),
+    "rollback": (
+        "opencode_config.commands.rollback:rollback",
+        "Switch the installation back to an earlier generation.",
+    ),
+    "lock": (
+        "opencode_config.commands.lock:lock",
+        "Write a lockfile pinning versions, file hashes and models.",
+    ),
+    "pack": (
+        "opencode_config.commands.pack:pack",
+        "Write a pre-rendered archive for installing without a registry.",
+    ),
+    "serve": (
+        "opencode_config.commands.serve:serve",
+        "Run a daemon that answers CLI queries from memory.",
+    ),
+    "watch": (
+        "opencode_config.commands.watch:watch",
+        "Re-render registry files into the installation as they change.",
+    ),
+}
 
-console = Console()
 
-CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(
+        self, *args, lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """List subcommands using their static short help instead of importing them."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                # Placeholder carrying the static help, formatted like a real command
+                command = click.Command(name, help=self.lazy_subcommands[name][1])
+            if not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name][0]
+        module_name, attr = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand '{import_path}' is not a click command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, context_settings=CONTEXT_SETTINGS
+)
 @click.version_option(version="0.2.0", prog_name="opencode-config")
 def main():
     """
@@ -23,17 +131,5 @@ def main():
     pass
 
 
-# Register commands
-main.add_command(install.install)
-main.add_command(list_cmd.list_components)
-main.add_command(status.status)
-main.add_command(info.info)
-main.add_command(uninstall.uninstall)
-main.add_command(update.update)
-main.add_command(sync.sync)
-main.add_command(config.config)
-main.add_command(models.models)
-
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,121 @@
+"""
+Analyze prompt sizes.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+from ..config import Config
+from ..utils.analyze import (
+    BASELINE_FILENAME,
+    analyze_registry,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+
+console = Console()
+
+
+@click.command()
+@click.option("--top", "-n", default=15, show_default=True, help="Number of components to rank")
+@click.option(
+    "--type",
+    "-t",
+    "types",
+    multiple=True,
+    type=click.Choice(["agent", "subagent", "skill", "command"]),
+    help="Only rank components of this type (repeatable)",
+)
+@click.option(
+    "--baseline",
+    "baseline_file",
+    type=click.Path(dir_okay=False),
+    help=f"Baseline file (default: <registry>/{BASELINE_FILENAME})",
+)
+@click.option("--save-baseline", "save", is_flag=True, help="Record current sizes as the baseline")
+@click.option(
+    "--threshold",
+    default=10.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Allowed growth over the baseline, in percent",
+)
+def analyze(
+    top: int, types: Tuple[str, ...], baseline_file: Optional[str], save: bool, threshold: float
+):
+    """Estimate the token cost of each component's prompt.
+
+    Counts each component's own prompt and the _shared fragments it pulls
+    in, ranks the heaviest components and compares them against a saved
+    baseline. Exits non-zero when a component grew by more than the
+    threshold, so prompt bloat can be caught in CI.
+    """
+    config = Config()
+    registry_path = config.registry_path or config.detect_registry_path()
+
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry.")
+        sys.exit(2)
+
+    analysis = analyze_registry(registry_path)
+    baseline_path = (
+        Path(baseline_file).expanduser() if baseline_file else registry_path / BASELINE_FILENAME
+    )
+
+    ranked = analysis.heaviest(set(types) if types else {"agent", "subagent"}, top)
+    table = Table(title=f"Heaviest Prompts (approx. tokens, top {len(ranked)})")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Type", style="magenta")
+    table.add_column("Own", justify="right")
+    table.add_column("Shared", justify="right")
+    table.add_column("Total", justify="right", style="bold")
+    for size in ranked:
+        table.add_row(size.id, size.type, str(size.own), str(size.shared), str(size.total))
+    console.print(table)
+
+    if analysis.fragments:
+        table = Table(title="Shared Fragments")
+        table.add_column("File", style="cyan")
+        table.add_column("Tokens", justify="right")
+        table.add_column("Used By", justify="right")
+        for name, tokens in sorted(analysis.fragments.items(), key=lambda kv: (-kv[1], kv[0])):
+            table.add_row(f"_shared/{name}", str(tokens), str(analysis.users(name)))
+        console.print(table)
+
+    if save:
+        save_baseline(analysis, baseline_path)
+        console.print(
+            f"[green]✓[/green] Saved baseline for {len(analysis.components)} components "
+            f"to {baseline_path}"
+        )
+        return
+
+    if not baseline_path.exists():
+        console.print("[dim]No baseline yet; run with --save-baseline to record one.[/dim]")
+        return
+
+    try:
+        baseline = load_baseline(baseline_path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(2)
+
+    regressions = find_regressions(analysis, baseline, threshold)
+    if not regressions:
+        console.print(
+            f"[green]✓[/green] No prompt grew more than {threshold:g}% over the baseline"
+        )
+        return
+
+    console.print(f"\n[red]Prompts grown more than {threshold:g}% over the baseline:[/red]")
+    for regression in regressions:
+        console.print(
+            f"  {regression.key}: {regression.baseline} → {regression.current} "
+            f"(+{regression.growth:.1f}%)"
+        )
+    sys.exit(1)
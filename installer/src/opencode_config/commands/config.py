@@ -4,7 +4,6 @@ Manage configuration.
 
 import click
 from rich.console import Console
-from rich.table import Table
 from ..config import Config
 
 console = Console()
@@ -14,11 +13,43 @@ console = Console()
 @click.option("--list", "-l", "list_config", is_flag=True, help="List current configuration")
 @click.option("--target", "-t", help="Set target directory")
 @click.option("--registry", "-r", help="Set registry path (use 'auto' to enable auto-detection)")
-def config(list_config: bool, target: str, registry: str):
+@click.option(
+    "--method",
+    type=click.Choice(["copy", "link"]),
+    help="Set install method (link: hard-link files from a shared object store)",
+)
+@click.option("--store", help="Set object store directory for the link method")
+@click.option(
+    "--generations",
+    type=click.IntRange(min=0),
+    help="Set install generations kept for rollback (0 disables generations)",
+)
+@click.option(
+    "--minify/--no-minify",
+    default=None,
+    help="Strip comments, authoring-only sections and extra whitespace from installed prompts",
+)
+@click.option(
+    "--includes",
+    type=click.Choice(["inline", "reference"]),
+    help="Set how {{include:...}} directives install (inline: splice in the fragment)",
+)
+def config(
+    list_config: bool,
+    target: str,
+    registry: str,
+    method: str,
+    store: str,
+    generations: int,
+    minify: bool,
+    includes: str,
+):
     """Manage opencode-config configuration."""
     cfg = Config()
 
     if list_config:
+        from rich.table import Table
+
         table = Table(title="Configuration")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
@@ -42,5 +73,34 @@ def config(list_config: bool, target: str, registry: str):
             cfg.set("registry_path", registry)
             console.print(f"[green]✓[/green] Registry path set to: {registry}")
 
-    if not list_config and not target and registry is None:
+    if method:
+        cfg.set("install_method", method)
+        console.print(f"[green]✓[/green] Install method set to: {method}")
+        if method == "link":
+            console.print(f"[dim]Object store: {cfg.store_path}[/dim]")
+
+    if store:
+        cfg.set("store_path", store)
+        console.print(f"[green]✓[/green] Object store set to: {store}")
+
+    if generations is not None:
+        cfg.set("generations", generations)
+        if generations:
+            console.print(f"[green]✓[/green] Keeping {generations} install generation(s)")
+        else:
+            console.print("[green]✓[/green] Generations disabled; installs write in place")
+
+    if minify is not None:
+        cfg.set("minify", minify)
+        state = "enabled" if minify else "disabled"
+        console.print(f"[green]✓[/green] Prompt minification {state} (applies on next install)")
+
+    if includes:
+        cfg.set("includes", includes)
+        console.print(
+            f"[green]✓[/green] Include directives set to: {includes} (applies on next install)"
+        )
+
+    nothing_set = registry is None and generations is None and minify is None and not includes
+    if not list_config and not target and nothing_set and not method and not store:
         console.print("[yellow]No action specified. Use --help for options[/yellow]")
@@ -0,0 +1,45 @@
+"""
+Garbage-collect the object store.
+"""
+
+import click
+from rich.console import Console
+from ..config import Config
+from ..utils.store import ObjectStore
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--dry-run", "-n", is_flag=True, help="Show what would be removed without removing it"
+)
+def gc(dry_run: bool):
+    """Remove stored objects that no installation links to.
+
+    With the link install method, installed files are hard links into a
+    shared object store. Objects stay behind when files are uninstalled or
+    replaced; this removes the ones no target uses any more.
+    """
+    config = Config()
+    store = ObjectStore(config.store_path)
+
+    if not store.objects_dir.exists():
+        console.print(f"[yellow]No object store at {store.root}[/yellow]")
+        return
+
+    removed, freed = store.gc(dry_run=dry_run)
+    count, size = store.stats()
+
+    verb = "Would remove" if dry_run else "Removed"
+    console.print(f"[green]✓[/green] {verb} {removed} objects ({_format_size(freed)})")
+    console.print(f"[dim]{count} objects ({_format_size(size)}) in {store.root}[/dim]")
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -4,24 +4,21 @@ Show component information.
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
-from ..config import Config
-from ..utils.manifest import ManifestParser
-from ..utils.installed_db import InstalledDB
+from ..utils.completion import complete_component_ids
+from ..utils.daemon import load_component, load_config, load_installed_db
 
 console = Console()
 
 
 @click.command()
-@click.argument("component_id", required=False)
+@click.argument("component_id", required=False, shell_complete=complete_component_ids)
 def info(component_id: str):
     """Show detailed information about a component.
 
     COMPONENT_ID is the unique identifier for the component (e.g., build-code, mcp-builder).
     """
-    config = Config()
-    db = InstalledDB()
+    config = load_config()
+    db = load_installed_db()
 
     # If no component_id provided, show helpful message
     if not component_id:
@@ -44,46 +41,16 @@ def info(component_id: str):
         console.print("[red]Error:[/red] Could not find registry.")
         return
 
-    opencode_dir = registry_path / "opencode"
-
     # Search for component
-    manifest = None
-    component_path = None
-
-    # Check agents
-    agent_file = opencode_dir / "agents" / f"{component_id}.md"
-    if agent_file.exists():
-        manifest = ManifestParser.create_from_md(agent_file, "agent")
-        component_path = agent_file
-
-    # Check subagents
-    if not manifest:
-        subagent_dir = opencode_dir / "agents" / "subagents"
-        for category_dir in subagent_dir.glob("*/"):
-            subagent_file = category_dir / f"{component_id}.md"
-            if subagent_file.exists():
-                manifest = ManifestParser.create_from_md(subagent_file, "subagent")
-                component_path = subagent_file
-                break
-
-    # Check skills
-    if not manifest:
-        skill_path = opencode_dir / "skills" / component_id / "SKILL.md"
-        if skill_path.exists():
-            manifest = ManifestParser.create_from_md(skill_path, "skill")
-            component_path = skill_path
-
-    # Check commands
-    if not manifest:
-        command_file = opencode_dir / "commands" / f"{component_id}.md"
-        if command_file.exists():
-            manifest = ManifestParser.create_from_md(command_file, "command")
-            component_path = command_file
-
-    if not manifest:
+    entry = load_component(registry_path, component_id)
+
+    if not entry:
         console.print(f"[red]Error:[/red] Component '{component_id}' not found")
         return
 
+    manifest = entry.manifest
+    component_path = entry.path
+
     # Check if installed
     is_installed = db.is_installed(component_id)
 
@@ -116,6 +83,9 @@ opencode-config install {manifest.id}
 ```
 """
 
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     console.print(
         Panel(Markdown(info_text), title=f"Component Info: {component_id}", border_style="blue")
     )
@@ -4,12 +4,19 @@ Install components.
 
 import click
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..config import Config
-from ..utils.copy import CopyManager
-from ..utils.installed_db import InstalledDB
-from .models import run_wizard
+from ..utils.bundles import component_files, plan_switch, read_bundle
+from ..utils.completion import complete_bundles, complete_component_ids
+from ..utils.copy import CopyManager, build_tier_index
+from ..utils.daemon import load_catalog
+from ..utils.generations import Generations, install_generation
+from ..utils.graph import CycleError, DependencyGraph
+from ..utils.installed_db import DB_FILENAME, InstalledDB
+from ..utils.pipeline import TIMINGS
+from ..utils.registry_index import INDEX_FILENAME, RegistryIndex
+from ..utils.verify import record_files
 
 console = Console()
 
@@ -32,6 +39,8 @@ def _check_model_tiers(config: Config, db: InstalledDB) -> bool:
     is_first_run = not db.get_all_installed()
 
     if is_first_run:
+        from .models import run_wizard
+
         console.print(
             "[cyan]Welcome![/cyan] Before installing, let's configure which models "
             "to use for each complexity tier.\n"
@@ -67,17 +76,616 @@ def _check_model_tiers(config: Config, db: InstalledDB) -> bool:
     return False
 
 
+def _read_targets_file(targets_file: str) -> List[Path]:
+    """
+    Read target directories from a file.
+
+    One path per line; blank lines and lines starting with ``#`` are ignored.
+    """
+    targets = []
+    with open(targets_file, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                targets.append(Path(line))
+    return targets
+
+
+def _resolve_targets(
+    config: Config, target: Tuple[str, ...], targets_file: Optional[str]
+) -> List[Path]:
+    """Collect target directories from --target and --targets-file, without duplicates."""
+    candidates = [Path(t) for t in target]
+    if targets_file:
+        candidates.extend(_read_targets_file(targets_file))
+    if not candidates:
+        candidates = [config.target_dir]
+
+    targets = []
+    for candidate in candidates:
+        candidate = candidate.expanduser()
+        if candidate not in targets:
+            targets.append(candidate)
+    return targets
+
+
+def _record_install(
+    db: InstalledDB,
+    copy_manager: CopyManager,
+    registry_path: Optional[Path],
+    installed: List[str],
+    bundle: Optional[Tuple[str, List[str]]] = None,
+    component_versions: Optional[Dict[str, str]] = None,
+    tier_index: Optional[Dict[str, List[str]]] = None,
+    model_override: Optional[str] = None,
+    files: Optional[List[str]] = None,
+    partial: bool = False,
+):
+    """
+    Record a successful install of copy_manager's target directory in db.
+
+    ``files`` lists the installed paths for file ownership; it defaults to
+    the package's files in the registry. ``registry_path`` is None for
+    installs that did not use a registry. A ``partial`` install (selected
+    components) updates the tier index and file records of its own files
+    and keeps those of everything else.
+    """
+    # Every setter saves; write the database once for the whole install
+    with db.batch():
+        install_method = copy_manager.install_method
+        db.set_install_method(install_method)
+        db.set_target_directory(str(copy_manager.target_dir))
+        if registry_path is not None:
+            db.set_registry_path(str(registry_path))
+        if bundle:
+            db.add_bundle(*bundle)
+        if tier_index is not None and not partial:
+            db.set_tier_index(tier_index, model_override)
+
+        # Detect and sync actual installed components
+        detected = copy_manager.detect_installed_components()
+        db.sync_from_detected(detected, install_method, component_versions)
+        if files is None:
+            files = [rel.as_posix() for _, rel in copy_manager.collect_package_files("opencode")]
+        db.set_file_ownership(files)
+        file_records = record_files(copy_manager.target_dir, files)
+        if partial:
+            file_tiers: Dict[str, List[str]] = {rel: [] for rel in files}
+            for tier, paths in (tier_index or {}).items():
+                for rel in paths:
+                    file_tiers.setdefault(rel, []).append(tier)
+            db.update_tier_index(file_tiers)
+            file_records = {**db.get_file_records(), **file_records}
+        db.set_file_records(file_records)
+
+        db.log_action("install", installed, install_method, "success")
+
+
+def _install_to_targets(
+    config: Config,
+    db: InstalledDB,
+    registry_path: Path,
+    targets: List[Path],
+    dry_run: bool,
+    model: Optional[str],
+    installed: List[str],
+    bundle: Optional[Tuple[str, List[str]]] = None,
+    layers: Optional[List[List[str]]] = None,
+) -> bool:
+    """
+    Install the opencode package into every target and record each install.
+
+    A single target is recorded in the user database, and is written as a
+    new generation when generations are enabled. With several targets the
+    package is rendered once and written to all of them in parallel; each
+    target then keeps its own database file inside the target directory.
+
+    With ``layers`` (component IDs in dependency order), only those
+    components and the shared files are installed.
+
+    Returns:
+        True if every target was installed successfully
+    """
+    components = {component for layer in layers for component in layer} if layers else None
+    files = None
+    if components is not None:
+        manager = CopyManager(registry_path, targets[0], config)
+        files = [rel.as_posix() for _, rel in manager.collect_package_files("opencode", components)]
+
+    if len(targets) == 1:
+        copy_manager = CopyManager(registry_path, targets[0], config)
+
+        def apply(manager: CopyManager) -> bool:
+            if layers:
+                return manager.install_components(
+                    "opencode", layers, dry_run=dry_run, model_override=model
+                )
+            return manager.install_package("opencode", dry_run=dry_run, model_override=model)
+
+        keep = 0 if dry_run else config.get("generations", 0)
+        generation = install_generation(copy_manager, keep, apply) if keep else None
+        success = generation is not None if keep else apply(copy_manager)
+        if success and not dry_run:
+            _record_install(
+                db,
+                copy_manager,
+                registry_path,
+                installed,
+                bundle,
+                tier_index=copy_manager.tier_index,
+                model_override=model,
+                files=files,
+                partial=components is not None,
+            )
+            if generation is not None:
+                Generations(targets[0]).save_db(generation, db.data)
+                console.print(f"[dim]Activated generation {generation}[/dim]")
+        return success
+
+    if dry_run:
+        # Rendering is target-independent, so previewing once covers all targets
+        copy_manager = CopyManager(registry_path, targets[0], config)
+        if layers:
+            return copy_manager.install_components("opencode", layers, dry_run=True)
+        return copy_manager.install_package("opencode", dry_run=True, model_override=model)
+
+    copy_manager = CopyManager(registry_path, targets[0], config)
+    results = copy_manager.install_package_to_targets(
+        "opencode", targets, model_override=model, components=components
+    )
+
+    for target_dir, target_ok in results.items():
+        if target_ok:
+            target_db = InstalledDB(target_dir / DB_FILENAME)
+            target_manager = CopyManager(registry_path, target_dir, config)
+            _record_install(
+                target_db,
+                target_manager,
+                registry_path,
+                installed,
+                bundle,
+                tier_index=copy_manager.tier_index,
+                model_override=model,
+                files=files,
+                partial=components is not None,
+            )
+        else:
+            console.print(f"[red]✗[/red] Failed to install into {target_dir}")
+
+    return all(results.values())
+
+
+def _install_profiles(
+    config: Config,
+    registry_path: Path,
+    profiles: Tuple[str, ...],
+    dry_run: bool,
+    installed: List[str],
+    bundle: Optional[Tuple[str, List[str]]] = None,
+    layers: Optional[List[List[str]]] = None,
+) -> bool:
+    """
+    Render the opencode package for several tier profiles in one pass.
+
+    Each ``NAME=TARGET`` spec renders the package with the named profile's
+    tiers into TARGET. Every target keeps its own database file.
+
+    With ``layers`` (component IDs in dependency order), only those
+    components and the shared files are rendered.
+
+    Returns:
+        True if every profile was installed successfully
+    """
+    configs = {}
+    targets = {}
+    for spec in profiles:
+        name, sep, target = spec.partition("=")
+        if not sep or not name or not target:
+            console.print(f"[red]Error:[/red] Expected --profile NAME=TARGET, got '{spec}'")
+            return False
+        try:
+            configs[name] = config.profile_config(name)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            console.print(
+                f"[dim]Create it with 'opencode-config models --profile {name} --set ...'[/dim]"
+            )
+            return False
+        targets[name] = Path(target).expanduser()
+
+    for name, target_dir in targets.items():
+        console.print(f"[dim]Profile {name} → {target_dir}[/dim]")
+
+    components = {component for layer in layers for component in layer} if layers else None
+    copy_manager = CopyManager(registry_path, next(iter(targets.values())), config)
+    files = [
+        rel.as_posix() for _, rel in copy_manager.collect_package_files("opencode", components)
+    ]
+    if dry_run:
+        console.print(f"[dim]Would render {len(files)} files for {len(configs)} profiles[/dim]")
+        return True
+
+    variants, render_ok = copy_manager.render_variants("opencode", configs, components)
+    results = copy_manager.write_variants(variants, targets)
+
+    for name, target_ok in results.items():
+        if not (render_ok and target_ok):
+            console.print(f"[red]✗[/red] Failed to install profile '{name}' into {targets[name]}")
+            continue
+        _record_install(
+            InstalledDB(targets[name] / DB_FILENAME),
+            CopyManager(registry_path, targets[name], configs[name]),
+            registry_path,
+            installed,
+            bundle,
+            tier_index=build_tier_index(variants[name]),
+            files=files,
+            partial=components is not None,
+        )
+
+    return render_ok and all(results.values())
+
+
+def _install_frozen(
+    config: Config,
+    db: InstalledDB,
+    registry_path: Path,
+    targets: List[Path],
+    lockfile: Optional[str],
+    dry_run: bool,
+) -> bool:
+    """
+    Install the files pinned by a lockfile into every target.
+
+    Returns:
+        True if every target matches the lockfile afterwards
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from ..utils.lockfile import (
+        LOCK_FILENAME,
+        install_frozen,
+        load_lock,
+        locked_tier_index,
+        locked_versions,
+    )
+
+    lock_path = Path(lockfile).expanduser() if lockfile else registry_path / LOCK_FILENAME
+    try:
+        lock = load_lock(lock_path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] Could not read lockfile {lock_path}: {e}")
+        return False
+
+    console.print(f"[dim]Lockfile: {lock_path} ({len(lock['files'])} files)[/dim]\n")
+
+    with ThreadPoolExecutor() as executor:
+        results = list(
+            executor.map(
+                lambda target_dir: install_frozen(
+                    registry_path, target_dir, lock, dry_run, config=config
+                ),
+                targets,
+            )
+        )
+
+    versions = locked_versions(lock)
+    success = True
+    for target_dir, result in zip(targets, results):
+        if not result.success:
+            success = False
+            console.print(f"[red]✗[/red] {target_dir}")
+            for error in result.errors:
+                console.print(f"  [red]•[/red] {error}")
+            continue
+
+        verb = "would write" if dry_run else "written"
+        console.print(
+            f"[green]✓[/green] {target_dir}: {len(result.written)} {verb}, "
+            f"{len(result.unchanged)} unchanged"
+        )
+        if dry_run:
+            continue
+
+        target_db = db if len(targets) == 1 else InstalledDB(target_dir / DB_FILENAME)
+        _record_install(
+            target_db,
+            CopyManager(registry_path, target_dir, config),
+            registry_path,
+            sorted(versions),
+            component_versions=versions,
+            tier_index=locked_tier_index(lock),
+            model_override=lock.get("modelOverride"),
+            files=sorted(lock["files"]),
+        )
+
+    return success
+
+
+def _install_from_archive(
+    config: Config, db: InstalledDB, targets: List[Path], archive: str, dry_run: bool
+) -> bool:
+    """
+    Stream a pre-rendered archive into every target.
+
+    Returns:
+        True if every file was verified and installed
+    """
+    from ..utils.archive import install_archive
+    from ..utils.store import store_for
+    from ..utils.lockfile import locked_tier_index, locked_versions
+
+    try:
+        manifest, results = install_archive(
+            Path(archive).expanduser(), targets, dry_run, store=store_for(config)
+        )
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] Could not install archive {archive}: {e}")
+        return False
+
+    profile = manifest.get("profile")
+    console.print(
+        f"[dim]Archive: {archive} ({len(manifest['files'])} files"
+        f"{f', profile {profile}' if profile else ''})[/dim]\n"
+    )
+
+    versions = locked_versions(manifest)
+    success = True
+    for target_dir, result in results.items():
+        if not result.success:
+            success = False
+            console.print(f"[red]✗[/red] {target_dir}")
+            for error in result.errors:
+                console.print(f"  [red]•[/red] {error}")
+            continue
+
+        verb = "would write" if dry_run else "written"
+        console.print(
+            f"[green]✓[/green] {target_dir}: {len(result.written)} {verb}, "
+            f"{len(result.unchanged)} unchanged"
+        )
+        if dry_run:
+            continue
+
+        target_db = db if len(targets) == 1 else InstalledDB(target_dir / DB_FILENAME)
+        _record_install(
+            target_db,
+            CopyManager(Path(), target_dir, config),
+            None,
+            sorted(versions),
+            component_versions=versions,
+            tier_index=locked_tier_index(manifest),
+            model_override=manifest.get("modelOverride"),
+            files=sorted(manifest["files"]),
+        )
+
+    return success
+
+
+def _switch_bundle(
+    config: Config,
+    db: InstalledDB,
+    registry_path: Path,
+    target_dir: Path,
+    dry_run: bool,
+    model: Optional[str],
+    group: str,
+    layers: List[List[str]],
+) -> bool:
+    """
+    Install a bundle into one target, applying only what changes.
+
+    Components the bundle needs that are missing are installed; components
+    only the replaced bundles needed are removed; everything else is left
+    as it is.
+
+    Returns:
+        True if the bundle was installed successfully
+    """
+    components = {cid for layer in layers for cid in layer}
+    switch = plan_switch(db, group, components)
+    copy_manager = CopyManager(registry_path, target_dir, config)
+
+    if switch.replaced:
+        console.print(f"[dim]Replacing bundle(s): {', '.join(switch.replaced)}[/dim]")
+    console.print(
+        f"[dim]{len(switch.add)} to add, {len(switch.remove)} to remove, "
+        f"{len(switch.keep)} already installed[/dim]"
+    )
+
+    removals = {cid: component_files(db, copy_manager, cid) for cid in sorted(switch.remove)}
+    remove_paths = sorted(
+        {rel for owned in removals.values() for files in owned.values() for rel in files}
+    )
+    add_layers = [[cid for cid in layer if cid in switch.add] for layer in layers]
+    add_layers = [layer for layer in add_layers if layer]
+
+    if dry_run:
+        for rel in remove_paths:
+            console.print(f"[yellow]Would remove:[/yellow] {rel}")
+        if add_layers:
+            copy_manager.install_components("opencode", add_layers, dry_run=True)
+        return True
+
+    def apply(manager: CopyManager) -> bool:
+        manager.remove_files(remove_paths)
+        if not add_layers:
+            return True
+        return manager.install_components("opencode", add_layers, model_override=model)
+
+    changed = bool(remove_paths or add_layers)
+    keep = config.get("generations", 0) if changed else 0
+    generation = install_generation(copy_manager, keep, apply) if keep else None
+    success = generation is not None if keep else apply(copy_manager)
+    if not success:
+        return False
+
+    for cid, owned in removals.items():
+        for comp_type in owned:
+            db.remove_component(comp_type, cid)
+    for name in switch.replaced:
+        db.data["bundles"].pop(name, None)
+
+    if add_layers:
+        files = [
+            rel.as_posix()
+            for _, rel in copy_manager.collect_package_files("opencode", switch.add)
+        ]
+        _record_install(
+            db,
+            copy_manager,
+            registry_path,
+            [group],
+            (group, sorted(components)),
+            tier_index=copy_manager.tier_index,
+            model_override=model,
+            files=files,
+            partial=True,
+        )
+    else:
+        db.set_registry_path(str(registry_path))
+        db.add_bundle(group, sorted(components))
+        db.log_action("install", [group], copy_manager.install_method, "success")
+
+    if generation is not None:
+        Generations(target_dir).save_db(generation, db.data)
+        console.print(f"[dim]Activated generation {generation}[/dim]")
+    return True
+
+
+def _print_timings():
+    """Show time spent in each transform stage while rendering files."""
+    from rich.table import Table
+
+    timings = TIMINGS.snapshot()
+    if not timings:
+        return
+    table = Table(title="Transform Stages")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Per File (ms)", justify="right")
+    for name, (calls, seconds) in sorted(timings.items(), key=lambda kv: -kv[1][1]):
+        table.add_row(name, str(calls), f"{seconds * 1000:.1f}", f"{seconds * 1000 / calls:.2f}")
+    console.print()
+    console.print(table)
+
+
+def _resolve_closure(registry_path: Path, component_id: str) -> Optional[List[List[str]]]:
+    """
+    Resolve a component's dependency closure for installation.
+
+    Returns:
+        Component IDs in dependency order (see ``DependencyGraph.layers``),
+        or None after printing an error
+    """
+    graph = DependencyGraph.from_catalog(load_catalog(registry_path))
+    try:
+        closure = graph.closure([component_id])
+        layers = graph.layers(closure)
+    except KeyError:
+        console.print(f"[red]Error:[/red] Component '{component_id}' not found in registry")
+        return None
+    except CycleError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return None
+
+    for node in sorted(closure & set(graph.unresolved)):
+        missing = ", ".join(sorted(graph.unresolved[node]))
+        console.print(f"[yellow]Warning:[/yellow] {node} references unknown components: {missing}")
+    if len(closure) > 1:
+        console.print(
+            f"[dim]Resolved {component_id} to {len(closure)} components "
+            f"in {len(layers)} dependency layer(s)[/dim]"
+        )
+    return layers
+
+
 @click.command()
-@click.argument("component_id", required=False)
-@click.option("--group", "-g", help="Install a bundle/group (e.g., basic, intermediate)")
+@click.argument("component_id", required=False, shell_complete=complete_component_ids)
+@click.option(
+    "--group",
+    "-g",
+    help="Install a bundle/group (e.g., basic, intermediate)",
+    shell_complete=complete_bundles,
+)
 @click.option("--dry-run", "-n", is_flag=True, help="Preview changes without installing")
-@click.option("--target", "-t", help="Custom installation target directory")
+@click.option(
+    "--target",
+    "-t",
+    multiple=True,
+    help="Custom installation target directory (repeat to install into several)",
+)
+@click.option(
+    "--targets-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File listing target directories, one per line",
+)
 @click.option("--model", "-m", help="Override model for component installation")
-def install(component_id: str, group: str, dry_run: bool, target: str, model: str):
+@click.option(
+    "--profile",
+    "-p",
+    "profiles",
+    multiple=True,
+    metavar="NAME=TARGET",
+    help="Render with a named tier profile into TARGET (repeatable)",
+)
+@click.option(
+    "--frozen",
+    is_flag=True,
+    help="Install exactly what the lockfile pins, verifying file hashes",
+)
+@click.option(
+    "--lockfile",
+    type=click.Path(dir_okay=False),
+    help="Lockfile for --frozen (default: <registry>/opencode-registry.lock)",
+)
+@click.option(
+    "--from-archive",
+    "archive",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Install a pre-rendered archive from 'opencode-config pack' (no registry needed)",
+)
+@click.option("--timings", is_flag=True, help="Show time spent in each transform stage")
+def install(
+    component_id: str,
+    group: str,
+    dry_run: bool,
+    target: Tuple[str, ...],
+    targets_file: str,
+    model: str,
+    profiles: Tuple[str, ...],
+    frozen: bool,
+    lockfile: str,
+    archive: str,
+    timings: bool,
+):
     """Install a component or bundle."""
     config = Config()
     db = InstalledDB()
 
+    if timings:
+        click.get_current_context().call_on_close(_print_timings)
+
+    # A pre-rendered archive needs neither a registry nor model tiers
+    if archive:
+        if component_id or group or model or profiles or frozen:
+            console.print(
+                "[red]Error:[/red] --from-archive installs the whole archive; it cannot be "
+                "combined with a component, --group, --model, --profile or --frozen"
+            )
+            return
+        targets = _resolve_targets(config, target, targets_file)
+        if not targets:
+            console.print(f"[red]Error:[/red] No target directories listed in {targets_file}")
+            return
+        if dry_run:
+            console.print("[yellow]DRY RUN MODE - No changes will be made[/yellow]\n")
+        if _install_from_archive(config, db, targets, archive, dry_run):
+            console.print("[green]✓[/green] Installed from archive")
+        else:
+            console.print("[red]✗[/red] Archive install failed")
+        return
+
     # Detect or get registry path
     # If user has explicitly set registry_path in config, use it
     # Otherwise, auto-detect from current directory (don't save)
@@ -88,28 +696,32 @@ def install(component_id: str, group: str, dry_run: bool, target: str, model: st
         console.print("[dim]Tip: Set registry path with 'opencode-config config --registry /path/to/registry'[/dim]")
         return
 
-    # Check model tiers are configured (skip if user supplies --model override)
-    if not model and not dry_run:
+    # Check model tiers are configured (skip if user supplies --model override;
+    # a frozen install uses the tiers pinned in the lockfile)
+    if not model and not dry_run and not frozen:
         if not _check_model_tiers(config, db):
             return
 
     # Only save registry path if it was explicitly set by user, not auto-detected
     # This allows auto-detection to work with git worktrees
 
-    # Determine target directory
-    target_dir = Path(target) if target else config.target_dir
-    target_dir = target_dir.expanduser()
-
-    # Ensure target exists
-    if not dry_run:
-        target_dir.mkdir(parents=True, exist_ok=True)
+    # Determine target directories
+    targets = _resolve_targets(config, target, targets_file)
+    if not targets:
+        console.print(f"[red]Error:[/red] No target directories listed in {targets_file}")
+        return
 
-    # Initialize CopyManager
-    copy_manager = CopyManager(registry_path, target_dir, config)
-    install_method = "copy"
+    install_method = config.get("install_method", "copy")
 
     console.print(f"[dim]Installation method: {install_method}[/dim]")
-    console.print(f"[dim]Target directory: {target_dir}[/dim]")
+    if profiles:
+        pass  # Each profile reports its own target
+    elif len(targets) == 1:
+        console.print(f"[dim]Target directory: {targets[0]}[/dim]")
+    else:
+        console.print(f"[dim]Target directories ({len(targets)}):[/dim]")
+        for target_dir in targets:
+            console.print(f"[dim]  • {target_dir}[/dim]")
     console.print(f"[dim]Registry path: {registry_path}[/dim]")
     if model:
         console.print(f"[dim]Model override: {model}[/dim]")
@@ -118,43 +730,78 @@ def install(component_id: str, group: str, dry_run: bool, target: str, model: st
     if dry_run:
         console.print("[yellow]DRY RUN MODE - No changes will be made[/yellow]\n")
 
+    if profiles and (target or targets_file or model or frozen):
+        console.print(
+            "[red]Error:[/red] --profile sets its own targets and models; "
+            "it cannot be combined with --target, --targets-file, --model or --frozen"
+        )
+        return
+
+    if frozen:
+        if component_id or group or model:
+            console.print(
+                "[red]Error:[/red] --frozen installs exactly the lockfile; "
+                "it cannot be combined with a component, --group or --model"
+            )
+            return
+        if _install_frozen(config, db, registry_path, targets, lockfile, dry_run):
+            console.print("[green]✓[/green] Installed from lockfile")
+        else:
+            console.print("[red]✗[/red] Frozen install failed")
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     # Handle bundle installation
     if group:
-        bundle_file = registry_path / "bundles" / f"{group}.yaml"
-        if not bundle_file.exists():
-            console.print(f"[red]Error:[/red] Bundle '{group}' not found at {bundle_file}")
+        try:
+            bundle_data = read_bundle(registry_path, group)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
             return
 
-        import yaml
-
-        with open(bundle_file, "r") as f:
-            bundle_data = yaml.safe_load(f)
+        index = RegistryIndex(registry_path, config.config_file.parent / INDEX_FILENAME)
+        resolution = index.bundle_resolution(group)
+        if resolution["error"]:
+            console.print(f"[red]Error:[/red] {resolution['error']}")
+            return
+        if resolution["unknown"]:
+            unknown = ", ".join(resolution["unknown"])
+            console.print(f"[yellow]Warning:[/yellow] Not in the registry, skipped: {unknown}")
 
+        layers = resolution["layers"]
+        resolved = sorted({cid for layer in layers for cid in layer})
         components = bundle_data.get("components", [])
         console.print(f"[cyan]Installing bundle:[/cyan] {bundle_data.get('name', group)}")
         console.print(f"[dim]{bundle_data.get('description', '')}[/dim]\n")
-        console.print(f"Components: {', '.join(components)}\n")
+        console.print(f"Components: {', '.join(components)}")
+        console.print(f"[dim]Resolved to {len(resolved)} components with dependencies[/dim]\n")
 
-        # For now, install entire opencode directory
-        # TODO: Implement selective component installation
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}")
         ) as progress:
             progress.add_task(f"Installing bundle '{group}'...", total=None)
 
-            success = copy_manager.install_package("opencode", dry_run=dry_run, model_override=model)
-
-            if success and not dry_run:
-                db.set_install_method(install_method)
-                db.set_target_directory(str(target_dir))
-                db.set_registry_path(str(registry_path))
-                db.add_bundle(group, components)
-
-                # Detect and sync actual installed components
-                detected = copy_manager.detect_installed_components()
-                db.sync_from_detected(detected, install_method)
-
-                db.log_action("install", [group], install_method, "success")
+            if profiles:
+                success = _install_profiles(
+                    config, registry_path, profiles, dry_run, [group], (group, resolved), layers
+                )
+            elif len(targets) == 1:
+                success = _switch_bundle(
+                    config, db, registry_path, targets[0], dry_run, model, group, layers
+                )
+            else:
+                success = _install_to_targets(
+                    config,
+                    db,
+                    registry_path,
+                    targets,
+                    dry_run,
+                    model,
+                    [group],
+                    (group, resolved),
+                    layers=layers,
+                )
 
         # Print result after spinner has stopped
         if success:
@@ -180,37 +827,34 @@ def install(component_id: str, group: str, dry_run: bool, target: str, model: st
         return
 
     # Check if already installed
-    if db.is_installed(component_id) and not dry_run:
+    if len(targets) == 1 and not profiles and db.is_installed(component_id) and not dry_run:
         console.print(f"[yellow]Warning:[/yellow] Component '{component_id}' is already installed")
         console.print("Use 'opencode-config update' to update it")
         return
 
-    # Find component
-
-    # Search for component (simplified - installs whole opencode dir)
-    # TODO: Implement selective installation
+    # Resolve the component and everything it depends on or delegates to
+    layers = _resolve_closure(registry_path, component_id)
+    if layers is None:
+        return
 
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}")
     ) as progress:
         progress.add_task(f"Installing '{component_id}'...", total=None)
 
-        success = copy_manager.install_package("opencode", dry_run=dry_run, model_override=model)
-
-        if success and not dry_run:
-            db.set_install_method(install_method)
-            db.set_target_directory(str(target_dir))
-            db.set_registry_path(str(registry_path))
-
-            # Detect and sync actual installed components
-            detected = copy_manager.detect_installed_components()
-            db.sync_from_detected(detected, install_method)
-
-            db.log_action("install", [component_id], install_method, "success")
+        if profiles:
+            success = _install_profiles(
+                config, registry_path, profiles, dry_run, [component_id], layers=layers
+            )
+        else:
+            success = _install_to_targets(
+                config, db, registry_path, targets, dry_run, model, [component_id], layers=layers
+            )
 
     # Print result after spinner has stopped
     if success:
         console.print(f"[green]✓[/green] Component '{component_id}' installed successfully!")
-        console.print(f"[dim]Installed to: {target_dir}[/dim]")
+        for target_dir in targets:
+            console.print(f"[dim]Installed to: {target_dir}[/dim]")
     else:
         console.print(f"[red]✗[/red] Failed to install component '{component_id}'")
@@ -0,0 +1,60 @@
+"""
+Lint the registry.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+from rich.console import Console
+from ..config import Config
+from ..utils.lint import LINT_CACHE_FILENAME, Linter
+
+console = Console()
+
+
+@click.command()
+@click.argument("registry", required=False, type=click.Path(exists=True, file_okay=False))
+@click.option("--strict", is_flag=True, help="Fail on warnings as well as errors")
+@click.option(
+    "--no-cache", is_flag=True, help="Re-check every file instead of using cached results"
+)
+def lint(registry: Optional[str], strict: bool, no_cache: bool):
+    """Check registry components, references and bundles for problems.
+
+    Every component and shared file is checked in parallel: frontmatter,
+    model_tier values, tier placeholders, versions, subagent and shared-file
+    references, dependencies, duplicate IDs and bundle contents. Results are
+    cached per file content, so re-linting after a small change only checks
+    what changed. Exits non-zero on errors (and on warnings with --strict),
+    so it can run as a pre-commit hook.
+
+    REGISTRY defaults to the configured or detected registry.
+    """
+    config = Config()
+    registry_path = Path(registry) if registry else None
+    registry_path = registry_path or config.registry_path or config.detect_registry_path()
+
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry.")
+        sys.exit(2)
+
+    cache_path = None if no_cache else config.config_file.parent / LINT_CACHE_FILENAME
+    report = Linter(registry_path.resolve(), cache_path).run()
+
+    styles = {"error": "red", "warning": "yellow"}
+    for issue in report.issues:
+        style = styles[issue.severity]
+        console.print(f"[{style}]{issue.severity}[/{style}] {issue.path}: {issue.message}")
+
+    if report.issues:
+        console.print()
+    summary = f"{report.checked} files checked ({report.cached} cached)"
+    console.print(
+        f"[dim]{summary}: {len(report.errors)} error(s), {len(report.warnings)} warning(s)[/dim]"
+    )
+
+    if report.errors or (strict and report.warnings):
+        sys.exit(1)
+    console.print("[green]✓[/green] Registry is clean")
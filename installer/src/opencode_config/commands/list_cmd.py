@@ -5,8 +5,7 @@ List available components.
 import click
 from rich.console import Console
 from rich.table import Table
-from ..config import Config
-from ..utils.manifest import ManifestParser
+from ..utils.daemon import load_catalog, load_config, load_installed_db
 
 console = Console()
 
@@ -17,10 +16,8 @@ console = Console()
 @click.option("--installed", "-i", is_flag=True, help="Show only installed components")
 def list_components(type: str, tag: str, installed: bool):
     """List all available components in the registry."""
-    from ..utils.installed_db import InstalledDB
-
-    config = Config()
-    db = InstalledDB()
+    config = load_config()
+    db = load_installed_db()
 
     # Detect or get registry path
     registry_path = config.registry_path or config.detect_registry_path()
@@ -36,49 +33,9 @@ def list_components(type: str, tag: str, installed: bool):
         console.print(f"[red]Error:[/red] Registry directory not found: {opencode_dir}")
         return
 
-    # Collect components
-    components = []
-
-    # Agents
-    agent_dir = opencode_dir / "agents"
-    if agent_dir.exists():
-        for md_file in agent_dir.glob("*.md"):
-            manifest = ManifestParser.create_from_md(md_file, "agent")
-            if not type or manifest.type == type:
-                if not tag or tag in manifest.tags:
-                    components.append(manifest)
-
-    # Subagents
-    subagent_dir = opencode_dir / "agents" / "subagents"
-    if subagent_dir.exists():
-        for category_dir in subagent_dir.iterdir():
-            if category_dir.is_dir():
-                for md_file in category_dir.glob("*.md"):
-                    manifest = ManifestParser.create_from_md(md_file, "subagent")
-                    if not type or manifest.type == type:
-                        if not tag or tag in manifest.tags:
-                            components.append(manifest)
-
-    # Skills
-    skill_dir = opencode_dir / "skills"
-    if skill_dir.exists():
-        for skill_folder in skill_dir.iterdir():
-            if skill_folder.is_dir():
-                skill_md = skill_folder / "SKILL.md"
-                if skill_md.exists():
-                    manifest = ManifestParser.create_from_md(skill_md, "skill")
-                    if not type or manifest.type == type:
-                        if not tag or tag in manifest.tags:
-                            components.append(manifest)
-
-    # Commands
-    command_dir = opencode_dir / "commands"
-    if command_dir.exists():
-        for md_file in command_dir.glob("*.md"):
-            manifest = ManifestParser.create_from_md(md_file, "command")
-            if not type or manifest.type == type:
-                if not tag or tag in manifest.tags:
-                    components.append(manifest)
+    # Collect components (served from memory when the daemon is running)
+    catalog = load_catalog(registry_path)
+    components = [entry.manifest for entry in catalog.filter(type, tag)]
 
     # Display results
     if not components:
@@ -0,0 +1,55 @@
+"""
+Write a lockfile for reproducible installs.
+"""
+
+import click
+from pathlib import Path
+from rich.console import Console
+from ..config import Config
+from ..utils.lockfile import LOCK_FILENAME, build_lock, write_lock
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help=f"Lockfile path (default: <registry>/{LOCK_FILENAME})",
+)
+@click.option("--model", "-m", help="Pin this model for every component instead of the tiers")
+def lock(output: str, model: str):
+    """Write a lockfile pinning versions, file hashes and models.
+
+    The lockfile records every component's version and files, the hash of
+    each registry file and of its rendered output, and the model resolved for
+    each tier. 'opencode-config install --frozen' installs exactly that.
+    """
+    config = Config()
+    registry_path = config.registry_path or config.detect_registry_path()
+
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry. Run from registry directory.")
+        return
+
+    missing = [tier for tier, value in config.list_model_tiers().items() if not value]
+    if missing and not model:
+        console.print(f"[red]Error:[/red] Model tiers not configured: {', '.join(missing)}")
+        console.print("[dim]Run 'opencode-config models --wizard' first[/dim]")
+        return
+
+    try:
+        lock_data = build_lock(registry_path, config, model_override=model)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    lock_path = Path(output).expanduser() if output else registry_path / LOCK_FILENAME
+    write_lock(lock_data, lock_path)
+
+    component_count = sum(len(records) for records in lock_data["components"].values())
+    console.print(
+        f"[green]✓[/green] Locked {component_count} components "
+        f"({len(lock_data['files'])} files) to {lock_path}"
+    )
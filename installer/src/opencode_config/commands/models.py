@@ -2,11 +2,18 @@
 Manage model tier configuration.
 """
 
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
 from ..config import Config
+from ..utils.catalog import component_for_path
+from ..utils.completion import complete_tiers
+from ..utils.copy import CopyManager
+from ..utils.installed_db import InstalledDB
+from ..utils.verify import record_files, verify_files
 
 console = Console()
 
@@ -20,10 +27,28 @@ console = Console()
     type=str,
     metavar="TIER MODEL",
     help="Set tier model (e.g., --set high 'github-copilot/claude-sonnet-4.5')",
+    shell_complete=complete_tiers,
 )
 @click.option("--wizard", "-w", is_flag=True, help="Interactive tier configuration wizard")
 @click.option("--reset", is_flag=True, help="Reset to default tier configuration")
-def models(list_tiers: bool, set_tier: tuple, wizard: bool, reset: bool):
+@click.option(
+    "--profile",
+    "-p",
+    help="Apply --set/--list to a named profile (e.g., cheap, premium)",
+)
+@click.option(
+    "--rerender/--no-rerender",
+    default=None,
+    help="Re-render installed files using a changed tier (asks by default)",
+)
+def models(
+    list_tiers: bool,
+    set_tier: tuple,
+    wizard: bool,
+    reset: bool,
+    profile: Optional[str],
+    rerender: Optional[bool],
+):
     """
     Manage model tier configuration.
 
@@ -36,21 +61,31 @@ def models(list_tiers: bool, set_tier: tuple, wizard: bool, reset: bool):
     Examples:
       opencode-config models --list
       opencode-config models --set high "github-copilot/claude-sonnet-4.5"
+      opencode-config models --set high "github-copilot/claude-sonnet-4.5" --rerender
       opencode-config models --wizard
       opencode-config models --reset
+      opencode-config models --profile cheap --set high "github-copilot/gpt-4o-mini"
     """
     cfg = Config()
 
     # Handle list
     if list_tiers:
+        if profile:
+            try:
+                _display_tiers(cfg.profile_config(profile), f"Model Tiers (profile: {profile})")
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] {e}")
+            return
         _display_tiers(cfg)
+        if cfg.list_profiles():
+            console.print(f"[dim]Profiles: {', '.join(sorted(cfg.list_profiles()))}[/dim]")
         return
 
     # Handle reset
     if reset:
-        if Confirm.ask("[yellow]Reset all tiers to defaults (clears configuration)?[/yellow]"):
-            from ..config import DEFAULT_CONFIG
+        from rich.prompt import Confirm
 
+        if Confirm.ask("[yellow]Reset all tiers to defaults (clears configuration)?[/yellow]"):
             for tier in ["high", "medium", "low", "free"]:
                 cfg.set_model_tier(tier, None)
             console.print("[green]✓[/green] Model tiers cleared")
@@ -68,13 +103,28 @@ def models(list_tiers: bool, set_tier: tuple, wizard: bool, reset: bool):
             )
             return
 
+        if profile:
+            cfg.set_profile_tier(profile, tier_name, model)
+            console.print(
+                f"[green]✓[/green] Set [cyan]{tier_name}[/cyan] tier of profile "
+                f"[cyan]{profile}[/cyan] to: {model}"
+            )
+            return
+
+        previous = cfg.get_model_for_tier(tier_name)
         cfg.set_model_tier(tier_name, model)
         console.print(f"[green]✓[/green] Set [cyan]{tier_name}[/cyan] tier to: {model}")
+        if previous != model or rerender:
+            _rerender_tiers(cfg, [tier_name], rerender)
         return
 
     # Handle wizard
     if wizard:
+        previous = dict(cfg.list_model_tiers())
         run_wizard(cfg)
+        changed = [t for t in previous if cfg.get_model_for_tier(t) != previous[t]]
+        if changed:
+            _rerender_tiers(cfg, changed, rerender)
         return
 
     # No action specified
@@ -85,9 +135,76 @@ def models(list_tiers: bool, set_tier: tuple, wizard: bool, reset: bool):
     console.print('  opencode-config models --set high "your-model"')
 
 
-def _display_tiers(cfg: Config):
+def _rerender_tiers(cfg: Config, tiers: List[str], rerender: Optional[bool]):
+    """
+    Re-render the installed files whose model was resolved through the given tiers.
+
+    Uses the tier → files index recorded at install time, so only the
+    affected files are rendered and written.
+
+    Args:
+        cfg: Config with the new tier models
+        tiers: Changed tier names
+        rerender: True to re-render, False to skip, None to ask
+    """
+    db = InstalledDB()
+    files = db.get_files_for_tiers(tiers)
+    if not files:
+        return
+
+    tier_list = ", ".join(tiers)
+    if rerender is None:
+        if not sys.stdin.isatty():
+            console.print(
+                f"[dim]{len(files)} installed file(s) use the {tier_list} tier. "
+                "Re-render them with --rerender.[/dim]"
+            )
+            return
+        from rich.prompt import Confirm
+
+        rerender = Confirm.ask(
+            f"Re-render {len(files)} installed file(s) that use the {tier_list} tier?",
+            default=True,
+        )
+    if not rerender:
+        return
+
+    registry = db.data.get("registry", {}).get("path")
+    registry_path = Path(registry) if registry else cfg.registry_path or cfg.detect_registry_path()
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry to re-render from")
+        return
+
+    target_dir = Path(db.data.get("targetDirectory") or cfg.target_dir).expanduser()
+    copy_manager = CopyManager(registry_path, target_dir, cfg)
+    # Files edited since they were installed are kept, as update does without --force
+    records = db.get_file_records()
+    if records:
+        copy_manager.modified_files = set(
+            verify_files(target_dir, records, find_extra=False).modified
+        )
+    written = copy_manager.rerender_files(files, db.get_model_override())
+
+    rel_paths = [path.as_posix() for path in written]
+    file_tiers: Dict[str, List[str]] = {rel: [] for rel in rel_paths}
+    for tier, paths in copy_manager.tier_index.items():
+        for rel in paths:
+            file_tiers.setdefault(rel, []).append(tier)
+    with db.batch():
+        db.update_tier_index(file_tiers)
+        db.set_file_records({**records, **record_files(target_dir, rel_paths)})
+
+    owners = {component_for_path(path) for path in written}
+    components = sorted(owner[1] for owner in owners if owner)
+    db.log_action("rerender", components, db.data.get("installMethod", "copy"), "success")
+    console.print(f"[green]✓[/green] Re-rendered {len(written)} file(s) in {target_dir}")
+
+
+def _display_tiers(cfg: Config, title: str = "Model Tier Configuration"):
     """Display current tier configuration."""
-    table = Table(title="Model Tier Configuration")
+    from rich.table import Table
+
+    table = Table(title=title)
     table.add_column("Tier", style="cyan", width=10)
     table.add_column("Use Case", style="dim")
     table.add_column("Model", style="green")
@@ -114,6 +231,9 @@ def run_wizard(cfg: Config):
 
     Public so other commands (e.g. install) can invoke it directly.
     """
+    from rich.prompt import Confirm, Prompt
+    from rich.table import Table
+
     console.print("\n[bold cyan]Model Tier Configuration Wizard[/bold cyan]\n")
     console.print(
         "Configure models for each complexity tier. Press Enter to keep current value.\n"
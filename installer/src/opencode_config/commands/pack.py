@@ -0,0 +1,63 @@
+"""
+Package a rendered installation as an archive.
+"""
+
+import click
+from pathlib import Path
+from rich.console import Console
+from ..config import Config
+from ..utils.archive import pack as pack_archive
+
+console = Console()
+
+
+@click.command()
+@click.option("--profile", "-p", help="Render with this tier profile")
+@click.option("--model", "-m", help="Pin this model for every component instead of the tiers")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Archive path; .tar.gz, .tar.xz or .tar.zst (default: opencode-<profile>.tar.gz)",
+)
+def pack(profile: str, model: str, output: str):
+    """Write a pre-rendered archive for installing without a registry.
+
+    The archive holds the rendered files and a manifest with component
+    versions and file hashes. Install it with
+    'opencode-config install --from-archive <archive>'.
+    """
+    config = Config()
+    registry_path = config.registry_path or config.detect_registry_path()
+
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry. Run from registry directory.")
+        return
+
+    if profile:
+        try:
+            config = config.profile_config(profile)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            return
+
+    missing = [tier for tier, value in config.list_model_tiers().items() if not value]
+    if missing and not model:
+        console.print(f"[red]Error:[/red] Model tiers not configured: {', '.join(missing)}")
+        console.print("[dim]Run 'opencode-config models --wizard' first[/dim]")
+        return
+
+    output_path = Path(output or f"opencode-{profile or 'default'}.tar.gz").expanduser()
+    try:
+        manifest = pack_archive(
+            registry_path, config, output_path, model_override=model, profile=profile
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    component_count = sum(len(records) for records in manifest["components"].values())
+    console.print(
+        f"[green]✓[/green] Packed {component_count} components "
+        f"({len(manifest['files'])} files) to {output_path}"
+    )
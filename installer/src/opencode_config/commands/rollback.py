@@ -0,0 +1,71 @@
+"""
+Roll back to an earlier install generation.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import click
+from rich.console import Console
+from ..config import Config
+from ..utils.copy import CopyManager
+from ..utils.generations import Generations
+from ..utils.installed_db import InstalledDB
+
+console = Console()
+
+
+@click.command()
+@click.option("--list", "-l", "list_generations", is_flag=True, help="List kept generations")
+@click.option("--to", "number", type=int, help="Generation to activate (default: the previous one)")
+def rollback(list_generations: bool, number: Optional[int]):
+    """Switch the installation back to an earlier generation.
+
+    With generations enabled (opencode-config config --generations N), every
+    install and update is written into a new generation and activated by
+    swapping one symlink. Rolling back swaps it to an older generation, so it
+    takes the same time however many files are installed.
+    """
+    config = Config()
+    generations = Generations(config.target_dir)
+    current = generations.current()
+
+    if list_generations:
+        numbers = generations.list()
+        if not numbers:
+            console.print("[yellow]No generations kept[/yellow]")
+            console.print("[dim]Enable with: opencode-config config --generations 3[/dim]")
+            return
+        for n in reversed(numbers):
+            created = datetime.fromtimestamp(generations.path(n).stat().st_mtime)
+            marker = "[green]*[/green]" if n == current else " "
+            console.print(f"{marker} {n:>4}  [dim]{created:%Y-%m-%d %H:%M:%S}[/dim]")
+        return
+
+    if number is None:
+        number = generations.previous()
+        if number is None:
+            console.print("[yellow]No earlier generation to roll back to[/yellow]")
+            return
+    if number == current:
+        console.print(f"[green]✓[/green] Generation {number} is already active")
+        return
+
+    try:
+        generations.activate(number)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    db = InstalledDB()
+    copy_manager = CopyManager(Path(), config.target_dir, config)
+    saved = generations.load_db(number)
+    if saved is not None:
+        db.restore(saved)
+    else:
+        detected = copy_manager.detect_installed_components(use_snapshot=False)
+        db.sync_from_detected(detected, copy_manager.install_method)
+    db.log_action("rollback", [f"generation-{number}"], copy_manager.install_method, "success")
+
+    console.print(f"[green]✓[/green] Rolled back from generation {current} to {number}")
@@ -0,0 +1,67 @@
+"""
+Run the resident catalog daemon.
+"""
+
+import signal
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+from ..utils import daemon
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_file",
+    type=click.Path(dir_okay=False),
+    help="Socket path (default: ~/.config/opencode/opencode-registry.sock)",
+)
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+@click.option("--status", "show_status", is_flag=True, help="Check whether the daemon is running")
+def serve(socket_file: str, stop: bool, show_status: bool):
+    """Run a daemon that answers CLI queries from memory.
+
+    While the daemon runs, list, info and status read the catalog, the
+    installation database and the configuration from it instead of loading
+    them from disk. Without a daemon they fall back to in-process loading.
+    """
+    path = Path(socket_file).expanduser() if socket_file else daemon.socket_path()
+
+    if show_status:
+        result = daemon.request("ping", path=path)
+        if result is None:
+            console.print(f"[yellow]Daemon is not running[/yellow] [dim]({path})[/dim]")
+        else:
+            console.print(f"[green]✓[/green] Daemon running (pid {result['pid']}) on {path}")
+        return
+
+    if stop:
+        if daemon.request("shutdown", path=path) is None:
+            console.print(f"[yellow]Daemon is not running[/yellow] [dim]({path})[/dim]")
+        else:
+            console.print("[green]✓[/green] Daemon stopped")
+        return
+
+    try:
+        server = daemon.DaemonServer(path)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    # Let SIGTERM run the cleanup that removes the socket file
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    console.print(f"[green]✓[/green] Serving on {path}")
+    if socket_file:
+        console.print(f"[dim]Clients need {daemon.SOCKET_ENV}={path} to find this daemon[/dim]")
+    console.print("[dim]Stop with Ctrl+C or 'opencode-config serve --stop'[/dim]")
+
+    try:
+        server.serve_until_shutdown()
+    except KeyboardInterrupt:
+        pass
+    console.print("[dim]Daemon stopped[/dim]")
@@ -3,21 +3,26 @@ Show installation status.
 """
 
 import click
+from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from ..config import Config
-from ..utils.installed_db import InstalledDB
+from ..utils.daemon import load_config, load_installed_db
 
 console = Console()
 
 
 @click.command()
 @click.option("--details", "-d", is_flag=True, help="Show detailed information")
-def status(details: bool):
+@click.option("--verify", is_flag=True, help="Check installed files for local modifications")
+def status(details: bool, verify: bool):
     """Show installation status and installed components."""
-    config = Config()
-    db = InstalledDB()
+    config = load_config()
+    db = load_installed_db()
+
+    if verify:
+        _verify(db, Path(db.data.get("targetDirectory") or config.target_dir).expanduser())
+        return
 
     # Display system info
     info_text = (
@@ -84,3 +89,37 @@ def status(details: bool):
 
     console.print("\n[dim]Use 'opencode-config models --list' to configure model tiers[/dim]")
     console.print("[dim]Use 'opencode-config list' to see available components[/dim]")
+
+
+def _verify(db, target_dir: Path):
+    """Report installed files that were modified, deleted or added since install."""
+    from ..utils.verify import verify_files
+
+    records = db.get_file_records()
+    if not records:
+        console.print("[yellow]No file records found.[/yellow]")
+        console.print("[dim]Run 'opencode-config update --all' to record installed files[/dim]")
+        return
+
+    report = verify_files(target_dir, records)
+    console.print(
+        f"Verified {len(records)} files in {target_dir}: "
+        f"{len(report.unchanged)} unchanged, {len(report.modified)} modified, "
+        f"{len(report.missing)} missing, {len(report.extra)} extra\n"
+    )
+
+    for label, style, paths in [
+        ("Modified", "yellow", report.modified),
+        ("Missing", "red", report.missing),
+        ("Extra", "dim", report.extra),
+    ]:
+        if paths:
+            console.print(f"[{style}]{label} ({len(paths)}):[/{style}]")
+            for rel in paths:
+                console.print(f"  • {rel}")
+            console.print()
+
+    if report.clean:
+        console.print("[green]✓[/green] All installed files match what was installed")
+    else:
+        console.print("[dim]Run 'opencode-config update --all --force' to restore them[/dim]")
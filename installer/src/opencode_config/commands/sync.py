@@ -4,7 +4,6 @@ Sync database with actual installed components.
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..config import Config
 from ..utils.copy import CopyManager
 from ..utils.installed_db import InstalledDB
@@ -34,6 +33,8 @@ def sync(dry_run: bool):
 
     console.print(f"[dim]Scanning installed components in {target_dir}...[/dim]\n")
 
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     # Initialize CopyManager and detect components
     copy_manager = CopyManager(registry_path, target_dir, config)
 
@@ -58,12 +59,27 @@ def sync(dry_run: bool):
     console.print(f"  • Commands: {total_commands}")
     console.print(f"  [bold]Total: {total_components}[/bold]\n")
 
+    # Sync database (only the differences are written)
+    delta = db.sync_from_detected(detected, copy_manager.install_method, dry_run=dry_run)
+
+    console.print(
+        "[bold]Database Changes:[/bold]" if not dry_run else "[bold]Pending Changes:[/bold]"
+    )
+    console.print(f"  • Added: {len(delta['added'])}")
+    console.print(f"  • Removed: {len(delta['removed'])}")
+    console.print(f"  • Updated: {len(delta['updated'])}")
+    console.print(f"  • Unchanged: {len(delta['unchanged'])}\n")
+
+    for comp_id in delta["added"]:
+        console.print(f"  [green]+[/green] {comp_id}")
+    for comp_id in delta["removed"]:
+        console.print(f"  [red]-[/red] {comp_id}")
+    if delta["added"] or delta["removed"]:
+        console.print()
+
     if dry_run:
-        console.print("[yellow]DRY RUN:[/yellow] Database would be updated with these components")
+        console.print("[yellow]DRY RUN:[/yellow] Database was not modified")
         return
 
-    # Sync database
-    db.sync_from_detected(detected, "copy")
-
     console.print("[green]✓[/green] Database synced successfully!")
     console.print("\n[dim]Use 'opencode-config status' to view installation details[/dim]")
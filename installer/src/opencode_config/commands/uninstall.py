@@ -3,18 +3,48 @@ Uninstall components.
 """
 
 import click
+from pathlib import Path
+from typing import List
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..config import Config
+from ..utils.bundles import component_files
+from ..utils.completion import complete_bundles, complete_installed_ids
 from ..utils.copy import CopyManager
 from ..utils.installed_db import InstalledDB
 
 console = Console()
 
 
+def _uninstall_component(
+    db: InstalledDB, copy_manager: CopyManager, component_id: str, dry_run: bool
+) -> List[Path]:
+    """
+    Remove the files of every installed component with an ID and drop them from the database.
+
+    Returns:
+        Paths removed (or that would be, in dry-run mode)
+    """
+    removed = []
+    for comp_type, files in component_files(db, copy_manager, component_id).items():
+        removed.extend(copy_manager.remove_files(files, dry_run=dry_run))
+        if not dry_run:
+            db.remove_component(comp_type, component_id)
+    return removed
+
+
+def _report_removed(removed: List[Path], dry_run: bool):
+    """Print the files removed by an uninstall."""
+    if dry_run:
+        for rel_path in removed:
+            console.print(f"[yellow]Would remove:[/yellow] {rel_path}")
+        console.print(f"\n[dim]Would remove {len(removed)} files[/dim]")
+    else:
+        console.print(f"[dim]Removed {len(removed)} files[/dim]")
+
+
 @click.command()
-@click.argument("component_id", required=False)
-@click.option("--group", "-g", help="Uninstall a bundle/group")
+@click.argument("component_id", required=False, shell_complete=complete_installed_ids)
+@click.option("--group", "-g", help="Uninstall a bundle/group", shell_complete=complete_bundles)
 @click.option("--all", "-a", "uninstall_all", is_flag=True, help="Uninstall everything")
 @click.option("--dry-run", "-n", is_flag=True, help="Preview changes without uninstalling")
 def uninstall(component_id: str, group: str, uninstall_all: bool, dry_run: bool):
@@ -41,6 +71,8 @@ def uninstall(component_id: str, group: str, uninstall_all: bool, dry_run: bool)
     if dry_run:
         console.print("[yellow]DRY RUN MODE - No changes will be made[/yellow]\n")
 
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     # Handle uninstall all
     if uninstall_all:
         console.print("[yellow]⚠ Warning:[/yellow] This will uninstall ALL registry components")
@@ -66,7 +98,10 @@ def uninstall(component_id: str, group: str, uninstall_all: bool, dry_run: bool)
                     "commands": {},
                 }
                 db.data["bundles"] = {}
-                db.log_action("uninstall", ["all"], "copy", "success")
+                # Nothing is installed, so no file has a record, tier or shared owner
+                for key in ("fileRecords", "tierIndex", "sharedFiles"):
+                    db.data.pop(key, None)
+                db.log_action("uninstall", ["all"], copy_manager.install_method, "success")
                 db.save()
 
         if success:
@@ -78,44 +113,76 @@ def uninstall(component_id: str, group: str, uninstall_all: bool, dry_run: bool)
 
     # Handle bundle uninstall
     if group:
-        bundle_file = registry_path / "bundles" / f"{group}.yaml"
-        if not bundle_file.exists():
-            console.print(f"[red]Error:[/red] Bundle '{group}' not found")
-            return
+        bundle = db.data["bundles"].get(group)
+        if bundle is not None:
+            components = bundle.get("components", [])
+        else:
+            bundle_file = registry_path / "bundles" / f"{group}.yaml"
+            if not bundle_file.exists():
+                console.print(f"[red]Error:[/red] Bundle '{group}' not found")
+                return
 
-        console.print(
-            "[yellow]Note:[/yellow] Uninstalling a bundle will uninstall ALL registry components"
-        )
-        console.print("[dim]Individual component uninstall not yet supported[/dim]\n")
+            import yaml
+
+            with open(bundle_file, "r") as f:
+                components = (yaml.safe_load(f) or {}).get("components", [])
+
+        # Components another installed bundle still lists stay installed
+        still_needed = {
+            cid
+            for name, other in db.data["bundles"].items()
+            if name != group
+            for cid in other.get("components", [])
+        }
+        to_remove = [
+            cid for cid in components if cid not in still_needed and db.get_component_type(cid)
+        ]
+        kept = [cid for cid in components if cid in still_needed]
+        if kept:
+            console.print(f"[dim]Kept (used by other bundles): {', '.join(kept)}[/dim]\n")
 
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}")
         ) as progress:
             progress.add_task(f"Uninstalling bundle '{group}'...", total=None)
 
-            success = copy_manager.uninstall_package("opencode", dry_run=dry_run)
+            removed = []
+            for cid in to_remove:
+                removed.extend(_uninstall_component(db, copy_manager, cid, dry_run))
 
-            if success and not dry_run:
+            if not dry_run:
                 db.data["bundles"].pop(group, None)
-                db.log_action("uninstall", [group], "copy", "success")
+                db.log_action("uninstall", [group], copy_manager.install_method, "success")
                 db.save()
 
-        if success:
-            console.print(f"[green]✓[/green] Bundle '{group}' uninstalled successfully!")
-        else:
-            console.print(f"[red]✗[/red] Failed to uninstall bundle '{group}'")
-
+        _report_removed(removed, dry_run)
+        console.print(
+            f"[green]✓[/green] Bundle '{group}' uninstalled successfully! "
+            f"({len(to_remove)} components)"
+        )
         return
 
     # Handle single component uninstall
     if component_id:
-        console.print("[yellow]Note:[/yellow] Individual component uninstall not yet supported")
-        console.print("[dim]This would uninstall ALL registry components[/dim]\n")
-        console.print("Use 'opencode-config uninstall --all' to uninstall everything")
+        if not db.get_component_type(component_id):
+            console.print(f"[red]Error:[/red] Component '{component_id}' is not installed")
+            return
+
+        with Progress(
+            SpinnerColumn(), TextColumn("[progress.description]{task.description}")
+        ) as progress:
+            progress.add_task(f"Uninstalling '{component_id}'...", total=None)
+
+            removed = _uninstall_component(db, copy_manager, component_id, dry_run)
+            if not dry_run:
+                db.log_action("uninstall", [component_id], copy_manager.install_method, "success")
+
+        _report_removed(removed, dry_run)
+        console.print(f"[green]✓[/green] Component '{component_id}' uninstalled successfully!")
         return
 
     # No arguments provided
     console.print("[red]Error:[/red] Please specify what to uninstall:")
     console.print("  opencode-config uninstall --all          # Uninstall everything")
     console.print("  opencode-config uninstall --group basic  # Uninstall a bundle")
-    console.print("  opencode-config uninstall <component>    # (Not yet supported)")
+    console.print("  opencode-config uninstall <component>    # Uninstall one component")
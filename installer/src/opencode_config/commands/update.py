@@ -4,28 +4,59 @@ Update installed components.
 
 import click
 from pathlib import Path
+from typing import Any, Dict, List, Set
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..config import Config
+from ..utils.catalog import component_for_path
+from ..utils.completion import complete_installed_ids
 from ..utils.copy import CopyManager
+from ..utils.daemon import load_catalog
+from ..utils.generations import Generations, install_generation
 from ..utils.installed_db import InstalledDB
-from ..utils.manifest import ManifestParser
-from ..utils.version import is_newer_version
+from ..utils.verify import record_files, verify_files
+from ..utils.updates import plan_updates
 
 console = Console()
 
 
+def _recorded_files(
+    db: InstalledDB, copy_manager: CopyManager, installed: List[Dict[str, Any]]
+) -> Set[str]:
+    """
+    Get the files recorded for installed components, plus the shared files.
+
+    Components recorded before file ownership was tracked fall back to their
+    files in the registry.
+    """
+    files = set(db.data.get("sharedFiles", []))
+    unrecorded = set()
+    for record in installed:
+        if record.get("files") is None:
+            unrecorded.add(record["id"])
+        else:
+            files.update(record["files"])
+    if unrecorded:
+        files.update(
+            rel.as_posix()
+            for _, rel in copy_manager.collect_package_files("opencode", unrecorded)
+            if component_for_path(rel)
+        )
+    return files
+
+
 @click.command()
-@click.argument("component_id", required=False)
+@click.argument("component_id", required=False, shell_complete=complete_installed_ids)
 @click.option("--all", "-a", is_flag=True, help="Update all installed components")
 @click.option(
     "--dry-run", "-n", is_flag=True, help="Show what would be updated without making changes"
 )
-def update(component_id: str, all: bool, dry_run: bool):
+@click.option("--force", "-f", is_flag=True, help="Overwrite files that were modified locally")
+def update(component_id: str, all: bool, dry_run: bool, force: bool):
     """Update installed components to latest available versions.
 
     Re-copies files from registry and re-applies model tier configuration.
+    Installed files edited since they were written are kept unless --force
+    is given.
 
     COMPONENT_ID is the unique identifier for the component to update.
     """
@@ -39,8 +70,6 @@ def update(component_id: str, all: bool, dry_run: bool):
         console.print("[red]Error:[/red] Could not find registry.")
         return
 
-    opencode_dir = registry_path / "opencode"
-
     # If no arguments, show help
     if not component_id and not all:
         console.print("[red]Error:[/red] Please specify a component ID or use --all\n")
@@ -77,79 +106,41 @@ def update(component_id: str, all: bool, dry_run: bool):
 
     # Build set of component IDs actually present on disk
     on_disk = set()
-    for comp_type, comp_ids in detected.items():
+    for comp_ids in detected.values():
         on_disk.update(comp_ids)
 
-    # Check for missing components (in DB but not on disk)
-    missing_components = []
-    for component in installed:
-        comp_id = component["id"]
-        if comp_id not in on_disk:
-            missing_components.append(
-                {
-                    "id": comp_id,
-                    "type": component["type"],
-                    "reason": "missing from disk",
-                }
-            )
-
-    # Check for version updates
-    updates_available = []
-
-    for component in installed:
-        comp_id = component["id"]
-        comp_type = component["type"]
-        installed_version = component.get("version", "unknown")
-
-        # Find component in registry and get available version
-        available_version = None
-        manifest = None
-
-        if comp_type == "agent":
-            agent_file = opencode_dir / "agents" / f"{comp_id}.md"
-            if agent_file.exists():
-                manifest = ManifestParser.create_from_md(agent_file, "agent")
-                available_version = manifest.version
-
-        elif comp_type == "subagent":
-            subagent_dir = opencode_dir / "agents" / "subagents"
-            for category_dir in subagent_dir.glob("*/"):
-                subagent_file = category_dir / f"{comp_id}.md"
-                if subagent_file.exists():
-                    manifest = ManifestParser.create_from_md(subagent_file, "subagent")
-                    available_version = manifest.version
-                    break
-
-        elif comp_type == "skill":
-            skill_file = opencode_dir / "skills" / comp_id / "SKILL.md"
-            if skill_file.exists():
-                manifest = ManifestParser.create_from_md(skill_file, "skill")
-                available_version = manifest.version
-
-        elif comp_type == "command":
-            command_file = opencode_dir / "commands" / f"{comp_id}.md"
-            if command_file.exists():
-                manifest = ManifestParser.create_from_md(command_file, "command")
-                available_version = manifest.version
-
-        # Check if update available
-        if available_version and installed_version != "unknown":
-            try:
-                if is_newer_version(available_version, installed_version):
-                    updates_available.append(
-                        {
-                            "id": comp_id,
-                            "type": comp_type,
-                            "installed": installed_version,
-                            "available": available_version,
-                        }
-                    )
-            except Exception:
-                pass
+    # Check installed files against the records of what was last written
+    records = db.get_file_records()
+    modified = verify_files(target_dir, records, find_extra=False).modified if records else []
+
+    plan = plan_updates(load_catalog(registry_path), installed, on_disk)
+    missing_components = plan.missing
+    updates_available = plan.updates
 
     # Display results
-    total_changes = len(missing_components) + len(updates_available)
-    
+    total_changes = plan.changes
+    if force:
+        total_changes += len(modified)
+
+    if modified:
+        action = "will be overwritten" if force else "will be kept (use --force to overwrite)"
+        console.print(f"[yellow]Locally Modified Files ({len(modified)}) {action}:[/yellow]")
+        for rel in modified:
+            console.print(f"  • {rel}")
+        console.print()
+
+    if plan.invalid:
+        console.print(f"[yellow]Unreadable Versions ({len(plan.invalid)}):[/yellow]")
+        for message in plan.invalid:
+            console.print(f"  • {message}")
+        console.print()
+
+    if plan.orphans:
+        console.print(f"[yellow]No Longer in Registry ({len(plan.orphans)}):[/yellow]")
+        for o in plan.orphans:
+            console.print(f"  • {o.id} ([dim]{o.type}[/dim])")
+        console.print()
+
     if total_changes == 0:
         console.print("[green]✓[/green] All components are up to date and present!")
         return
@@ -158,11 +149,13 @@ def update(component_id: str, all: bool, dry_run: bool):
     if missing_components:
         console.print(f"[yellow]Missing Components ({len(missing_components)}):[/yellow]")
         for m in missing_components:
-            console.print(f"  • {m['id']} ([dim]{m['type']}[/dim]) - {m['reason']}")
+            console.print(f"  • {m.id} ([dim]{m.type}[/dim]) - missing from disk")
         console.print()
 
     # Show version updates
     if updates_available:
+        from rich.table import Table
+
         table = Table(title=f"Version Updates Available ({len(updates_available)})")
         table.add_column("Component", style="cyan")
         table.add_column("Type", style="magenta")
@@ -170,7 +163,7 @@ def update(component_id: str, all: bool, dry_run: bool):
         table.add_column("Available", style="green")
 
         for u in updates_available:
-            table.add_row(u["id"], u["type"], u["installed"], u["available"])
+            table.add_row(u.id, u.type, u.installed, u.available)
 
         console.print(table)
         console.print()
@@ -185,58 +178,74 @@ def update(component_id: str, all: bool, dry_run: bool):
         "[dim]Model tiers will be re-applied from current configuration[/dim]\n"
     )
 
-    target_dir = Path(config.target_dir).expanduser()
-    copy_manager = CopyManager(registry_path, target_dir, config)
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if not force:
+        copy_manager.modified_files = set(modified)
 
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}")
     ) as progress:
         progress.add_task("Updating...", total=None)
 
-        # Uninstall then reinstall to pick up registry changes + re-apply model tiers
-        copy_manager.uninstall_package("opencode", dry_run=False)
-        success = copy_manager.install_package("opencode", dry_run=False)
+        # Re-render only the components being updated (and shared files), removing
+        # their recorded files first so files dropped from the registry go away.
+        # Components no longer in the registry cannot be reinstalled and are left as they are
+        orphans = {(o.type, o.id) for o in plan.orphans}
+        current = [c for c in installed if (c["type"], c["id"]) not in orphans]
+        components = {c["id"] for c in current}
+        recorded = _recorded_files(db, copy_manager, current)
+
+        def reinstall(manager: CopyManager) -> bool:
+            removed = manager.remove_files(sorted(recorded))
+            manager.log("info", f"Removed {len(removed)} files")
+            return manager.install_components("opencode", [sorted(components)])
+
+        keep = config.get("generations", 0)
+        generation = install_generation(copy_manager, keep, reinstall) if keep else None
+        success = generation is not None if keep else reinstall(copy_manager)
 
         if success:
             detected_after = copy_manager.detect_installed_components()
-
-            # Collect component versions from registry
-            component_versions = {}
-            for comp_type_key, comp_ids in detected_after.items():
-                comp_type = comp_type_key.rstrip("s")
-                for cid in comp_ids:
-                    if comp_type == "agent":
-                        f = opencode_dir / "agents" / f"{cid}.md"
-                        if f.exists():
-                            component_versions[cid] = ManifestParser.create_from_md(
-                                f, "agent"
-                            ).version
-                    elif comp_type == "subagent":
-                        for cat in (opencode_dir / "agents" / "subagents").glob("*/"):
-                            f = cat / f"{cid}.md"
-                            if f.exists():
-                                component_versions[cid] = ManifestParser.create_from_md(
-                                    f, "subagent"
-                                ).version
-                                break
-                    elif comp_type == "skill":
-                        f = opencode_dir / "skills" / cid / "SKILL.md"
-                        if f.exists():
-                            component_versions[cid] = ManifestParser.create_from_md(
-                                f, "skill"
-                            ).version
-                    elif comp_type == "command":
-                        f = opencode_dir / "commands" / f"{cid}.md"
-                        if f.exists():
-                            component_versions[cid] = ManifestParser.create_from_md(
-                                f, "command"
-                            ).version
-
-            db.sync_from_detected(detected_after, "copy", component_versions)
-            
-            # Log all affected components
-            affected = [m["id"] for m in missing_components] + [u["id"] for u in updates_available]
-            db.log_action("update", affected, "copy", "success")
+            # Versions come from the catalog read before the update
+            component_versions = {
+                cid: plan.versions[cid]
+                for comp_ids in detected_after.values()
+                for cid in comp_ids
+                if cid in plan.versions
+            }
+
+            with db.batch():
+                db.sync_from_detected(
+                    detected_after, copy_manager.install_method, component_versions
+                )
+                files = [
+                    rel.as_posix()
+                    for _, rel in copy_manager.collect_package_files("opencode", components)
+                ]
+                db.set_file_ownership(files)
+
+                # Files of other components keep their tiers and records
+                file_tiers: Dict[str, List[str]] = {rel: [] for rel in recorded | set(files)}
+                for tier, paths in copy_manager.tier_index.items():
+                    for rel in paths:
+                        file_tiers.setdefault(rel, []).append(tier)
+                db.update_tier_index(file_tiers)
+
+                # Kept files keep their old records so they still show as modified
+                file_records = {rel: r for rel, r in records.items() if rel not in recorded}
+                written = set(files) - copy_manager.modified_files
+                file_records.update(record_files(target_dir, written))
+                file_records.update(
+                    {rel: records[rel] for rel in copy_manager.modified_files if rel in records}
+                )
+                db.set_file_records(file_records)
+
+                # Log all affected components
+                affected = [m.id for m in missing_components] + [u.id for u in updates_available]
+                db.log_action("update", affected, copy_manager.install_method, "success")
+            if generation is not None:
+                Generations(target_dir).save_db(generation, db.data)
 
     if success:
         parts = []
@@ -247,5 +256,9 @@ def update(component_id: str, all: bool, dry_run: bool):
         
         summary = " and ".join(parts) if parts else "updated 0"
         console.print(f"[green]✓[/green] Successfully {summary} component(s)!")
+        if force and modified:
+            console.print(f"[green]✓[/green] Restored {len(modified)} locally modified file(s)")
+        if generation is not None:
+            console.print(f"[dim]Activated generation {generation}[/dim]")
     else:
         console.print("[red]✗[/red] Update failed")
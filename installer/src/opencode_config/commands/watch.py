@@ -0,0 +1,75 @@
+"""
+Apply registry edits to the installation as they happen.
+"""
+
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+from ..config import Config
+from ..utils.copy import CopyManager
+from ..utils.installed_db import InstalledDB
+from ..utils.watch import IncrementalInstaller, PollingWatcher, collect_changes, create_watcher
+
+console = Console()
+
+
+@click.command()
+@click.option("--poll", is_flag=True, help="Poll for changes instead of using inotify")
+@click.option(
+    "--interval", default=0.5, show_default=True, help="Seconds between scans when polling"
+)
+@click.option(
+    "--debounce",
+    default=0.1,
+    show_default=True,
+    help="Quiet period in seconds before a batch of edits is applied",
+)
+def watch(poll: bool, interval: float, debounce: float):
+    """Re-render registry files into the installation as they change.
+
+    Watches the registry's opencode/ directory and, for each batch of edits,
+    renders and copies only the changed files and removes deleted ones. The
+    installation database is updated in place. Stop with Ctrl+C.
+    """
+    config = Config()
+    db = InstalledDB()
+    registry_path = config.registry_path or config.detect_registry_path()
+
+    if not registry_path:
+        console.print("[red]Error:[/red] Could not find registry. Run from registry directory.")
+        return
+
+    package_path = registry_path / "opencode"
+    if not package_path.exists():
+        console.print(f"[red]Error:[/red] Package directory not found: {package_path}")
+        return
+
+    target_dir = Path(config.target_dir).expanduser()
+    copy_manager = CopyManager(registry_path, target_dir, config)
+    installer = IncrementalInstaller(copy_manager, db, model_override=db.get_model_override())
+    watcher = create_watcher(package_path, poll=poll, interval=interval)
+
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    console.print(f"[green]✓[/green] Watching {package_path} ({mode})")
+    console.print(f"[dim]Installing changes into {target_dir}. Stop with Ctrl+C[/dim]\n")
+
+    try:
+        while True:
+            changed = collect_changes(watcher, debounce=debounce)
+            batch = installer.apply(changed)
+            if not (batch.written or batch.removed):
+                continue
+
+            stamp = time.strftime("%H:%M:%S")
+            elapsed = f"[dim]({batch.elapsed * 1000:.0f} ms)[/dim]"
+            for rel_path in batch.written:
+                console.print(f"[dim]{stamp}[/dim] [green]✓[/green] {rel_path} {elapsed}")
+            for rel_path in batch.removed:
+                console.print(f"[dim]{stamp}[/dim] [yellow]-[/yellow] {rel_path} {elapsed}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    console.print("[dim]Stopped watching[/dim]")
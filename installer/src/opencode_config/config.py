@@ -10,7 +10,12 @@ from typing import Dict, Any, Optional
 DEFAULT_CONFIG = {
     "target": "~/.config/opencode",
     "registry_path": None,  # Auto-detected or set by user
-    "install_method": "copy",
+    "install_method": "copy",  # "copy", or "link" to hard-link from the object store
+    "store_path": None,  # Object store for "link" (default: next to this config file)
+    "generations": 0,  # Install generations to keep for rollback (0 installs in place)
+    "minify": False,  # Strip comments, authoring-only sections and whitespace from prompts
+    "includes": "inline",  # {{include:...}} directives: "inline" or "reference"
+    "transforms": {},  # File kind → transform stages, e.g. {"skill": ["render"]}
     "log_level": "info",
     "model_tiers": {
         "high": None,
@@ -24,9 +29,10 @@ DEFAULT_CONFIG = {
 class Config:
     """Manages CLI configuration."""
 
-    def __init__(self, config_file: Optional[Path] = None):
+    def __init__(self, config_file: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
         self.config_file = config_file or Path.home() / ".config" / "opencode" / "opencode-registry-config.json"
-        self.data = self._load()
+        # Pre-loaded data (e.g. served by the daemon) skips reading the file
+        self.data = data if data is not None else self._load()
 
     def _load(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
@@ -61,6 +67,14 @@ class Config:
         """Get target directory as Path object."""
         return Path(os.path.expanduser(self.get("target")))
 
+    @property
+    def store_path(self) -> Path:
+        """Get the object store directory used by the "link" install method."""
+        path = self.get("store_path")
+        if path:
+            return Path(os.path.expanduser(path))
+        return self.config_file.parent / "opencode-registry-store"
+
     @property
     def registry_path(self) -> Optional[Path]:
         """Get registry path as Path object."""
@@ -104,6 +118,52 @@ class Config:
         self.data["model_tiers"][tier] = model
         self.save()
 
+    def list_profiles(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get named tier profiles.
+
+        Returns:
+            Dictionary mapping profile names to tier → model dictionaries
+        """
+        return self.get("profiles", {})
+
+    def set_profile_tier(self, profile: str, tier: str, model: str):
+        """
+        Set the model for a tier in a named profile, creating the profile if needed.
+
+        Args:
+            profile: Profile name (e.g., cheap, premium)
+            tier: Tier name (high, medium, low, free)
+            model: Model identifier string
+        """
+        profiles = {name: dict(tiers) for name, tiers in self.list_profiles().items()}
+        profiles.setdefault(profile, {})[tier] = model
+        self.data["profiles"] = profiles
+        self.save()
+
+    def profile_config(self, profile: str) -> "Config":
+        """
+        Get an in-memory Config that resolves tiers through a profile.
+
+        Tiers the profile does not set keep the base configuration's model.
+
+        Args:
+            profile: Profile name
+
+        Returns:
+            Config sharing this config's settings with the profile's model
+            tiers; it is for rendering only and must not be saved
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        profiles = self.list_profiles()
+        if profile not in profiles:
+            raise ValueError(f"Unknown profile '{profile}'")
+        tiers = dict(self.list_model_tiers())
+        tiers.update({tier: model for tier, model in profiles[profile].items() if model})
+        return Config(self.config_file, data={**self.data, "model_tiers": tiers})
+
     def list_model_tiers(self) -> Dict[str, str]:
         """
         Get all configured model tiers.
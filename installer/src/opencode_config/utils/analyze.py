@@ -0,0 +1,227 @@
+"""
+Prompt size analysis.
+
+Estimates how many tokens each component adds to a model's context: its own
+prompt (the markdown body, without frontmatter) plus the ``_shared/*.md``
+fragments it points to, directly or through other fragments. Sizes can be
+saved as a baseline and compared later so prompt growth is caught in review.
+
+Token counts are an offline approximation of BPE tokenizers: words count
+one token per four letters, numbers one per three digits and punctuation
+runs (markdown markup such as ``**`` or ``|---|``) one per two characters.
+Use them to compare prompts, not to predict billing.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .catalog import iter_component_files
+from .graph import SHARED_REF
+from .manifest import split_frontmatter
+
+BASELINE_FILENAME = "opencode-registry-prompt-sizes.json"
+BASELINE_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+|\d+|[^\w\s]+|_+")
+
+
+@dataclass
+class PromptSize:
+    """Estimated token cost of one component."""
+
+    id: str
+    type: str
+    path: str  # Registry-relative path
+    own: int  # Tokens in the component's body
+    shared: int = 0  # Tokens in the shared fragments it pulls in
+    fragments: List[str] = field(default_factory=list)  # Shared file names
+
+    @property
+    def total(self) -> int:
+        return self.own + self.shared
+
+    @property
+    def key(self) -> str:
+        """Baseline key; IDs are only unique per type."""
+        return f"{self.type}:{self.id}"
+
+
+@dataclass
+class PromptAnalysis:
+    """Sizes of every component and shared fragment in a registry."""
+
+    components: List[PromptSize] = field(default_factory=list)
+    fragments: Dict[str, int] = field(default_factory=dict)  # Shared file name → tokens
+
+    def heaviest(
+        self, types: Optional[Set[str]] = None, limit: Optional[int] = None
+    ) -> List[PromptSize]:
+        """Get components by total size, largest first."""
+        selected = [c for c in self.components if types is None or c.type in types]
+        selected.sort(key=lambda c: (-c.total, c.key))
+        return selected if limit is None else selected[:limit]
+
+    def users(self, fragment: str) -> int:
+        """Count components that pull in a shared fragment."""
+        return sum(fragment in c.fragments for c in self.components)
+
+
+@dataclass
+class Regression:
+    """A component whose prompt grew past the allowed threshold."""
+
+    key: str
+    baseline: int
+    current: int
+
+    @property
+    def growth(self) -> float:
+        """Growth in percent of the baseline size."""
+        return (self.current - self.baseline) * 100.0 / max(self.baseline, 1)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the number of tokens a BPE tokenizer produces for text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    count = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        if piece.isdigit():
+            count += (len(piece) + 2) // 3
+        elif piece.isalpha():
+            count += (len(piece) + 3) // 4
+        else:
+            count += (len(piece) + 1) // 2
+    return count
+
+
+def analyze_registry(registry_path: Path) -> PromptAnalysis:
+    """
+    Measure every component of a registry.
+
+    Each component file and each shared fragment is read once.
+
+    Args:
+        registry_path: Path to registry root
+
+    Returns:
+        PromptAnalysis
+    """
+    opencode_dir = registry_path / "opencode"
+    shared_dir = opencode_dir / "agents" / "_shared"
+    analysis = PromptAnalysis()
+    shared_refs: Dict[str, Set[str]] = {}
+
+    def load_fragment(name: str):
+        text = _read(shared_dir / name)
+        if text is None:
+            shared_refs[name] = set()  # Missing fragments are reported by lint
+            return
+        analysis.fragments[name] = estimate_tokens(text)
+        shared_refs[name] = set(SHARED_REF.findall(text))
+
+    for comp_type, comp_id, path in iter_component_files(opencode_dir):
+        # Frontmatter configures the component and is not part of the prompt
+        _, body = split_frontmatter(_read(path) or "")
+
+        fragments: Set[str] = set()
+        queue = set(SHARED_REF.findall(body))
+        while queue:
+            name = queue.pop()
+            if name in fragments:
+                continue
+            fragments.add(name)
+            if name not in shared_refs:
+                load_fragment(name)
+            queue |= shared_refs[name] - fragments
+        fragments &= set(analysis.fragments)
+
+        analysis.components.append(
+            PromptSize(
+                id=comp_id,
+                type=comp_type,
+                path=path.relative_to(registry_path).as_posix(),
+                own=estimate_tokens(body),
+                shared=sum(analysis.fragments[name] for name in fragments),
+                fragments=sorted(fragments),
+            )
+        )
+    return analysis
+
+
+def save_baseline(analysis: PromptAnalysis, path: Path):
+    """Write component sizes with stable formatting so baselines diff cleanly."""
+    data = {
+        "version": BASELINE_VERSION,
+        "components": {c.key: c.total for c in analysis.components},
+        "fragments": analysis.fragments,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: Path) -> Dict[str, int]:
+    """
+    Read component sizes saved by ``save_baseline``.
+
+    Args:
+        path: Baseline file
+
+    Returns:
+        Component key (``type:id``) → total tokens
+
+    Raises:
+        ValueError: If the file is not a baseline of a supported version
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise ValueError(f"Invalid baseline {path}: {e}")
+    if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline format in {path}")
+    return data.get("components", {})
+
+
+def find_regressions(
+    analysis: PromptAnalysis, baseline: Dict[str, int], threshold: float
+) -> List[Regression]:
+    """
+    Compare component sizes against a baseline.
+
+    Components missing from the baseline are new, not regressions.
+
+    Args:
+        analysis: Current sizes
+        baseline: Sizes from ``load_baseline``
+        threshold: Allowed growth in percent
+
+    Returns:
+        Regressions, largest growth first
+    """
+    regressions = [
+        Regression(c.key, baseline[c.key], c.total)
+        for c in analysis.components
+        if c.key in baseline and c.total > baseline[c.key] * (1 + threshold / 100.0)
+    ]
+    regressions.sort(key=lambda r: (-r.growth, r.key))
+    return regressions
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
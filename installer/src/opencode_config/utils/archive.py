@@ -0,0 +1,233 @@
+"""
+Pre-rendered archives for installing without a registry checkout.
+
+``pack`` renders a package once and writes a compressed tarball whose first
+member is a manifest in lockfile format (component versions, tiers, and the
+size and hash of every rendered file), followed by the rendered files under
+``files/``. ``install_archive`` reads the archive as a single sequential
+stream, verifying every file against the manifest, and only then writes the
+files into the targets; no manifest parsing or template rendering is involved.
+"""
+
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import Config
+from .copy import CopyManager, LogFunc
+from .hashing import hash_bytes
+from .lockfile import LOCK_VERSION, FrozenInstall, describe_rendered, matches_entry
+from .store import ObjectStore
+
+MANIFEST_NAME = "opencode-registry-archive.json"
+FILES_PREFIX = "files/"
+
+# Archive suffix → tarfile compression
+COMPRESSION = {".gz": "gz", ".tgz": "gz", ".xz": "xz", ".bz2": "bz2", ".zst": "zst"}
+
+
+def pack(
+    registry_path: Path,
+    config: Config,
+    output: Path,
+    model_override: Optional[str] = None,
+    profile: Optional[str] = None,
+    package: str = "opencode",
+    log: Optional[LogFunc] = None,
+) -> Dict[str, Any]:
+    """
+    Render a package and write it as an archive.
+
+    The compression follows the output suffix (``.tar.gz`` by default;
+    ``.tar.zst`` needs a Python whose tarfile supports zstd).
+
+    Args:
+        registry_path: Path to registry root
+        config: Config instance used to resolve model tiers
+        output: Archive path
+        model_override: Optional model replacing tier resolution
+        profile: Profile name recorded in the manifest
+        package: Name of package directory
+        log: Message callback passed to CopyManager
+
+    Returns:
+        The archive manifest
+
+    Raises:
+        ValueError: If the package is missing, a file fails to render, or the
+            compression is not supported
+    """
+    if not (registry_path / package).exists():
+        raise ValueError(f"Package directory not found: {registry_path / package}")
+
+    manager = CopyManager(registry_path, Path(), config, log=log)
+    rendered, success = manager.render_package(package, model_override)
+    if not success:
+        raise ValueError("Some registry files failed to render")
+
+    manifest = describe_rendered(registry_path, rendered, config, model_override, package)
+    manifest["profile"] = profile
+
+    compression = COMPRESSION.get(output.suffix, "gz")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    mtime = int(time.time())
+    # Write next to the output and rename, so a failed pack leaves no partial archive
+    partial = output.with_name(f".{output.name}.partial")
+    try:
+        tar = tarfile.open(partial, f"w:{compression}")
+    except tarfile.CompressionError as e:
+        raise ValueError(f"Unsupported archive compression '{compression}': {e}") from e
+
+    try:
+        with tar:
+            data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+            _add_member(tar, MANIFEST_NAME, data, 0o644, mtime)
+            for item in rendered:
+                if item.content is None:
+                    data = item.source.read_bytes()
+                    mode = item.source.stat().st_mode & 0o777
+                else:
+                    data = item.content.encode("utf-8")
+                    mode = 0o644
+                _add_member(tar, FILES_PREFIX + item.rel_path.as_posix(), data, mode, mtime)
+    except BaseException:
+        partial.unlink()
+        raise
+    os.replace(partial, output)
+
+    return manifest
+
+
+def install_archive(
+    archive_path: Path,
+    target_dirs: List[Path],
+    dry_run: bool = False,
+    store: Optional[ObjectStore] = None,
+) -> Tuple[Dict[str, Any], Dict[Path, FrozenInstall]]:
+    """
+    Stream an archive into one or more targets.
+
+    The archive is read once and each file is checked against the manifest
+    hash. Only when every file verified is each one written atomically into
+    every target where the installed file does not already match; otherwise
+    nothing is written.
+
+    Args:
+        archive_path: Archive written by ``pack``
+        target_dirs: Installation directories
+        dry_run: If True, verify and report files to write without writing them
+        store: Object store to hard-link files from instead of copying them
+
+    Returns:
+        Tuple of (manifest, result per target)
+
+    Raises:
+        OSError: If the archive cannot be read
+        ValueError: If the file is not an archive written by ``pack``
+    """
+    results = {target_dir: FrozenInstall() for target_dir in target_dirs}
+    manifest: Optional[Dict[str, Any]] = None
+    verified: List[Tuple[Path, bytes, int, Dict[str, Any]]] = []
+    errors: List[str] = []
+    seen = set()
+
+    try:
+        with tarfile.open(archive_path, "r|*") as tar:
+            for member in tar:
+                if manifest is None:
+                    manifest = _read_manifest(tar, member, archive_path)
+                    continue
+
+                rel = member.name[len(FILES_PREFIX) :]
+                entry = manifest["files"].get(rel)
+                if not member.isfile() or not member.name.startswith(FILES_PREFIX) or not entry:
+                    raise ValueError(f"Unexpected archive member: {member.name}")
+                if Path(rel).is_absolute() or ".." in Path(rel).parts:
+                    raise ValueError(f"Unsafe archive member: {member.name}")
+                seen.add(rel)
+
+                data = tar.extractfile(member).read()
+                if hash_bytes(data) != entry["rendered"]:
+                    errors.append(f"{rel}: content does not match the manifest")
+                    continue
+                verified.append((Path(rel), data, member.mode, entry))
+    except tarfile.TarError as e:
+        raise ValueError(f"Not a readable archive: {archive_path} ({e})") from e
+
+    if manifest is None:
+        raise ValueError(f"Empty archive: {archive_path}")
+
+    errors.extend(
+        f"{rel}: missing from the archive" for rel in sorted(set(manifest["files"]) - seen)
+    )
+    for target_dir, result in results.items():
+        if errors:
+            result.errors.extend(errors)
+            continue
+        for rel_path, data, mode, entry in verified:
+            _install_member(target_dir, rel_path, data, mode, entry, result, dry_run, store)
+    return manifest, results
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes, mode: int, mtime: int):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    info.mtime = mtime
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _read_manifest(tar: tarfile.TarFile, member: tarfile.TarInfo, archive_path: Path):
+    """Read the manifest, which ``pack`` always writes as the first member."""
+    if member.name != MANIFEST_NAME or not member.isfile():
+        raise ValueError(f"Not an opencode-config archive: {archive_path}")
+    manifest = json.load(tar.extractfile(member))
+    if not isinstance(manifest, dict) or manifest.get("version") != LOCK_VERSION:
+        raise ValueError(f"Unsupported archive format: {archive_path}")
+    return manifest
+
+
+def _install_member(
+    target_dir: Path,
+    rel_path: Path,
+    data: bytes,
+    mode: int,
+    entry: Dict[str, Any],
+    result: FrozenInstall,
+    dry_run: bool,
+    store: Optional[ObjectStore] = None,
+):
+    """Write one archive file into a target unless it is already installed."""
+    dest = target_dir / rel_path
+    if matches_entry(dest, entry):
+        result.unchanged.append(rel_path)
+        return
+    if dry_run:
+        result.written.append(rel_path)
+        return
+
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if store is not None:
+            store.link(store.put_bytes(data, executable=bool(mode & 0o111)), dest)
+            result.written.append(rel_path)
+            return
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Never take setuid/setgid or group/world write bits from the archive
+            os.chmod(tmp, 0o755 if mode & 0o111 else 0o644)
+            os.replace(tmp, dest)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        result.errors.append(f"{rel_path}: {e}")
+        return
+    result.written.append(rel_path)
@@ -0,0 +1,174 @@
+"""
+Bundles: resolution to component sets and minimal-delta switching.
+
+A bundle (``bundles/<name>.yaml``) lists component IDs; it resolves to those
+components plus everything they depend on or delegate to (see
+``graph.DependencyGraph``). Installing a bundle over other installed
+bundles only adds the components the new bundle needs that are missing and
+removes the ones only the replaced bundles needed.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from .catalog import Catalog, component_for_path, iter_component_files
+from .copy import CopyManager
+from .graph import CycleError, DependencyGraph
+from .installed_db import InstalledDB
+
+
+@dataclass
+class BundleSwitch:
+    """Component changes needed to install a bundle over the current installation."""
+
+    add: Set[str] = field(default_factory=set)
+    remove: Set[str] = field(default_factory=set)
+    keep: Set[str] = field(default_factory=set)  # Needed and already installed
+    replaced: List[str] = field(default_factory=list)  # Installed bundles being replaced
+
+
+def read_bundle(registry_path: Path, name: str) -> Dict[str, Any]:
+    """
+    Read a bundle definition.
+
+    Args:
+        registry_path: Path to registry root
+        name: Bundle name
+
+    Returns:
+        Bundle data (``name``, ``description``, ``components``)
+
+    Raises:
+        ValueError: If the bundle does not exist
+    """
+    import yaml
+
+    bundle_file = registry_path / "bundles" / f"{name}.yaml"
+    if not bundle_file.exists():
+        raise ValueError(f"Bundle '{name}' not found at {bundle_file}")
+    with open(bundle_file, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def resolve_bundles(registry_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve every bundle of a registry to its components in dependency order.
+
+    Args:
+        registry_path: Path to registry root
+
+    Returns:
+        Bundle name → {"components": declared IDs, "layers": closure in
+        dependency order, "unknown": declared IDs not in the registry,
+        "error": cycle description or None}
+    """
+    graph = DependencyGraph.from_catalog(Catalog.scan(registry_path))
+    bundles_dir = registry_path / "bundles"
+    names = sorted(p.stem for p in bundles_dir.glob("*.yaml")) if bundles_dir.exists() else []
+
+    resolved = {}
+    for name in names:
+        declared = list(read_bundle(registry_path, name).get("components", []) or [])
+        known = [cid for cid in declared if cid in graph.edges]
+        resolution: Dict[str, Any] = {
+            "components": declared,
+            "layers": [],
+            "unknown": [cid for cid in declared if cid not in graph.edges],
+            "error": None,
+        }
+        try:
+            resolution["layers"] = graph.layers(graph.closure(known))
+        except CycleError as e:
+            resolution["error"] = str(e)
+        resolved[name] = resolution
+    return resolved
+
+
+def resolution_fingerprint(registry_path: Path) -> Dict[str, int]:
+    """
+    Collect mtimes of every file a bundle resolution is derived from.
+
+    These are the bundle definitions, component definition files and shared
+    files; component references cannot change without one of them changing.
+
+    Args:
+        registry_path: Path to registry root
+
+    Returns:
+        Dict mapping registry-relative file paths to mtimes (ns)
+    """
+    opencode_dir = registry_path / "opencode"
+    paths = [path for _, _, path in iter_component_files(opencode_dir)]
+    paths.extend((opencode_dir / "agents" / "_shared").glob("*.md"))
+    paths.extend((registry_path / "bundles").glob("*.yaml"))
+
+    fingerprint = {}
+    for path in paths:
+        try:
+            fingerprint[path.relative_to(registry_path).as_posix()] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return fingerprint
+
+
+def plan_switch(db: InstalledDB, bundle: str, components: Set[str]) -> BundleSwitch:
+    """
+    Compare a bundle's resolved components against the installation.
+
+    Every other installed bundle is replaced: components only those bundles
+    needed are removed. Components installed on their own are kept.
+
+    Args:
+        db: Installation database
+        bundle: Name of the bundle being installed
+        components: The bundle's resolved components
+
+    Returns:
+        BundleSwitch
+    """
+    installed = {record["id"] for record in db.get_all_installed()}
+    replaced = sorted(name for name in db.data.get("bundles", {}) if name != bundle)
+    previous = {
+        cid for name in replaced for cid in db.data["bundles"][name].get("components", [])
+    }
+    return BundleSwitch(
+        add=components - installed,
+        remove=(previous & installed) - components,
+        keep=components & installed,
+        replaced=replaced,
+    )
+
+
+def component_files(
+    db: InstalledDB, copy_manager: CopyManager, component_id: str
+) -> Dict[str, List[str]]:
+    """
+    Get the installed files of every installed component with an ID.
+
+    An ID can be installed under several types (e.g. an agent and a command
+    both named ``review``). Databases written before file ownership was
+    recorded fall back to the component's files in the registry.
+
+    Args:
+        db: Installation database
+        copy_manager: CopyManager for the installation target
+        component_id: Component ID
+
+    Returns:
+        Component type → file paths relative to the target directory
+    """
+    owned = {}
+    for type_key, items in db.data["installed"].items():
+        if component_id not in items:
+            continue
+        comp_type = type_key.rstrip("s")
+        files = items[component_id].get("files")
+        if files is None:
+            files = [
+                rel.as_posix()
+                for _, rel in copy_manager.collect_package_files("opencode")
+                if component_for_path(rel) == (comp_type, component_id)
+            ]
+        owned[comp_type] = files
+    return owned
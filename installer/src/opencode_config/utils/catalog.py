@@ -0,0 +1,252 @@
+"""
+Registry catalog: discovery of components in a registry checkout.
+"""
+
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .manifest import ComponentManifest, ManifestParser
+
+COMPONENT_TYPES = ["agent", "subagent", "skill", "command"]
+
+
+@dataclass
+class CatalogEntry:
+    """A component available in the registry."""
+
+    manifest: ComponentManifest
+    path: Path  # Source markdown file defining the component
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize entry to JSON-compatible data."""
+        return {"manifest": asdict(self.manifest), "path": str(self.path)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CatalogEntry":
+        """Rebuild an entry serialized with ``to_dict``."""
+        return cls(ComponentManifest(**data["manifest"]), Path(data["path"]))
+
+
+class Catalog:
+    """All components of a registry, parsed once."""
+
+    def __init__(self, registry_path: Path, entries: List[CatalogEntry]):
+        """
+        Initialize catalog.
+
+        Args:
+            registry_path: Path to registry root
+            entries: Catalog entries in registry walk order
+        """
+        self.registry_path = registry_path
+        self.entries = entries
+
+    @classmethod
+    def scan(cls, registry_path: Path) -> "Catalog":
+        """Walk the registry and parse every component's frontmatter."""
+        entries = [
+            CatalogEntry(ManifestParser.create_from_md(path, comp_type), path)
+            for comp_type, _, path in iter_component_files(registry_path / "opencode")
+        ]
+        return cls(registry_path, entries)
+
+    def get(
+        self, component_id: str, component_type: Optional[str] = None
+    ) -> Optional[CatalogEntry]:
+        """
+        Find a component by ID.
+
+        When an ID exists under several types, agents win over subagents,
+        skills and commands, in that order.
+
+        Args:
+            component_id: Component ID
+            component_type: Optional type to restrict the lookup to
+
+        Returns:
+            Matching entry or None
+        """
+        for entry in self.entries:
+            if entry.manifest.id != component_id:
+                continue
+            if component_type is None or entry.manifest.type == component_type:
+                return entry
+        return None
+
+    def filter(
+        self, component_type: Optional[str] = None, tag: Optional[str] = None
+    ) -> List[CatalogEntry]:
+        """Get entries matching an optional type and tag."""
+        return [
+            entry
+            for entry in self.entries
+            if (not component_type or entry.manifest.type == component_type)
+            and (not tag or tag in entry.manifest.tags)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize catalog to JSON-compatible data."""
+        return {
+            "registry": str(self.registry_path),
+            "entries": [entry.to_dict() for entry in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Catalog":
+        """Rebuild a catalog serialized with ``to_dict``."""
+        entries = [CatalogEntry.from_dict(item) for item in data["entries"]]
+        return cls(Path(data["registry"]), entries)
+
+    def fingerprint(self) -> Dict[str, int]:
+        """
+        Collect mtimes of registry directories and of every catalogued file.
+
+        Any added, removed or edited component changes the fingerprint.
+        """
+        fingerprint = registry_fingerprint(self.registry_path)
+        for entry in self.entries:
+            try:
+                mtime = entry.path.stat().st_mtime_ns
+            except OSError:
+                mtime = -1
+            fingerprint[str(entry.path)] = mtime
+        return fingerprint
+
+
+def registry_fingerprint(registry_path: Path) -> Dict[str, int]:
+    """
+    Collect mtimes of every registry directory whose listing defines components.
+
+    Adding or removing a component changes at least one of these mtimes.
+
+    Args:
+        registry_path: Path to registry root
+
+    Returns:
+        Dict mapping registry-relative directory paths to mtimes (ns)
+    """
+    opencode_dir = registry_path / "opencode"
+    dirs = [
+        opencode_dir / "agents",
+        opencode_dir / "agents" / "subagents",
+        opencode_dir / "skills",
+        opencode_dir / "commands",
+        registry_path / "bundles",
+    ]
+    for parent in (opencode_dir / "agents" / "subagents", opencode_dir / "skills"):
+        try:
+            dirs.extend(Path(e.path) for e in os.scandir(parent) if e.is_dir())
+        except OSError:
+            pass
+
+    fingerprint = {}
+    for directory in dirs:
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            continue
+        fingerprint[directory.relative_to(registry_path).as_posix()] = mtime
+    return fingerprint
+
+
+def find_component(registry_path: Path, component_id: str) -> Optional[CatalogEntry]:
+    """
+    Look up a single component without scanning the whole registry.
+
+    Probes agents, subagents, skills and commands in that order and parses
+    only the matching file.
+
+    Args:
+        registry_path: Path to registry root
+        component_id: Component ID
+
+    Returns:
+        Matching entry or None
+    """
+    opencode_dir = registry_path / "opencode"
+    candidates = [("agent", opencode_dir / "agents" / f"{component_id}.md")]
+    candidates.extend(
+        ("subagent", category_dir / f"{component_id}.md")
+        for category_dir in _list_dirs(opencode_dir / "agents" / "subagents")
+    )
+    candidates.append(("skill", opencode_dir / "skills" / component_id / "SKILL.md"))
+    candidates.append(("command", opencode_dir / "commands" / f"{component_id}.md"))
+
+    for comp_type, path in candidates:
+        if path.is_file():
+            return CatalogEntry(ManifestParser.create_from_md(path, comp_type), path)
+    return None
+
+
+def component_for_path(rel_path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Find the component an installed file belongs to.
+
+    Args:
+        rel_path: File path relative to the ``opencode/`` directory
+
+    Returns:
+        Tuple of (component type, component ID), or None for shared files
+    """
+    parts = rel_path.parts
+    if len(parts) == 2 and parts[0] in ("agents", "commands") and parts[1].endswith(".md"):
+        return parts[0].rstrip("s"), rel_path.stem
+    if len(parts) == 4 and parts[:2] == ("agents", "subagents") and parts[3].endswith(".md"):
+        return "subagent", rel_path.stem
+    if len(parts) >= 3 and parts[0] == "skills":
+        return "skill", parts[1]
+    return None
+
+
+def iter_component_files(opencode_dir: Path) -> Iterator[Tuple[str, str, Path]]:
+    """
+    Walk the registry and yield every component definition file.
+
+    Only directory listings are read; no file content is parsed.
+
+    Args:
+        opencode_dir: Path to the registry's ``opencode/`` directory
+
+    Yields:
+        Tuples of (component type, component ID, path to markdown file)
+    """
+    agent_dir = opencode_dir / "agents"
+    for path in _list_md_files(agent_dir):
+        yield "agent", path.stem, path
+
+    subagent_dir = agent_dir / "subagents"
+    for category_dir in _list_dirs(subagent_dir):
+        for path in _list_md_files(category_dir):
+            yield "subagent", path.stem, path
+
+    for skill_dir in _list_dirs(opencode_dir / "skills"):
+        skill_md = skill_dir / "SKILL.md"
+        if skill_md.exists():
+            yield "skill", skill_dir.name, skill_md
+
+    for path in _list_md_files(opencode_dir / "commands"):
+        yield "command", path.stem, path
+
+
+def _list_md_files(directory: Path) -> Iterator[Path]:
+    """Yield visible markdown files in a directory, sorted by name."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith(".") and entry.name.endswith(".md") and entry.is_file():
+            yield Path(entry.path)
+
+
+def _list_dirs(directory: Path) -> Iterator[Path]:
+    """Yield visible subdirectories of a directory, sorted by name."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith(".") and entry.is_dir():
+            yield Path(entry.path)
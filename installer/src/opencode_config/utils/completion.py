@@ -0,0 +1,100 @@
+"""
+Shell completion callbacks for click arguments and options.
+
+Candidates come from the cached registry index so a Tab press never parses
+component files. Completion must never fail loudly, so every callback returns
+an empty list on error.
+"""
+
+import os
+from typing import List, Optional
+
+from click.shell_completion import CompletionItem, split_arg_string
+
+from ..config import DEFAULT_CONFIG, Config
+from .registry_index import INDEX_FILENAME, RegistryIndex
+
+TIERS = list(DEFAULT_CONFIG["model_tiers"])
+
+
+def _registry_index(config: Optional[Config] = None) -> Optional[RegistryIndex]:
+    """Open the registry index for the configured or auto-detected registry."""
+    config = config or Config()
+    registry_path = config.registry_path or config.detect_registry_path()
+    if not registry_path:
+        return None
+    return RegistryIndex(registry_path, config.config_file.parent / INDEX_FILENAME)
+
+
+def complete_component_ids(ctx, param, incomplete: str) -> List[CompletionItem]:
+    """Complete IDs of components available in the registry."""
+    try:
+        index = _registry_index()
+        if index is None:
+            return []
+        return [
+            CompletionItem(cid, help=", ".join(types))
+            for cid, types in sorted(index.component_types().items())
+            if cid.startswith(incomplete)
+        ]
+    except Exception:
+        return []
+
+
+def complete_installed_ids(ctx, param, incomplete: str) -> List[CompletionItem]:
+    """Complete IDs of components recorded in the installation database."""
+    try:
+        from .installed_db import InstalledDB
+
+        db = InstalledDB()
+        return [
+            CompletionItem(cid, help=comp_type.rstrip("s"))
+            for comp_type, items in sorted(db.data.get("installed", {}).items())
+            for cid in sorted(items)
+            if cid.startswith(incomplete)
+        ]
+    except Exception:
+        return []
+
+
+def complete_bundles(ctx, param, incomplete: str) -> List[CompletionItem]:
+    """Complete bundle names defined in the registry."""
+    try:
+        index = _registry_index()
+        if index is None:
+            return []
+        names = index.bundle_names()
+        return [CompletionItem(name) for name in names if name.startswith(incomplete)]
+    except Exception:
+        return []
+
+
+def complete_tiers(ctx, param, incomplete: str) -> List[CompletionItem]:
+    """
+    Complete model tier names.
+
+    For two-value options such as ``--set TIER MODEL`` the second value is
+    completed with models already configured for any tier.
+    """
+    words = _preceding_words()
+    if len(words) >= 2 and words[-1] in TIERS and words[-2] in param.opts:
+        try:
+            models = {m for m in Config().list_model_tiers().values() if m}
+        except Exception:
+            return []
+        return [CompletionItem(m) for m in sorted(models) if m.startswith(incomplete)]
+
+    return [CompletionItem(tier) for tier in TIERS if tier.startswith(incomplete)]
+
+
+def _preceding_words() -> List[str]:
+    """Words before the one being completed, as reported by the shell."""
+    words = split_arg_string(os.environ.get("COMP_WORDS", ""))
+    cword = os.environ.get("COMP_CWORD", "")
+    if cword.isdigit():
+        # bash and zsh pass the index of the word being completed
+        return words[: int(cword)]
+    if words and words[-1] == cword:
+        # fish passes the incomplete word itself
+        return words[:-1]
+    return words
@@ -2,22 +2,96 @@
 File copying with template processing for component installation.
 """
 
+import heapq
+import json
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from rich.console import Console
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
 
 from ..config import Config
 from .template import TemplateEngine
+from .catalog import component_for_path
 from .manifest import ManifestParser
+from .pipeline import TransformContext, TransformPipeline
+from .store import store_for
 
-console = Console()
+# Log callback: (level, message) with level one of "info", "warning", "error"
+LogFunc = Callable[[str, str], None]
+
+_LEVEL_STYLES = {"info": "dim", "warning": "yellow", "error": "red"}
+_console = None
+
+
+SNAPSHOT_FILENAME = ".opencode-registry-detect.json"
+
+@dataclass
+class RenderedFile:
+    """A registry file rendered for installation."""
+
+    rel_path: Path  # Destination path relative to the target directory
+    source: Path
+    content: Optional[str] = None  # None: copied verbatim from source
+    tiers: List[str] = field(default_factory=list)  # Tiers the rendered content depends on
+    includes: List[str] = field(default_factory=list)  # Package files inlined into the content
+
+
+def is_ignored(rel_path: Path) -> bool:
+    """Check whether a package path is skipped on install (hidden files and caches)."""
+    return any(part.startswith(".") or part == "__pycache__" for part in rel_path.parts)
+
+
+def build_tier_index(rendered: List[RenderedFile]) -> Dict[str, List[str]]:
+    """
+    Map each model tier to the rendered files that resolved a model through it.
+
+    Args:
+        rendered: Rendered files
+
+    Returns:
+        Dictionary mapping tier names to sorted relative paths (POSIX style)
+    """
+    index: Dict[str, List[str]] = {}
+    for item in rendered:
+        for tier in item.tiers:
+            index.setdefault(tier, []).append(item.rel_path.as_posix())
+    return {tier: sorted(paths) for tier, paths in sorted(index.items())}
+
+
+def console_log(level: str, message: str):
+    """Print a CopyManager message to the terminal (rich is imported on first use)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+
+    from rich.markup import escape
+
+    if message:
+        _console.print(f"[{_LEVEL_STYLES.get(level, 'dim')}]{escape(message)}[/]")
+    else:
+        _console.print()
 
 
 class CopyManager:
     """Manage file copying with template processing."""
 
-    def __init__(self, registry_path: Path, target_dir: Path, config: Config):
+    SNAPSHOT_VERSION = 1
+    # Filesystems with coarse timestamps can hide changes made in the same tick
+    SNAPSHOT_RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(
+        self,
+        registry_path: Path,
+        target_dir: Path,
+        config: Config,
+        snapshot_path: Optional[Path] = None,
+        log: Optional[LogFunc] = None,
+    ):
         """
         Initialize copy manager.
 
@@ -25,11 +99,29 @@ class CopyManager:
             registry_path: Path to registry root
             target_dir: Target installation directory
             config: Config instance
+            snapshot_path: Detection snapshot file (defaults to one inside target_dir)
+            log: Message callback (prints to the terminal by default)
         """
         self.registry_path = registry_path
         self.target_dir = target_dir
         self.config = config
+        self.snapshot_path = snapshot_path or target_dir / SNAPSHOT_FILENAME
         self.template_engine = TemplateEngine(config)
+        self.pipeline = TransformPipeline.from_config(config)
+        self.log = log or console_log
+        # Tier → files index of the last package installed by this manager
+        self.tier_index: Dict[str, List[str]] = {}
+        # Files (relative to target_dir) written by the last install
+        self.written: List[Path] = []
+        # Installed files found modified by verify_files; never overwritten or removed
+        self.modified_files: Set[str] = set()
+        # With install_method "link", files are hard links into a shared object store
+        self.store = store_for(config)
+
+    @property
+    def install_method(self) -> str:
+        """Installation method recorded in the database ("copy" or "link")."""
+        return "link" if self.store is not None else "copy"
 
     def install_package(
         self, package_name: str, dry_run: bool = False, model_override: Optional[str] = None
@@ -48,58 +140,305 @@ class CopyManager:
         package_path = self.registry_path / package_name
 
         if not package_path.exists():
-            console.print(f"[red]Error:[/red] Package directory not found: {package_path}")
+            self.log("error", f"Error: Package directory not found: {package_path}")
             return False
 
-        # Ensure base directories exist
-        if not dry_run:
-            self.target_dir.mkdir(parents=True, exist_ok=True)
-            base_dirs = ["agents", "skills", "commands"]
-            for base_dir in base_dirs:
-                (self.target_dir / base_dir).mkdir(parents=True, exist_ok=True)
+        if dry_run:
+            files = self.collect_package_files(package_name)
+            for _, rel_path in files:
+                self.log("warning", f"Would copy: {rel_path}")
+            self.log("info", "")
+            self.log("info", f"Would copy {len(files)} files")
+            return True
+
+        rendered, success = self.render_package(package_name, model_override)
+        self.tier_index = build_tier_index(rendered)
+        self.written, write_ok = self.write_rendered(rendered, self.target_dir)
+        self.log("info", f"Copied {len(self.written)} files")
+
+        return success and write_ok
+
+    def install_package_to_targets(
+        self,
+        package_name: str,
+        targets: List[Path],
+        model_override: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        components: Optional[Set[str]] = None,
+    ) -> Dict[Path, bool]:
+        """
+        Render a package once and write it into several target directories.
+
+        The registry is walked and every template rendered a single time;
+        the rendered output is then written to all targets in parallel.
+
+        Args:
+            package_name: Name of package directory (e.g., 'opencode')
+            targets: Target installation directories
+            model_override: Optional model to override tier resolution
+            max_workers: Maximum number of targets written concurrently
+            components: If given, only install these components and shared files
+
+        Returns:
+            Dictionary mapping each target to True if it was written successfully
+        """
+        package_path = self.registry_path / package_name
+
+        if not package_path.exists():
+            self.log("error", f"Error: Package directory not found: {package_path}")
+            return {target: False for target in targets}
+
+        rendered, render_ok = self.render_package(package_name, model_override, components)
+        self.tier_index = build_tier_index(rendered)
+
+        def write(target: Path) -> bool:
+            _, write_ok = self.write_rendered(rendered, target)
+            return render_ok and write_ok
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(targets, executor.map(write, targets)))
+
+    def render_variants(
+        self,
+        package_name: str,
+        configs: Dict[str, Config],
+        components: Optional[Set[str]] = None,
+    ) -> Tuple[Dict[str, List[RenderedFile]], bool]:
+        """
+        Render a package for several tier configurations in one pass.
+
+        Each source file is read and parsed once; the transform stages run
+        per configuration.
+
+        Args:
+            package_name: Name of package directory (e.g., 'opencode')
+            configs: Variant name → configuration to render it with
+            components: If given, only render these components and shared files
 
-        # Walk through package directory and copy files
+        Returns:
+            Tuple of (variant name → rendered files, True if everything rendered)
+        """
+        engines = {name: TemplateEngine(config) for name, config in configs.items()}
+        variants: Dict[str, List[RenderedFile]] = {name: [] for name in configs}
         success = True
-        copied_count = 0
 
+        for source, rel_path in self.collect_package_files(package_name, components):
+            try:
+                if not self.template_engine.should_process_file(str(source)):
+                    verbatim = RenderedFile(rel_path, source)
+                    for rendered in variants.values():
+                        rendered.append(verbatim)
+                    continue
+
+                with open(source, "r", encoding="utf-8") as f:
+                    text = f.read()
+                for name, engine in engines.items():
+                    variants[name].append(self._transform(text, source, rel_path, engine))
+            except Exception as e:
+                self.log("error", f"Error copying {rel_path}: {e}")
+                success = False
+
+        return variants, success
+
+    def write_variants(
+        self,
+        variants: Dict[str, List[RenderedFile]],
+        targets: Dict[str, Path],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, bool]:
+        """
+        Write rendered variants into their target directories in parallel.
+
+        Args:
+            variants: Variant name → rendered files (from ``render_variants``)
+            targets: Variant name → target directory
+            max_workers: Maximum number of targets written concurrently
+
+        Returns:
+            Dictionary mapping each variant name to True if it was written successfully
+        """
+        names = list(targets)
+
+        def write(name: str) -> bool:
+            _, write_ok = self.write_rendered(variants[name], targets[name])
+            return write_ok
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(names, executor.map(write, names)))
+
+    def collect_package_files(
+        self, package_name: str, components: Optional[Set[str]] = None
+    ) -> List[Tuple[Path, Path]]:
+        """
+        List the files of a package that get installed.
+
+        Hidden files and ``__pycache__`` directories are skipped.
+
+        Args:
+            package_name: Name of package directory (e.g., 'opencode')
+            components: If given, only files of these component IDs and shared
+                files (e.g. ``agents/_shared``) are listed
+
+        Returns:
+            List of (source path, path relative to the package root), sorted
+        """
+        package_path = self.registry_path / package_name
+        files = []
         for item in package_path.rglob("*"):
-            if item.is_file():
-                # Skip hidden files and cache
-                if any(part.startswith(".") or part == "__pycache__" for part in item.parts):
+            rel_path = item.relative_to(package_path)
+            if is_ignored(rel_path):
+                continue
+            if components is not None:
+                owner = component_for_path(rel_path)
+                if owner and owner[1] not in components:
                     continue
+            if item.is_file():
+                files.append((item, rel_path))
+        return sorted(files, key=lambda f: f[1])
+
+    def install_components(
+        self,
+        package_name: str,
+        layers: List[List[str]],
+        dry_run: bool = False,
+        model_override: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> bool:
+        """
+        Install selected components in dependency order.
 
-                # Calculate relative path from package root
-                rel_path = item.relative_to(package_path)
-                target_path = self.target_dir / rel_path
+        Shared files are written first, then each layer (from
+        ``DependencyGraph.layers``) after the one before it. Components within
+        a layer do not depend on each other and are rendered and written in
+        parallel.
 
-                if dry_run:
-                    console.print(f"[yellow]Would copy:[/yellow] {rel_path}")
-                    copied_count += 1
-                else:
-                    # Create parent directories
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            package_name: Name of package directory (e.g., 'opencode')
+            layers: Component IDs in dependency order
+            dry_run: If True, simulate without making changes
+            model_override: Optional model to override tier resolution
+            max_workers: Maximum number of components written concurrently
 
-                    # Check for conflicts
-                    if target_path.exists() and not self._can_overwrite(target_path):
-                        console.print(
-                            f"[yellow]Warning:[/yellow] {target_path} exists, skipping"
-                        )
-                        continue
-
-                    # Process file
-                    try:
-                        self._copy_and_process_file(item, target_path, model_override)
-                        copied_count += 1
-                    except Exception as e:
-                        console.print(f"[red]Error copying {rel_path}:[/red] {e}")
-                        success = False
+        Returns:
+            True if successful, False otherwise
+        """
+        package_path = self.registry_path / package_name
+        if not package_path.exists():
+            self.log("error", f"Error: Package directory not found: {package_path}")
+            return False
+
+        selected = {component for layer in layers for component in layer}
+        groups: Dict[Optional[str], List[Tuple[Path, Path]]] = {}
+        for source, rel_path in self.collect_package_files(package_name, selected):
+            owner = component_for_path(rel_path)
+            groups.setdefault(owner[1] if owner else None, []).append((source, rel_path))
 
         if dry_run:
-            console.print(f"\n[dim]Would copy {copied_count} files[/dim]")
-        else:
-            console.print(f"[dim]Copied {copied_count} files[/dim]")
+            count = 0
+            for group in [None] + [component for layer in layers for component in layer]:
+                for _, rel_path in groups.get(group, []):
+                    self.log("warning", f"Would copy: {rel_path}")
+                    count += 1
+            self.log("info", "")
+            self.log("info", f"Would copy {len(selected)} components ({count} files)")
+            return True
+
+        def install(group: Optional[str]) -> Tuple[List[RenderedFile], List[Path], bool]:
+            rendered, success = [], True
+            for source, rel_path in groups.get(group, []):
+                try:
+                    rendered.append(self.render_file(source, rel_path, model_override))
+                except Exception as e:
+                    self.log("error", f"Error copying {rel_path}: {e}")
+                    success = False
+            written, write_ok = self.write_rendered(rendered, self.target_dir)
+            return rendered, written, success and write_ok
+
+        results = [install(None)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for layer in layers:
+                results.extend(executor.map(install, layer))
+
+        self.tier_index = build_tier_index(
+            [item for rendered, _, _ in results for item in rendered]
+        )
+        self.written = [rel for _, written, _ in results for rel in written]
+        self.log("info", f"Copied {len(self.written)} files")
+        return all(ok for _, _, ok in results)
+
+    def render_package(
+        self,
+        package_name: str,
+        model_override: Optional[str] = None,
+        components: Optional[Set[str]] = None,
+    ) -> Tuple[List[RenderedFile], bool]:
+        """
+        Render every installable file of a package without writing anything.
+
+        Args:
+            package_name: Name of package directory (e.g., 'opencode')
+            model_override: Optional model to override tier resolution
+            components: If given, only render these components and shared files
+
+        Returns:
+            Tuple of (rendered files, True if every file rendered successfully)
+        """
+        rendered = []
+        success = True
+        for source, rel_path in self.collect_package_files(package_name, components):
+            try:
+                rendered.append(self.render_file(source, rel_path, model_override))
+            except Exception as e:
+                self.log("error", f"Error copying {rel_path}: {e}")
+                success = False
+        return rendered, success
+
+    def write_rendered(
+        self, rendered: List[RenderedFile], target_dir: Path
+    ) -> Tuple[List[Path], bool]:
+        """
+        Write rendered files into a target directory.
+
+        Args:
+            rendered: Files produced by ``render_package``/``render_file``
+            target_dir: Target installation directory
 
-        return success
+        Returns:
+            Tuple of (relative paths written, True if no write failed)
+        """
+        # Ensure base directories exist
+        try:
+            for base_dir in ["agents", "skills", "commands"]:
+                (target_dir / base_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.log("error", f"Error creating {target_dir}: {e}")
+            return [], False
+
+        success = True
+        written = []
+        created_dirs = set()
+
+        for item in rendered:
+            target_path = target_dir / item.rel_path
+
+            try:
+                # Create parent directories
+                if target_path.parent not in created_dirs:
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_path.parent)
+
+                # Check for conflicts
+                if target_path.exists() and not self._can_overwrite(target_path):
+                    self.log("warning", f"Warning: {target_path} was modified locally, skipping")
+                    continue
+
+                self._write_file(item, target_path)
+                written.append(item.rel_path)
+            except Exception as e:
+                self.log("error", f"Error copying {item.rel_path}: {e}")
+                success = False
+
+        return written, success
 
     def uninstall_package(self, package_name: str, dry_run: bool = False) -> bool:
         """
@@ -115,40 +454,85 @@ class CopyManager:
         package_path = self.registry_path / package_name
 
         if not package_path.exists():
-            console.print(f"[yellow]Warning:[/yellow] Package directory not found: {package_path}")
+            self.log("warning", f"Warning: Package directory not found: {package_path}")
             return True
 
-        # Find and remove files that exist in both registry and target
-        removed_count = 0
-
-        for item in package_path.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(package_path)
-                target_path = self.target_dir / rel_path
-
-                if target_path.exists():
-                    if dry_run:
-                        console.print(f"[yellow]Would remove:[/yellow] {rel_path}")
-                        removed_count += 1
-                    else:
-                        target_path.unlink()
-                        removed_count += 1
-
-        # Clean up empty directories
-        if not dry_run:
-            self._cleanup_empty_dirs(self.target_dir)
+        removed = self.remove_package_files(package_name, dry_run=dry_run)
 
         if dry_run:
-            console.print(f"\n[dim]Would remove {removed_count} files[/dim]")
+            for rel_path in removed:
+                self.log("warning", f"Would remove: {rel_path}")
+            self.log("info", "")
+            self.log("info", f"Would remove {len(removed)} files")
         else:
-            console.print(f"[dim]Removed {removed_count} files[/dim]")
+            self.log("info", f"Removed {len(removed)} files")
 
         return True
 
-    def detect_installed_components(self) -> Dict[str, List[str]]:
+    def remove_package_files(self, package_name: str, dry_run: bool = False) -> List[Path]:
+        """
+        Remove target files that exist in the package, then prune the directories
+        they leave empty.
+
+        Args:
+            package_name: Name of package directory
+            dry_run: If True, only report what would be removed
+
+        Returns:
+            Paths (relative to the target directory) removed, or that would be
+        """
+        package_path = self.registry_path / package_name
+        if not package_path.exists():
+            return []
+
+        # Remove files that exist in both registry and target
+        rel_paths = [
+            item.relative_to(package_path).as_posix()
+            for item in sorted(package_path.rglob("*"))
+            if item.is_file()
+        ]
+        return self.remove_files(rel_paths, dry_run=dry_run)
+
+    def remove_files(self, rel_paths: List[str], dry_run: bool = False) -> List[Path]:
+        """
+        Remove specific installed files and prune directories left empty.
+
+        Only the parent directories of removed files (and their ancestors up
+        to the target directory) are considered for pruning.
+
+        Args:
+            rel_paths: File paths relative to the target directory
+            dry_run: If True, only report what would be removed
+
+        Returns:
+            Paths that were removed (or would be); missing files are skipped
+        """
+        removed = []
+        for rel in rel_paths:
+            target_path = self.target_dir / rel
+            if target_path.is_file() or target_path.is_symlink():
+                if not self._can_overwrite(target_path):
+                    self.log("warning", f"Keeping locally modified {rel}")
+                    continue
+                if not dry_run:
+                    target_path.unlink()
+                removed.append(Path(rel))
+
+        if not dry_run:
+            self._prune_empty_dirs(self.target_dir / rel.parent for rel in removed)
+        return removed
+
+    def detect_installed_components(self, use_snapshot: bool = True) -> Dict[str, List[str]]:
         """
         Detect installed components by scanning target directory.
 
+        Directory listings are cached in a snapshot file keyed by directory
+        mtime, so only directories that changed since the last call are
+        rescanned.
+
+        Args:
+            use_snapshot: If False, ignore the snapshot and rescan everything
+
         Returns:
             Dictionary mapping component types to lists of component IDs
         """
@@ -157,43 +541,107 @@ class CopyManager:
         if not self.target_dir.exists():
             return installed
 
+        previous = self._load_snapshot() if use_snapshot else {}
+        scanned_at = time.time_ns()
+        current: Dict[str, Dict[str, Any]] = {}
+
+        def scan(directory: Path, scanner) -> List[str]:
+            try:
+                mtime = directory.stat().st_mtime_ns
+            except OSError:
+                return []
+
+            key = directory.relative_to(self.target_dir).as_posix()
+            cached = previous.get("dirs", {}).get(key)
+            # Directories modified close to the previous scan may change again
+            # within the same mtime tick, so they are always rescanned
+            if (
+                cached
+                and cached["mtime"] == mtime
+                and mtime < previous.get("scannedAt", 0) - self.SNAPSHOT_RACY_WINDOW_NS
+            ):
+                entries = cached["entries"]
+            else:
+                entries = scanner(directory)
+
+            current[key] = {"mtime": mtime, "entries": entries}
+            return entries
+
         # Check agent directory for primary agents
         agent_dir = self.target_dir / "agents"
-        if agent_dir.exists():
-            for item in agent_dir.iterdir():
-                # Skip special directories like _shared, subagents, and hidden files
-                if item.name.startswith("_") or item.name == "subagents":
-                    continue
-                if item.is_file() and item.suffix == ".md":
-                    installed["agents"].append(item.stem)
-
-            # Check for subagents directory
-            subagent_dir = agent_dir / "subagents"
-            if subagent_dir.exists() and subagent_dir.is_dir():
-                for category_dir in subagent_dir.iterdir():
-                    if category_dir.is_dir():
-                        for subagent_file in category_dir.glob("*.md"):
-                            if not subagent_file.name.startswith("."):
-                                installed["subagents"].append(subagent_file.stem)
+        installed["agents"] = scan(agent_dir, self._scan_agent_dir)
+
+        # Check for subagents directory
+        subagent_dir = agent_dir / "subagents"
+        for category in scan(subagent_dir, self._scan_subdirs):
+            installed["subagents"].extend(scan(subagent_dir / category, self._scan_md_files))
 
         # Check skill directory
         skill_dir = self.target_dir / "skills"
-        if skill_dir.exists():
-            for item in skill_dir.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    # Check if SKILL.md exists
-                    if (item / "SKILL.md").exists():
-                        installed["skills"].append(item.name)
+        for skill in scan(skill_dir, self._scan_subdirs):
+            installed["skills"].extend(scan(skill_dir / skill, self._scan_skill_dir))
 
         # Check command directory
-        command_dir = self.target_dir / "commands"
-        if command_dir.exists():
-            for item in command_dir.iterdir():
-                if item.is_file() and item.suffix == ".md" and not item.name.startswith("."):
-                    installed["commands"].append(item.stem)
+        installed["commands"] = scan(self.target_dir / "commands", self._scan_md_files)
+
+        if use_snapshot and current != previous.get("dirs"):
+            self._save_snapshot({"scannedAt": scanned_at, "dirs": current})
 
         return installed
 
+    @staticmethod
+    def _scan_agent_dir(directory: Path) -> List[str]:
+        """List primary agent IDs, skipping special directories like _shared and subagents."""
+        return sorted(
+            entry.name[: -len(".md")]
+            for entry in os.scandir(directory)
+            if not entry.name.startswith(("_", "."))
+            and entry.name.endswith(".md")
+            and entry.is_file()
+        )
+
+    @staticmethod
+    def _scan_md_files(directory: Path) -> List[str]:
+        """List IDs of markdown components (subagents, commands) in a directory."""
+        return sorted(
+            entry.name[: -len(".md")]
+            for entry in os.scandir(directory)
+            if not entry.name.startswith(".") and entry.name.endswith(".md") and entry.is_file()
+        )
+
+    @staticmethod
+    def _scan_subdirs(directory: Path) -> List[str]:
+        """List visible subdirectory names (subagent categories, skills)."""
+        return sorted(
+            entry.name
+            for entry in os.scandir(directory)
+            if not entry.name.startswith(".") and entry.is_dir()
+        )
+
+    @staticmethod
+    def _scan_skill_dir(directory: Path) -> List[str]:
+        """Return the skill ID if the directory contains a SKILL.md."""
+        return [directory.name] if (directory / "SKILL.md").exists() else []
+
+    def _load_snapshot(self) -> Dict[str, Any]:
+        """Load the detection snapshot, ignoring missing or corrupt files."""
+        try:
+            with open(self.snapshot_path, "r") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if snapshot.get("version") != self.SNAPSHOT_VERSION:
+            return {}
+        return snapshot
+
+    def _save_snapshot(self, snapshot: Dict[str, Any]):
+        """Persist the detection snapshot; failures only cost a rescan next time."""
+        try:
+            with open(self.snapshot_path, "w") as f:
+                json.dump({"version": self.SNAPSHOT_VERSION, **snapshot}, f)
+        except OSError:
+            pass
+
     def get_installed_metadata(self, component_path: Path) -> Dict[str, Any]:
         """
         Extract metadata from installed component.
@@ -213,11 +661,11 @@ class CopyManager:
 
         return {}
 
-    def _copy_and_process_file(
-        self, source: Path, dest: Path, model_override: Optional[str] = None
-    ):
+    def render_file(
+        self, source: Path, rel_path: Path, model_override: Optional[str] = None
+    ) -> RenderedFile:
         """
-        Copy file and process templates if applicable.
+        Render one registry file.
 
         Source files use ``model_tier: "high|medium|low"`` as a placeholder.
         During install that line is replaced with ``model: <resolved-value>``
@@ -225,44 +673,90 @@ class CopyManager:
 
         Args:
             source: Source file path
-            dest: Destination file path
+            rel_path: Destination path relative to the target directory
             model_override: Optional literal model string; skips tier resolution
+
+        Returns:
+            Rendered file; files that are not templates keep ``content=None``
         """
         if not self.template_engine.should_process_file(str(source)):
-            shutil.copy2(source, dest)
-            return
-
-        import re
+            return RenderedFile(rel_path, source)
 
         with open(source, "r", encoding="utf-8") as f:
-            content = f.read()
+            text = f.read()
+        return self._transform(text, source, rel_path, self.template_engine, model_override)
+
+    def _transform(
+        self,
+        text: str,
+        source: Path,
+        rel_path: Path,
+        engine: TemplateEngine,
+        model_override: Optional[str] = None,
+    ) -> RenderedFile:
+        """Run file text through the transform pipeline with one engine's tiers."""
+        context = TransformContext(rel_path, source, engine, model_override)
+        content = self.pipeline.run(text, context)
+        for level, message in context.messages:
+            self.log(level, message)
+        return RenderedFile(rel_path, source, content, context.tiers, context.includes)
+
+    def rerender_files(
+        self, rel_paths: List[str], model_override: Optional[str] = None
+    ) -> List[Path]:
+        """
+        Render selected files again and overwrite them in the target directory.
 
-        tier_pattern = re.compile(r'^model_tier:\s*["\']?(\w+)["\']?\s*$', re.MULTILINE)
+        Used after a model tier changes, to update only the files whose
+        content depends on that tier.
+        ``tier_index`` is set to the tiers of the files rewritten.
+
+        Args:
+            rel_paths: Paths relative to the target (and package) directory
+            model_override: Model override the files were installed with
 
-        if model_override:
-            # Explicit override: replace model_tier: with model: <override>
-            # or inject if not present
-            if tier_pattern.search(content):
-                content = tier_pattern.sub(f"model: {model_override}", content)
+        Returns:
+            Paths that were rewritten; files gone from the registry are skipped
+        """
+        package_path = self.registry_path / "opencode"
+        rendered = []
+        for rel in rel_paths:
+            source = package_path / rel
+            if not source.is_file():
+                self.log("warning", f"Warning: {rel} is no longer in the registry, skipping")
+                continue
+            try:
+                rendered.append(self.render_file(source, Path(rel), model_override))
+            except Exception as e:
+                self.log("error", f"Error rendering {rel}: {e}")
+
+        written, _ = self.write_rendered(rendered, self.target_dir)
+        kept = {path.as_posix() for path in written}
+        self.tier_index = build_tier_index(
+            [item for item in rendered if item.rel_path.as_posix() in kept]
+        )
+        return written
+
+    def _write_file(self, rendered: RenderedFile, dest: Path):
+        """Write a rendered file, copying non-template files verbatim."""
+        if self.store is not None:
+            if rendered.content is None:
+                blob = self.store.put_file(rendered.source)
             else:
-                content = content.replace("---\n", f"---\nmodel: {model_override}\n", 1)
-        else:
-            # Resolve model_tier → model via configured tiers
-            def resolve_tier(match: re.Match) -> str:
-                tier = match.group(1)
-                resolved = self.template_engine.resolve_model(tier)
-                return f"model: {resolved}"
+                blob = self.store.put_bytes(rendered.content.encode("utf-8"))
+            self.store.link(blob, dest)
+            return
 
-            content = tier_pattern.sub(resolve_tier, content)
+        # Never write through a hard link into the object store
+        if dest.is_file() and dest.stat().st_nlink > 1:
+            dest.unlink()
 
-        # Process any remaining {{tier:X}} / {{model:X}} templates
-        try:
-            content = self.template_engine.process_content(content)
-        except ValueError as e:
-            console.print(f"[yellow]Warning processing {source}:[/yellow] {e}")
+        if rendered.content is None:
+            shutil.copy2(rendered.source, dest)
+            return
 
         with open(dest, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.write(rendered.content)
 
     def _can_overwrite(self, path: Path) -> bool:
         """
@@ -272,22 +766,37 @@ class CopyManager:
             path: File path to check
 
         Returns:
-            True if file can be overwritten
+            False if the file is one of ``modified_files``
         """
-        # For now, allow overwrite (user should backup if needed)
-        # Future: could check if file was modified by user
-        return True
+        try:
+            rel = path.relative_to(self.target_dir).as_posix()
+        except ValueError:
+            return True
+        return rel not in self.modified_files
 
-    def _cleanup_empty_dirs(self, base_dir: Path):
+    def _prune_empty_dirs(self, directories):
         """
-        Remove empty directories recursively.
+        Remove empty directories and their emptied ancestors inside the target.
 
         Args:
-            base_dir: Base directory to clean
+            directories: Directories that may have become empty
         """
-        for dirpath in sorted(base_dir.rglob("*"), reverse=True):
-            if dirpath.is_dir() and not any(dirpath.iterdir()):
-                try:
-                    dirpath.rmdir()
-                except OSError:
-                    pass
+        # Deepest first, so a parent is only tried once all its children were
+        heap = []
+        queued = set()
+
+        def push(directory: Path):
+            if directory not in queued and self.target_dir in directory.parents:
+                queued.add(directory)
+                heapq.heappush(heap, (-len(directory.parts), str(directory), directory))
+
+        for directory in directories:
+            push(directory)
+
+        while heap:
+            directory = heapq.heappop(heap)[2]
+            try:
+                directory.rmdir()  # Fails unless empty
+            except OSError:
+                continue
+            push(directory.parent)
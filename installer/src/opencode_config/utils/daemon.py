@@ -0,0 +1,258 @@
+"""
+Resident catalog daemon and its client.
+
+``opencode-config serve`` keeps the registry catalog, the installation
+database and the configuration in memory and answers queries over a Unix
+socket. Read-only commands ask the daemon first and fall back to loading
+everything in-process when it is not running.
+
+Cached objects are validated with ``stat`` calls on every query, so edits to
+the registry, the database or the configuration are picked up immediately.
+"""
+
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import Config
+from .installed_db import InstalledDB
+
+SOCKET_FILENAME = "opencode-registry.sock"
+SOCKET_ENV = "OPENCODE_CONFIG_SOCKET"
+DISABLE_ENV = "OPENCODE_CONFIG_NO_DAEMON"
+
+# Queries are answered from memory; anything slower means the daemon is stuck
+CLIENT_TIMEOUT = 2.0
+
+
+def socket_path() -> Path:
+    """Get the daemon socket path (``$OPENCODE_CONFIG_SOCKET`` overrides the default)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".config" / "opencode" / SOCKET_FILENAME
+
+
+def request(op: str, path: Optional[Path] = None, **params) -> Optional[Any]:
+    """
+    Send a query to the daemon.
+
+    Args:
+        op: Query name (ping, config, installed, catalog, component, shutdown)
+        path: Socket path (defaults to ``socket_path()``)
+        **params: Query parameters
+
+    Returns:
+        Query result, or None if the daemon is not running or the query failed
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+
+    path = path or socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"op": op, **params}).encode() + b"\n")
+                stream.flush()
+                response = json.loads(stream.readline())
+    except (OSError, ValueError):
+        return None
+
+    if not response.get("ok"):
+        return None
+    return response.get("result")
+
+
+def load_config() -> Config:
+    """Get the configuration from the daemon, or load it from disk."""
+    config_file = _default_config_file()
+    data = request("config", file=str(config_file))
+    if data is None:
+        return Config(config_file)
+    return Config(config_file, data=data)
+
+
+def load_installed_db() -> InstalledDB:
+    """Get the installation database from the daemon, or load it from disk."""
+    db_path = _default_db_path()
+    data = request("installed", file=str(db_path))
+    if data is None:
+        return InstalledDB(db_path)
+    return InstalledDB(db_path, data=data)
+
+
+def load_catalog(registry_path: Path):
+    """Get the registry catalog from the daemon, or scan the registry."""
+    from .catalog import Catalog
+
+    data = request("catalog", registry=str(registry_path))
+    if data is None:
+        return Catalog.scan(registry_path)
+    return Catalog.from_dict(data)
+
+
+def load_component(registry_path: Path, component_id: str):
+    """Look up one component through the daemon, or probe the registry for it."""
+    from .catalog import CatalogEntry, find_component
+
+    data = request("component", registry=str(registry_path), id=component_id)
+    if data is None:
+        return find_component(registry_path, component_id)
+    entry = data.get("entry")
+    return CatalogEntry.from_dict(entry) if entry else None
+
+
+def _default_config_file() -> Path:
+    return Path.home() / ".config" / "opencode" / "opencode-registry-config.json"
+
+
+def _default_db_path() -> Path:
+    return Path.home() / ".config" / "opencode" / "opencode-registry-installed.json"
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Identify a file version by mtime and size (None if missing)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class CatalogServer:
+    """In-memory state served by the daemon."""
+
+    def __init__(self):
+        # key -> (stamp, value); stamps are compared on every query
+        self._configs: Dict[str, Tuple[Any, Config]] = {}
+        self._dbs: Dict[str, Tuple[Any, InstalledDB]] = {}
+        self._catalogs: Dict[str, Tuple[Any, Any]] = {}
+        self.shutdown_requested = False
+
+    def handle(self, message: Dict[str, Any]) -> Any:
+        """
+        Answer one query.
+
+        Args:
+            message: Decoded request with an ``op`` key and its parameters
+
+        Returns:
+            JSON-compatible result
+
+        Raises:
+            ValueError: If the query is unknown or malformed
+        """
+        op = message.get("op")
+        if op == "ping":
+            return {"pid": os.getpid()}
+        if op == "config":
+            return self.config(Path(message["file"])).data
+        if op == "installed":
+            return self.installed_db(Path(message["file"])).data
+        if op == "catalog":
+            return self.catalog(Path(message["registry"])).to_dict()
+        if op == "component":
+            entry = self.catalog(Path(message["registry"])).get(message["id"])
+            return {"entry": entry.to_dict() if entry else None}
+        if op == "shutdown":
+            self.shutdown_requested = True
+            return {}
+        raise ValueError(f"Unknown query: {op}")
+
+    def config(self, config_file: Path) -> Config:
+        """Get a cached Config, reloading it if the file changed."""
+        return self._cached(
+            self._configs,
+            str(config_file),
+            lambda: _file_stamp(config_file),
+            lambda: Config(config_file),
+        )
+
+    def installed_db(self, db_path: Path) -> InstalledDB:
+        """Get a cached InstalledDB, reloading it if the file changed."""
+        return self._cached(
+            self._dbs, str(db_path), lambda: _file_stamp(db_path), lambda: InstalledDB(db_path)
+        )
+
+    def catalog(self, registry_path: Path):
+        """Get a cached Catalog, rescanning it if any component changed."""
+        from .catalog import Catalog
+
+        key = str(registry_path)
+        cached = self._catalogs.get(key)
+        if cached is not None and cached[1].fingerprint() == cached[0]:
+            return cached[1]
+
+        catalog = Catalog.scan(registry_path)
+        self._catalogs[key] = (catalog.fingerprint(), catalog)
+        return catalog
+
+    @staticmethod
+    def _cached(cache: Dict[str, Tuple[Any, Any]], key: str, stamp: Callable, load: Callable):
+        current = stamp()
+        cached = cache.get(key)
+        if cached is not None and cached[0] == current:
+            return cached[1]
+        value = load()
+        cache[key] = (current, value)
+        return value
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server: "DaemonServer" = self.server  # type: ignore[assignment]
+        try:
+            message = json.loads(self.rfile.readline())
+            response = {"ok": True, "result": server.state.handle(message)}
+        except Exception as e:  # report any failure to the client instead of dying
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server answering queries one at a time from a CatalogServer."""
+
+    def __init__(self, path: Path, state: Optional[CatalogServer] = None):
+        """
+        Bind the daemon socket.
+
+        Args:
+            path: Socket path; a stale socket left by a dead daemon is replaced
+            state: In-memory state to serve (a fresh CatalogServer by default)
+
+        Raises:
+            RuntimeError: If another daemon is already serving on the path
+        """
+        if path.exists():
+            if request("ping", path=path) is not None:
+                raise RuntimeError(f"A daemon is already running on {path}")
+            path.unlink()
+
+        self.path = path
+        self.state = state or CatalogServer()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(path), _RequestHandler)
+        os.chmod(path, 0o600)
+
+    def serve_until_shutdown(self):
+        """Serve queries until a shutdown query arrives."""
+        try:
+            while not self.state.shutdown_requested:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
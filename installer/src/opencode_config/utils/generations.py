@@ -0,0 +1,219 @@
+"""
+Generation-based installs with atomic switching and rollback.
+
+With generations enabled, each install or update is written into a fresh
+directory ``opencode-registry-generations/<N>`` instead of the live tree. The
+managed subtrees of the target (``agents``, ``skills``, ``commands``) are
+symlinks through ``opencode-registry-generations/current``, so activating a
+generation (or rolling back to an earlier one) is a single atomic rename of
+that ``current`` symlink. A running opencode session sees either the old tree
+or the new one, never a half-written mix.
+
+A new generation starts as a hard-linked clone of the current one, so files
+the installer does not manage survive and share storage with the previous
+generation. Writes into a generation never go through those links (see
+``CopyManager._write_file``), so older generations stay intact.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .copy import CopyManager
+from .installed_db import DB_FILENAME
+from .verify import MANAGED_DIRS
+
+GENERATIONS_DIRNAME = "opencode-registry-generations"
+CURRENT_LINK = "current"
+
+
+class Generations:
+    """Generations of one installation target."""
+
+    def __init__(self, target_dir: Path):
+        """
+        Initialize generations for a target.
+
+        Args:
+            target_dir: Installation directory
+        """
+        self.target_dir = target_dir
+        self.root = target_dir / GENERATIONS_DIRNAME
+        self.current_link = self.root / CURRENT_LINK
+
+    def list(self) -> List[int]:
+        """Get existing generation numbers, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(int(path.name) for path in self.root.iterdir() if path.name.isdigit())
+
+    def current(self) -> Optional[int]:
+        """Get the active generation number, or None if generations are not in use."""
+        try:
+            return int(os.readlink(self.current_link))
+        except (OSError, ValueError):
+            return None
+
+    def path(self, number: int) -> Path:
+        """Get the directory of a generation."""
+        return self.root / str(number)
+
+    def prepare(self) -> Tuple[int, Path]:
+        """
+        Create the next generation as a hard-linked clone of the live tree.
+
+        Returns:
+            Tuple of (generation number, generation directory)
+        """
+        existing = self.list()
+        number = existing[-1] + 1 if existing else 1
+        path = self.path(number)
+        path.mkdir(parents=True)
+
+        for name in MANAGED_DIRS:
+            source = self.target_dir / name
+            if source.is_dir():
+                _clone_tree(source.resolve(), path / name)
+        return number, path
+
+    def activate(self, number: int):
+        """
+        Make a generation the live tree.
+
+        The first activation replaces the target's real managed directories
+        with symlinks through ``current`` (their content was cloned into the
+        generation by ``prepare``).
+
+        Args:
+            number: Generation to activate
+
+        Raises:
+            ValueError: If the generation does not exist
+        """
+        if not self.path(number).is_dir():
+            raise ValueError(f"Generation {number} does not exist")
+
+        _replace_symlink(self.current_link, str(number))
+        for name in MANAGED_DIRS:
+            (self.path(number) / name).mkdir(exist_ok=True)
+            link = self.target_dir / name
+            target = os.path.join(GENERATIONS_DIRNAME, CURRENT_LINK, name)
+            if link.is_symlink():
+                if os.readlink(link) == target:
+                    continue
+            elif link.is_dir():
+                # Move the real directory aside before linking, then drop it
+                aside = link.with_name(f".{name}.pre-generations")
+                os.replace(link, aside)
+                _replace_symlink(link, target)
+                shutil.rmtree(aside)
+                continue
+            _replace_symlink(link, target)
+
+    def discard(self, number: int):
+        """Delete a generation that was prepared but not activated."""
+        if number != self.current():
+            _remove_tree(self.path(number))
+
+    def previous(self) -> Optional[int]:
+        """Get the newest generation older than the active one."""
+        current = self.current()
+        older = [number for number in self.list() if current is None or number < current]
+        return older[-1] if older else None
+
+    def prune(self, keep: int) -> List[int]:
+        """
+        Delete the oldest generations, keeping ``keep`` and always the active one.
+
+        Args:
+            keep: Number of generations to keep
+
+        Returns:
+            Deleted generation numbers
+        """
+        current = self.current()
+        candidates = [number for number in self.list() if number != current]
+        excess = len(candidates) - max(keep - 1, 0)
+        deleted = candidates[:excess] if excess > 0 else []
+        for number in deleted:
+            _remove_tree(self.path(number))
+        return deleted
+
+    def save_db(self, number: int, data: Dict[str, Any]):
+        """Store the installation database as of a generation, for rollback."""
+        with open(self.path(number) / DB_FILENAME, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def load_db(self, number: int) -> Optional[Dict[str, Any]]:
+        """Get the installation database stored with a generation, if any."""
+        try:
+            with open(self.path(number) / DB_FILENAME, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+def install_generation(
+    manager: CopyManager, keep: int, apply: Callable[[CopyManager], bool]
+) -> Optional[int]:
+    """
+    Apply an install or update to a new generation and activate it on success.
+
+    Args:
+        manager: CopyManager for the live target
+        keep: Number of generations to keep
+        apply: Performs the install against the CopyManager it is given
+
+    Returns:
+        The activated generation, or None if apply failed (the new
+        generation is then discarded and the live tree is untouched)
+    """
+    generations = Generations(manager.target_dir)
+    number, path = generations.prepare()
+
+    generation_manager = CopyManager(
+        manager.registry_path,
+        path,
+        manager.config,
+        snapshot_path=manager.snapshot_path,
+        log=manager.log,
+    )
+    generation_manager.modified_files = manager.modified_files
+    if not apply(generation_manager):
+        generations.discard(number)
+        return None
+
+    manager.tier_index = generation_manager.tier_index
+    generations.activate(number)
+    generations.prune(keep)
+    return number
+
+
+def _clone_tree(source: Path, dest: Path):
+    """Recreate a directory tree with hard links to its files."""
+    for dirpath, _, filenames in os.walk(source):
+        rel_dir = Path(dirpath).relative_to(source)
+        (dest / rel_dir).mkdir(parents=True, exist_ok=True)
+        for name in filenames:
+            src = Path(dirpath) / name
+            try:
+                os.link(src, dest / rel_dir / name)
+            except OSError:
+                shutil.copy2(src, dest / rel_dir / name)
+
+
+def _replace_symlink(link: Path, target: str):
+    """Point a symlink at target atomically (create, then rename over)."""
+    tmp = link.with_name(f".{link.name}.{os.getpid()}.tmp")
+    if tmp.is_symlink():
+        tmp.unlink()
+    os.symlink(target, tmp)
+    os.replace(tmp, link)
+
+
+def _remove_tree(path: Path):
+    """Delete a generation directory if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path)
@@ -0,0 +1,177 @@
+"""
+Dependency graph between registry components.
+
+A component depends on the IDs listed in its ``dependencies`` frontmatter and
+on every subagent it can delegate to. Delegation targets are referenced by
+path (``subagents/03-infrastructure/terraform-expert``) either in the
+component's own body or in the ``_shared/*.md`` files the body points to,
+which may in turn point to further shared files.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .catalog import Catalog
+
+SUBAGENT_REF = re.compile(r"\bsubagents/[\w.-]+/([\w.-]+)")
+SHARED_REF = re.compile(r"\b_shared/([\w.-]+\.md)")
+
+
+class CycleError(ValueError):
+    """Raised when components depend on each other in a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+
+
+class DependencyGraph:
+    """Component ID → IDs it depends on."""
+
+    def __init__(self, edges: Dict[str, Set[str]]):
+        """
+        Initialize graph.
+
+        Args:
+            edges: Component ID → IDs of the components it depends on. Every
+                node must be a key; references to unknown IDs are dropped
+                and kept in ``unresolved``.
+        """
+        self.edges: Dict[str, Set[str]] = {}
+        self.unresolved: Dict[str, Set[str]] = {}
+        for node, deps in edges.items():
+            self.edges[node] = {dep for dep in deps if dep in edges and dep != node}
+            missing = {dep for dep in deps if dep not in edges}
+            if missing:
+                self.unresolved[node] = missing
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog) -> "DependencyGraph":
+        """
+        Build the graph from frontmatter dependencies and delegation references.
+
+        Each component file and each shared file is read once.
+
+        Args:
+            catalog: Registry catalog
+
+        Returns:
+            DependencyGraph
+        """
+        shared_dir = catalog.registry_path / "opencode" / "agents" / "_shared"
+        shared_cache: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+        def delegates(text: str) -> Set[str]:
+            # Subagents referenced by text, directly or through shared files
+            found = {_strip_md(ref) for ref in SUBAGENT_REF.findall(text)}
+            queue = list(SHARED_REF.findall(text))
+            seen: Set[str] = set()
+            while queue:
+                name = queue.pop()
+                if name in seen:
+                    continue
+                seen.add(name)
+                if name not in shared_cache:
+                    shared_text = _read(shared_dir / name)
+                    shared_cache[name] = (
+                        {_strip_md(ref) for ref in SUBAGENT_REF.findall(shared_text)},
+                        set(SHARED_REF.findall(shared_text)),
+                    )
+                subagents, shared = shared_cache[name]
+                found |= subagents
+                queue.extend(shared - seen)
+            return found
+
+        edges: Dict[str, Set[str]] = {}
+        for entry in catalog.entries:
+            deps = edges.setdefault(entry.manifest.id, set())
+            deps.update(_strip_md(Path(dep).name) for dep in entry.manifest.dependencies or [])
+            deps |= delegates(_read(entry.path))
+
+        return cls(edges)
+
+    def closure(self, roots: Iterable[str]) -> Set[str]:
+        """
+        Get components and everything they transitively depend on.
+
+        Args:
+            roots: Component IDs
+
+        Returns:
+            Set of component IDs including the roots
+
+        Raises:
+            KeyError: If a root is not in the graph
+        """
+        result: Set[str] = set()
+        stack = list(roots)
+        for root in stack:
+            if root not in self.edges:
+                raise KeyError(root)
+        while stack:
+            node = stack.pop()
+            if node in result:
+                continue
+            result.add(node)
+            stack.extend(self.edges[node] - result)
+        return result
+
+    def layers(self, nodes: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """
+        Order components so that dependencies come first.
+
+        Components in the same layer do not depend on each other, so each
+        layer can be installed in parallel once the previous ones are done.
+
+        Args:
+            nodes: Components to order (default: the whole graph); dependencies
+                outside this set are ignored
+
+        Returns:
+            Layers of sorted component IDs
+
+        Raises:
+            CycleError: If the components depend on each other in a cycle
+        """
+        remaining = set(self.edges if nodes is None else nodes)
+        pending = {node: self.edges[node] & remaining for node in remaining}
+        layers = []
+        while pending:
+            ready = sorted(node for node, deps in pending.items() if not deps)
+            if not ready:
+                raise CycleError(self._find_cycle(pending))
+            layers.append(ready)
+            for node in ready:
+                del pending[node]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return layers
+
+    def order(self, nodes: Optional[Iterable[str]] = None) -> List[str]:
+        """Get components in topological order (dependencies first)."""
+        return [node for layer in self.layers(nodes) for node in layer]
+
+    @staticmethod
+    def _find_cycle(pending: Dict[str, Set[str]]) -> List[str]:
+        """Walk unresolved dependencies until a node repeats; every node left has one."""
+        path: List[str] = []
+        position: Dict[str, int] = {}
+        node = min(pending)
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = min(pending[node])
+        return path[position[node] :] + [node]
+
+
+def _read(path: Path) -> str:
+    """Read a file for references, treating unreadable files as empty."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _strip_md(name: str) -> str:
+    return name[:-3] if name.endswith(".md") else name
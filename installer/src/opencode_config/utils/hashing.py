@@ -0,0 +1,35 @@
+"""
+Content hashing for lockfiles and installed-file verification.
+"""
+
+import hashlib
+from pathlib import Path
+
+# 128-bit BLAKE2b digests: fast, and collisions are not a practical concern here
+DIGEST_SIZE = 16
+CHUNK_SIZE = 1 << 20
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash a byte string and return the hex digest."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """
+    Hash a file's content in chunks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,131 @@
+"""
+``{{include:_shared/x.md}}`` directives.
+
+Paths are relative to the package's ``agents/`` directory, where shared
+fragments live. With ``"includes": "inline"`` (the default) the directive is
+replaced by the fragment's content without its frontmatter, expanding
+includes inside fragments too, so opencode needs no extra file read at
+runtime. With ``"reference"`` it becomes a pointer to the installed fragment
+(``See `_shared/x.md`.``).
+
+Fragments are read through ``FRAGMENTS``, which keeps each one in memory
+until its size or mtime changes: rendering many files that include the
+same fragments reads every fragment once per run.
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .manifest import split_frontmatter
+
+INCLUDE_PATTERN = re.compile(r"\{\{include:([^\}\s]+)\}\}")
+INCLUDE_MODES = ("inline", "reference")
+
+
+class FragmentCache:
+    """Thread-safe in-memory cache of fragment files, validated by stat."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self.reads = 0  # Files actually read, for profiling and tests
+
+    def read(self, path: Path) -> str:
+        """
+        Get a fragment's content, reading the file only if it changed.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                return entry[1]
+        text = path.read_text(encoding="utf-8")
+        with self._lock:
+            self._entries[path] = (key, text)
+            self.reads += 1
+        return text
+
+    def discard(self, path: Path):
+        """Forget a file, e.g. when a watcher saw it change within one mtime tick."""
+        with self._lock:
+            self._entries.pop(path.resolve(), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.reads = 0
+
+
+FRAGMENTS = FragmentCache()
+
+
+@dataclass
+class Expansion:
+    """Text with include directives expanded."""
+
+    text: str
+    included: List[str] = field(default_factory=list)  # Fragments inlined, agents/-relative
+    problems: List[str] = field(default_factory=list)  # Directives left as written
+
+
+def expand_includes(
+    text: str, agents_dir: Path, mode: str = "inline", cache: FragmentCache = FRAGMENTS
+) -> Expansion:
+    """
+    Expand ``{{include:...}}`` directives.
+
+    Directives that point outside ``agents_dir``, at missing files, or back
+    at a fragment being expanded are left as written and reported.
+
+    Args:
+        text: File content
+        agents_dir: The package's ``agents/`` directory
+        mode: "inline" or "reference"
+        cache: Fragment cache to read through
+
+    Returns:
+        Expansion
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in INCLUDE_MODES:
+        raise ValueError(f"Unknown include mode '{mode}' (use {', '.join(INCLUDE_MODES)})")
+    expansion = Expansion(text)
+    root = agents_dir.resolve()
+
+    def expand(content: str, stack: Tuple[str, ...]) -> str:
+        def replace(match: "re.Match") -> str:
+            name = match.group(1)
+            path = (agents_dir / name).resolve()
+            if root not in path.parents:
+                expansion.problems.append(f"include outside agents/: {name}")
+                return match.group(0)
+            if mode == "reference":
+                return f"See `{name}`."
+            if name in stack:
+                expansion.problems.append(f"include cycle: {' -> '.join(stack + (name,))}")
+                return match.group(0)
+            try:
+                fragment = cache.read(path)
+            except (OSError, UnicodeDecodeError) as e:
+                expansion.problems.append(f"cannot include {name}: {e}")
+                return match.group(0)
+            if name not in expansion.included:
+                expansion.included.append(name)
+            # Fragment frontmatter describes the file, not the including prompt
+            _, body = split_frontmatter(fragment)
+            body = body.strip("\n")
+            return expand(body, stack + (name,))
+
+        return INCLUDE_PATTERN.sub(replace, content)
+
+    expansion.text = expand(text, ())
+    return expansion
@@ -3,18 +3,25 @@ Installation database (installed.json) management.
 """
 
 import json
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import platform
 
+DB_FILENAME = "opencode-registry-installed.json"
+
 
 class InstalledDB:
     """Manages the installed.json database."""
 
-    def __init__(self, db_path: Optional[Path] = None):
-        self.db_path = db_path or (Path.home() / ".config" / "opencode" / "opencode-registry-installed.json")
-        self.data = self._load()
+    def __init__(self, db_path: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
+        self.db_path = db_path or (Path.home() / ".config" / "opencode" / DB_FILENAME)
+        # Pre-loaded data (e.g. served by the daemon) skips reading the file
+        self.data = data if data is not None else self._load()
+        # Inside batch(), saves are deferred until the outermost block ends
+        self._batch_depth = 0
+        self._save_pending = False
 
     def _load(self) -> Dict[str, Any]:
         """Load database from file or create default."""
@@ -43,11 +50,37 @@ class InstalledDB:
 
     def save(self):
         """Save database to file."""
+        if self._batch_depth:
+            self._save_pending = True
+            return
         self.data["lastUpdated"] = self._timestamp()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.db_path, "w") as f:
             json.dump(self.data, f, indent=2)
 
+    @contextmanager
+    def batch(self) -> Iterator["InstalledDB"]:
+        """
+        Group several updates into a single write of the database file.
+
+        Updates made inside the block are saved once when it exits normally.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth and self._save_pending:
+            self._save_pending = False
+            self.save()
+
+    def restore(self, data: Dict[str, Any]):
+        """Replace the recorded installation state with a saved copy, keeping the action log."""
+        logs = self.data["logs"]
+        self.data = data
+        self.data["logs"] = logs
+        self.save()
+
     def _timestamp(self) -> str:
         """Get current timestamp in ISO format."""
         return datetime.utcnow().isoformat() + "Z"
@@ -73,10 +106,38 @@ class InstalledDB:
             f"{component_type}s" if not component_type.endswith("s") else component_type
         )
 
+        record = None
         if component_type_key in self.data["installed"]:
-            self.data["installed"][component_type_key].pop(component_id, None)
+            record = self.data["installed"][component_type_key].pop(component_id, None)
+
+        # Files the component owned no longer depend on any tier
+        self._forget_files((record or {}).get("files", []))
         self.save()
 
+    def forget_files(self, rel_paths: Iterable[str]):
+        """
+        Drop the tiers, file records and shared-file entries of removed files.
+
+        Args:
+            rel_paths: File paths relative to the target directory
+        """
+        self._forget_files(rel_paths)
+        self.save()
+
+    def _forget_files(self, rel_paths: Iterable[str]):
+        gone = set(rel_paths)
+        if not gone:
+            return
+        if "tierIndex" in self.data:
+            self.data["tierIndex"] = {
+                tier: [path for path in paths if path not in gone]
+                for tier, paths in self.data["tierIndex"].items()
+            }
+        if "sharedFiles" in self.data:
+            self.data["sharedFiles"] = [p for p in self.data["sharedFiles"] if p not in gone]
+        for path in gone:
+            self.data.get("fileRecords", {}).pop(path, None)
+
     def get_component(self, component_type: str, component_id: str) -> Optional[Dict[str, Any]]:
         """Get component metadata from database."""
         component_type_key = (
@@ -91,6 +152,13 @@ class InstalledDB:
                 return True
         return False
 
+    def get_component_type(self, component_id: str) -> Optional[str]:
+        """Get the type (agent, subagent, skill, command) of an installed component."""
+        for component_type, items in self.data["installed"].items():
+            if component_id in items:
+                return component_type.rstrip("s")
+        return None
+
     def get_installed_version(self, component_id: str) -> Optional[str]:
         """Get the installed version of a component."""
         for component_type in self.data["installed"].values():
@@ -148,37 +216,161 @@ class InstalledDB:
         self.data["registry"]["path"] = path
         self.save()
 
+    def set_file_ownership(self, rel_paths: List[str]):
+        """
+        Record which installed files belong to which component.
+
+        Each installed component's record gets a ``files`` list; files that
+        belong to no component (e.g. ``agents/_shared``) are kept as shared.
+
+        Args:
+            rel_paths: Installed file paths relative to the target directory
+        """
+        from .catalog import component_for_path
+
+        owned: Dict[Tuple[str, str], List[str]] = {}
+        shared = []
+        for rel in rel_paths:
+            owner = component_for_path(Path(rel))
+            if owner:
+                owned.setdefault((f"{owner[0]}s", owner[1]), []).append(rel)
+            else:
+                shared.append(rel)
+
+        for component_type, items in self.data["installed"].items():
+            for component_id, record in items.items():
+                files = owned.get((component_type, component_id))
+                if files is not None:
+                    record["files"] = sorted(files)
+        self.data["sharedFiles"] = sorted(shared)
+        self.save()
+
+    def set_tier_index(self, index: Dict[str, List[str]], model_override: Optional[str] = None):
+        """
+        Record which installed files resolved a model through each tier.
+
+        Args:
+            index: Tier name → file paths relative to the target directory
+            model_override: Model override the files were rendered with
+        """
+        self.data["tierIndex"] = index
+        self.data["modelOverride"] = model_override
+        self.save()
+
+    def update_tier_index(self, file_tiers: Dict[str, List[str]]):
+        """
+        Replace the tiers recorded for some files, leaving the rest of the index.
+
+        Args:
+            file_tiers: File path → tiers it now uses (empty for none)
+        """
+        index: Dict[str, List[str]] = {}
+        for tier, paths in self.data.get("tierIndex", {}).items():
+            index[tier] = [path for path in paths if path not in file_tiers]
+        for path, tiers in file_tiers.items():
+            for tier in tiers:
+                index.setdefault(tier, []).append(path)
+        self.data["tierIndex"] = {tier: sorted(paths) for tier, paths in index.items()}
+        self.save()
+
+    def get_files_for_tiers(self, tiers: List[str]) -> List[str]:
+        """Get installed files whose content depends on any of the given tiers."""
+        index = self.data.get("tierIndex", {})
+        return sorted({path for tier in tiers for path in index.get(tier, [])})
+
+    def get_model_override(self) -> Optional[str]:
+        """Get the model override used by the last install, if any."""
+        return self.data.get("modelOverride")
+
+    def set_file_records(self, records: Dict[str, Dict[str, Any]]):
+        """
+        Record the hash, size and mtime of each installed file.
+
+        Args:
+            records: Relative path → record, from ``verify.record_files``
+        """
+        self.data["fileRecords"] = records
+        self.save()
+
+    def get_file_records(self) -> Dict[str, Dict[str, Any]]:
+        """Get installed file records (empty if none were recorded)."""
+        return self.data.get("fileRecords", {})
+
     def sync_from_detected(
         self,
         detected_components: Dict[str, List[str]],
         install_method: str = "copy",
         component_versions: Optional[Dict[str, str]] = None,
-    ):
+        dry_run: bool = False,
+    ) -> Dict[str, List[str]]:
         """
-        Sync database from detected components on disk.
+        Incrementally sync database from detected components on disk.
+
+        New components are added and components no longer on disk are dropped.
+        Unchanged records keep their metadata (including ``installedAt``); a
+        record is only rewritten when its version or install method changed.
+        The database file is only written when something changed.
 
         Args:
             detected_components: Dict mapping component types to lists of IDs
             install_method: Installation method used
             component_versions: Optional dict mapping component IDs to their versions
+            dry_run: If True, compute the delta without modifying the database
+
+        Returns:
+            Dict with "added", "removed", "updated" and "unchanged" lists of component IDs
         """
-        # Clear existing components
-        self.data["installed"] = {"agents": {}, "subagents": {}, "skills": {}, "commands": {}}
-
-        # Add all detected components
-        for comp_type, comp_ids in detected_components.items():
-            for comp_id in comp_ids:
-                # Get version from component_versions dict if available, otherwise default to "1.0.0"
-                version = "1.0.0"
-                if component_versions and comp_id in component_versions:
-                    version = component_versions[comp_id]
-
-                self.data["installed"][comp_type][comp_id] = {
-                    "id": comp_id,
-                    "type": comp_type.rstrip("s"),
-                    "version": version,
-                    "installMethod": install_method,
-                    "installedAt": self._timestamp(),
-                }
+        component_versions = component_versions or {}
+        delta = {"added": [], "removed": [], "updated": [], "unchanged": []}
+        installed = self.data["installed"]
 
-        self.save()
+        comp_types = {"agents", "subagents", "skills", "commands"}
+        comp_types.update(installed, detected_components)
+
+        for comp_type in sorted(comp_types):
+            records = installed.get(comp_type, {})
+            detected_ids = set(detected_components.get(comp_type, []))
+            if not dry_run:
+                records = installed.setdefault(comp_type, records)
+
+            for comp_id in sorted(set(records) - detected_ids):
+                delta["removed"].append(comp_id)
+                if not dry_run:
+                    self._forget_files(records.pop(comp_id).get("files", []))
+
+            for comp_id in sorted(detected_ids):
+                record = records.get(comp_id)
+                if record is None:
+                    delta["added"].append(comp_id)
+                    if not dry_run:
+                        # Default to "1.0.0" when no version is known
+                        records[comp_id] = {
+                            "id": comp_id,
+                            "type": comp_type.rstrip("s"),
+                            "version": component_versions.get(comp_id, "1.0.0"),
+                            "installMethod": install_method,
+                            "installedAt": self._timestamp(),
+                        }
+                    continue
+
+                version = component_versions.get(comp_id, record.get("version"))
+                if version == record.get("version") and (
+                    record.get("installMethod", install_method) == install_method
+                ):
+                    delta["unchanged"].append(comp_id)
+                    continue
+
+                delta["updated"].append(comp_id)
+                if not dry_run:
+                    record.update(
+                        {
+                            "version": version,
+                            "installMethod": install_method,
+                            "installedAt": self._timestamp(),
+                        }
+                    )
+
+        if not dry_run and (delta["added"] or delta["removed"] or delta["updated"]):
+            self.save()
+
+        return delta
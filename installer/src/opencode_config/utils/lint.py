@@ -0,0 +1,309 @@
+"""
+Registry linting with a per-file result cache.
+
+Each component and shared file is checked on its own (frontmatter, model
+tiers, versions) and the result is cached under the file's content hash,
+together with the references the file makes. Registry-wide checks
+(duplicate IDs, references to missing subagents or shared files, bundle
+contents) only use those cached facts, so re-linting after a small change
+reads and parses just the files that changed.
+
+The cache also remembers each file's size and mtime; a file whose stat is
+unchanged is not even read.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from ..config import DEFAULT_CONFIG
+from .catalog import iter_component_files
+from .graph import SHARED_REF
+from .hashing import hash_bytes
+from .manifest import split_frontmatter
+from .template import MODEL_TIER_PATTERN, TemplateEngine
+from .version import parse_version
+
+LINT_CACHE_FILENAME = "opencode-registry-lint.json"
+TIERS = list(DEFAULT_CONFIG["model_tiers"])
+
+SUBAGENT_PATH = re.compile(r"\bsubagents/([\w.-]+)/([\w.-]*[\w-])")  # Not a trailing period
+
+
+@dataclass
+class LintIssue:
+    """A problem found in the registry."""
+
+    path: str  # Registry-relative path
+    severity: str  # "error" or "warning"
+    message: str
+
+
+@dataclass
+class LintReport:
+    """Result of linting a registry."""
+
+    issues: List[LintIssue] = field(default_factory=list)
+    checked: int = 0  # Files linted
+    cached: int = 0  # Of those, results taken from the cache
+
+    @property
+    def errors(self) -> List[LintIssue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> List[LintIssue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+
+class Linter:
+    """Lint a registry checkout."""
+
+    # Bump when checks change so cached results are not reused
+    VERSION = 1
+
+    def __init__(self, registry_path: Path, cache_path: Optional[Path] = None):
+        """
+        Initialize linter.
+
+        Args:
+            registry_path: Path to registry root
+            cache_path: Result cache file (None disables caching)
+        """
+        self.registry_path = registry_path
+        self.cache_path = cache_path
+
+    def run(self, max_workers: Optional[int] = None) -> LintReport:
+        """
+        Lint every component, shared file and bundle.
+
+        Args:
+            max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+        Returns:
+            LintReport with issues sorted by path
+        """
+        opencode_dir = self.registry_path / "opencode"
+        files: List[Tuple[str, str, Path]] = list(iter_component_files(opencode_dir))
+        shared_dir = opencode_dir / "agents" / "_shared"
+        files.extend(("shared", path.stem, path) for path in sorted(shared_dir.glob("*.md")))
+
+        cache = self._load_cache()
+        stats = cache.get("stats", {})
+        results = cache.get("results", {})
+        report = LintReport(checked=len(files))
+
+        def check(item: Tuple[str, str, Path]) -> Tuple[str, Dict[str, Any], str, bool]:
+            comp_type, comp_id, path = item
+            rel = path.relative_to(self.registry_path).as_posix()
+            stat = path.stat()
+            known = stats.get(rel)
+            if known and known["size"] == stat.st_size and known["mtime"] == stat.st_mtime_ns:
+                key = known["key"]
+                if key in results:
+                    return rel, {**known}, key, True
+            data = path.read_bytes()
+            key = hash_bytes(f"{comp_type}:{comp_id}:".encode("utf-8") + data)
+            entry = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "key": key}
+            if key in results:
+                return rel, entry, key, True
+            results[key] = lint_file(comp_type, comp_id, data)
+            return rel, entry, key, False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checked = list(executor.map(check, files))
+
+        facts: Dict[str, Dict[str, Any]] = {}
+        new_stats = {}
+        for (comp_type, comp_id, _), (rel, entry, key, hit) in zip(files, checked):
+            new_stats[rel] = entry
+            report.cached += hit
+            result = results[key]
+            facts[rel] = {"type": comp_type, "id": comp_id, **result}
+            report.issues.extend(
+                LintIssue(rel, severity, message) for severity, message in result["issues"]
+            )
+
+        report.issues.extend(self._check_registry(facts))
+        report.issues.sort(key=lambda issue: (issue.path, issue.severity, issue.message))
+
+        used = {entry["key"] for entry in new_stats.values()}
+        self._save_cache(
+            {"stats": new_stats, "results": {k: v for k, v in results.items() if k in used}}
+        )
+        return report
+
+    def _check_registry(self, facts: Dict[str, Dict[str, Any]]) -> List[LintIssue]:
+        """Checks that span files: IDs, references and bundles."""
+        issues = []
+        opencode_dir = self.registry_path / "opencode"
+
+        by_id: Dict[str, List[str]] = {}
+        for rel, fact in facts.items():
+            if fact["type"] != "shared":
+                by_id.setdefault(fact["id"], []).append(rel)
+        for component_id, paths in sorted(by_id.items()):
+            if len(paths) > 1:
+                message = f"ID '{component_id}' is also defined by {', '.join(paths[1:])}"
+                issues.append(LintIssue(paths[0], "warning", message))
+
+        for rel, fact in facts.items():
+            for category, name in fact["subagents"]:
+                target = opencode_dir / "agents" / "subagents" / category / f"{name}.md"
+                if not target.is_file():
+                    issues.append(
+                        LintIssue(rel, "error", f"Unknown subagent: subagents/{category}/{name}")
+                    )
+            for name in fact["shared"]:
+                if not (opencode_dir / "agents" / "_shared" / name).is_file():
+                    issues.append(LintIssue(rel, "error", f"Unknown shared file: _shared/{name}"))
+            for dependency in fact["dependencies"]:
+                if Path(dependency).stem not in by_id:
+                    issues.append(LintIssue(rel, "error", f"Unknown dependency: {dependency}"))
+
+        bundles_dir = self.registry_path / "bundles"
+        for bundle_file in sorted(bundles_dir.glob("*.yaml")) if bundles_dir.exists() else []:
+            rel = bundle_file.relative_to(self.registry_path).as_posix()
+            try:
+                data = yaml.safe_load(bundle_file.read_text(encoding="utf-8")) or {}
+            except (OSError, yaml.YAMLError) as e:
+                issues.append(LintIssue(rel, "error", f"Unreadable bundle: {e}"))
+                continue
+            components = (data.get("components") or []) if isinstance(data, dict) else None
+            if not isinstance(components, list):
+                issues.append(LintIssue(rel, "error", "'components' must be a list"))
+                continue
+            seen = set()
+            for component_id in components:
+                if component_id in seen:
+                    issues.append(LintIssue(rel, "warning", f"'{component_id}' listed twice"))
+                seen.add(component_id)
+                if component_id not in by_id:
+                    issues.append(LintIssue(rel, "error", f"Unknown component: {component_id}"))
+                elif len(by_id[component_id]) > 1:
+                    issues.append(
+                        LintIssue(
+                            rel,
+                            "warning",
+                            f"'{component_id}' is ambiguous: {', '.join(by_id[component_id])}",
+                        )
+                    )
+        return issues
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load cached results, ignoring missing, corrupt or outdated caches."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != self.VERSION or cache.get("tiers") != TIERS:
+            return {}
+        return cache
+
+    def _save_cache(self, cache: Dict[str, Any]):
+        """Persist results; failures only cost a full lint next time."""
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, "w") as f:
+                json.dump({"version": self.VERSION, "tiers": TIERS, **cache}, f)
+        except OSError:
+            pass
+
+
+def lint_file(comp_type: str, comp_id: str, data: bytes) -> Dict[str, Any]:
+    """
+    Check one file in isolation.
+
+    Args:
+        comp_type: Component type, or "shared" for ``agents/_shared`` files
+        comp_id: Component ID (file stem for shared files)
+        data: File content
+
+    Returns:
+        {"issues": [(severity, message)], "subagents": [(category, name)],
+        "shared": [file names], "dependencies": [IDs]}
+    """
+    issues: List[Tuple[str, str]] = []
+    result: Dict[str, Any] = {"issues": issues, "subagents": [], "shared": [], "dependencies": []}
+
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        issues.append(("error", "File is not valid UTF-8"))
+        return result
+
+    result["subagents"] = sorted({(c, _strip_md(n)) for c, n in SUBAGENT_PATH.findall(content)})
+    result["shared"] = sorted(set(SHARED_REF.findall(content)) - {f"{comp_id}.md"})
+
+    for tier in sorted(set(TemplateEngine.TIER_PATTERN.findall(content)) - set(TIERS)):
+        issues.append(("error", f"Unknown tier placeholder: {{{{tier:{tier}}}}}"))
+    if comp_type == "shared":
+        return result
+
+    frontmatter, error = _frontmatter(content)
+    if error:
+        issues.append(("error", error))
+        return result
+    if frontmatter is None:
+        issues.append(("warning", "No frontmatter"))
+        return result
+
+    if "model_tier" in frontmatter and frontmatter["model_tier"] not in TIERS:
+        issues.append(
+            ("error", f"Unknown model_tier '{frontmatter['model_tier']}' (use {', '.join(TIERS)})")
+        )
+    elif not MODEL_TIER_PATTERN.search(content) and "model_tier" in frontmatter:
+        # The installer only rewrites model_tier lines it can match
+        issues.append(("warning", "model_tier is not on a line of its own"))
+    if comp_type in ("agent", "subagent", "command") and not frontmatter.get("description"):
+        issues.append(("warning", "Missing description"))
+
+    version = frontmatter.get("version")
+    if comp_type == "skill" and isinstance(frontmatter.get("metadata"), dict):
+        version = frontmatter["metadata"].get("version", version)
+    if version is not None:
+        try:
+            parse_version(str(version))
+        except ValueError:
+            issues.append(("warning", f"Version '{version}' is not semantic (X.Y.Z)"))
+
+    dependencies = frontmatter.get("dependencies") or []
+    if not isinstance(dependencies, list):
+        issues.append(("error", "'dependencies' must be a list"))
+    else:
+        result["dependencies"] = [str(dependency) for dependency in dependencies]
+    return result
+
+
+def _frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse frontmatter, returning (data, None), (None, None) if absent, or (None, error)."""
+    frontmatter, _ = split_frontmatter(content)
+    if frontmatter is None:
+        if content.startswith("---"):
+            return None, "Frontmatter is not closed with '---'"
+        return None, None
+    try:
+        data = yaml.safe_load(frontmatter)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        where = f" (line {mark.line + 2})" if mark is not None else ""
+        return None, f"Invalid frontmatter YAML{where}: {getattr(e, 'problem', e)}"
+    if data is None:
+        return {}, None
+    if not isinstance(data, dict):
+        return None, "Frontmatter is not a mapping"
+    return data, None
+
+
+def _strip_md(name: str) -> str:
+    return name[:-3] if name.endswith(".md") else name
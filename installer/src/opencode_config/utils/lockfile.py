@@ -0,0 +1,266 @@
+"""
+Lockfile pinning an installation: component versions, per-file hashes and
+the model resolved for each tier.
+
+``opencode-config lock`` renders the registry once and records the result.
+``install --frozen`` installs from the lock without parsing manifests or
+consulting the configured tiers: files whose installed content already
+matches the locked hash are skipped, and only the others are rendered
+(with the locked tiers and transform settings) and written.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import Config
+from .catalog import Catalog, component_for_path
+from .copy import CopyManager, LogFunc, RenderedFile
+from .hashing import hash_bytes, hash_file
+
+LOCK_FILENAME = "opencode-registry.lock"
+LOCK_VERSION = 1
+
+
+@dataclass
+class FrozenInstall:
+    """Outcome of installing from a lockfile."""
+
+    written: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+def build_lock(
+    registry_path: Path,
+    config: Config,
+    model_override: Optional[str] = None,
+    package: str = "opencode",
+    log: Optional[LogFunc] = None,
+) -> Dict[str, Any]:
+    """
+    Render a registry package and describe the result as lock data.
+
+    Args:
+        registry_path: Path to registry root
+        config: Config instance used to resolve model tiers
+        model_override: Optional model replacing tier resolution
+        package: Name of package directory
+        log: Message callback passed to CopyManager
+
+    Returns:
+        JSON-compatible lock data
+
+    Raises:
+        ValueError: If the package is missing or a file fails to render
+    """
+    if not (registry_path / package).exists():
+        raise ValueError(f"Package directory not found: {registry_path / package}")
+
+    manager = CopyManager(registry_path, Path(), config, log=log)
+    rendered, success = manager.render_package(package, model_override)
+    if not success:
+        raise ValueError("Some registry files failed to render")
+    return describe_rendered(registry_path, rendered, config, model_override, package)
+
+
+def describe_rendered(
+    registry_path: Path,
+    rendered: List[RenderedFile],
+    config: Config,
+    model_override: Optional[str] = None,
+    package: str = "opencode",
+) -> Dict[str, Any]:
+    """
+    Describe already rendered package files as lock data.
+
+    Args:
+        registry_path: Path to registry root
+        rendered: Files from ``CopyManager.render_package``
+        config: Config instance the files were rendered with
+        model_override: Model override the files were rendered with
+        package: Name of package directory
+
+    Returns:
+        JSON-compatible lock data
+    """
+    versions = {
+        (e.manifest.type, e.manifest.id): e.manifest.version
+        for e in Catalog.scan(registry_path).entries
+    }
+
+    files: Dict[str, Dict[str, Any]] = {}
+    components: Dict[str, Dict[str, Any]] = {}
+    for item in rendered:
+        rel = item.rel_path.as_posix()
+        source_hash = hash_file(item.source)
+        if item.content is None:
+            entry = {"source": source_hash, "rendered": source_hash, "template": False}
+            entry["size"] = item.source.stat().st_size
+        else:
+            data = item.content.encode("utf-8")
+            entry = {"source": source_hash, "rendered": hash_bytes(data), "template": True}
+            entry["size"] = len(data)
+
+        if item.tiers:
+            entry["tiers"] = item.tiers
+
+        owner = component_for_path(item.rel_path)
+        if owner:
+            comp_type, comp_id = owner
+            entry["component"] = comp_id
+            record = components.setdefault(f"{comp_type}s", {}).setdefault(
+                comp_id, {"version": versions.get(owner, "1.0.0"), "files": []}
+            )
+            record["files"].append(rel)
+        files[rel] = entry
+
+    return {
+        "version": LOCK_VERSION,
+        "package": package,
+        "tiers": dict(config.list_model_tiers()),
+        "modelOverride": model_override,
+        "minify": bool(config.get("minify")),
+        "includes": config.get("includes", "inline"),
+        "transforms": config.get("transforms") or {},
+        "components": components,
+        "files": files,
+    }
+
+
+def write_lock(lock: Dict[str, Any], path: Path):
+    """Write lock data with stable formatting so lockfiles diff cleanly."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_lock(path: Path) -> Dict[str, Any]:
+    """
+    Read a lockfile.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a lockfile this version understands
+    """
+    with open(path, "r") as f:
+        lock = json.load(f)
+    if not isinstance(lock, dict) or lock.get("version") != LOCK_VERSION:
+        raise ValueError(f"Unsupported lockfile format: {path}")
+    return lock
+
+
+def locked_versions(lock: Dict[str, Any]) -> Dict[str, str]:
+    """Map each locked component ID to its pinned version."""
+    return {
+        comp_id: record["version"]
+        for records in lock["components"].values()
+        for comp_id, record in records.items()
+    }
+
+
+def locked_tier_index(lock: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Map each tier to the locked files rendered through it."""
+    index: Dict[str, List[str]] = {}
+    for rel, entry in sorted(lock["files"].items()):
+        for tier in entry.get("tiers", []):
+            index.setdefault(tier, []).append(rel)
+    return index
+
+
+def install_frozen(
+    registry_path: Path,
+    target_dir: Path,
+    lock: Dict[str, Any],
+    dry_run: bool = False,
+    log: Optional[LogFunc] = None,
+    config: Optional[Config] = None,
+) -> FrozenInstall:
+    """
+    Install exactly what a lockfile describes.
+
+    Installed files matching their locked size and hash are left alone.
+    Every other file is checked against its locked source hash, rendered with
+    the locked tiers and transform settings and checked again before anything
+    is written.
+
+    Args:
+        registry_path: Path to registry root
+        target_dir: Installation directory
+        lock: Lock data from ``load_lock``
+        dry_run: If True, verify and report files to write without writing them
+        log: Message callback passed to CopyManager
+        config: Settings other than model tiers (e.g. the install method)
+
+    Returns:
+        Files written and skipped, plus any verification errors. Nothing is
+        written if any file fails verification.
+    """
+    settings = config.data if config is not None else {}
+    config = Config(
+        data={
+            **settings,
+            "model_tiers": dict(lock["tiers"]),
+            "minify": lock.get("minify", False),
+            "includes": lock.get("includes", "inline"),
+            "transforms": lock.get("transforms", {}),
+        }
+    )
+    manager = CopyManager(registry_path, target_dir, config, log=log)
+    package_path = registry_path / lock["package"]
+    result = FrozenInstall()
+    pending = []
+
+    for rel, entry in sorted(lock["files"].items()):
+        rel_path = Path(rel)
+        dest = target_dir / rel_path
+        if matches_entry(dest, entry):
+            result.unchanged.append(rel_path)
+            continue
+
+        source = package_path / rel_path
+        try:
+            if hash_file(source) != entry["source"]:
+                result.errors.append(f"{rel}: registry file changed since the lock was written")
+                continue
+        except OSError:
+            result.errors.append(f"{rel}: missing from registry")
+            continue
+
+        if not entry["template"]:
+            pending.append(RenderedFile(rel_path, source))
+            continue
+
+        item = manager.render_file(source, rel_path, lock.get("modelOverride"))
+        if hash_bytes(item.content.encode("utf-8")) != entry["rendered"]:
+            result.errors.append(f"{rel}: rendered content does not match the lock")
+            continue
+        pending.append(item)
+
+    if result.errors:
+        return result
+    if dry_run:
+        result.written = [item.rel_path for item in pending]
+        return result
+
+    written, _ = manager.write_rendered(pending, target_dir)
+    result.written = written
+    if len(written) != len(pending):
+        result.errors.append("Some files could not be written")
+    return result
+
+
+def matches_entry(dest: Path, entry: Dict[str, Any]) -> bool:
+    """Check an installed file against its lock entry (size first, then hash)."""
+    try:
+        if dest.stat().st_size != entry["size"]:
+            return False
+        return hash_file(dest) == entry["rendered"]
+    except OSError:
+        return False
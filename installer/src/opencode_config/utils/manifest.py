@@ -2,11 +2,32 @@
 Manifest parsing and validation.
 """
 
+import re
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
+# A leading "---" line, the YAML, and the next line that is just "---"
+FRONTMATTER = re.compile(r"\A---[ \t]*\n(.*?)^---[ \t]*$\n?", re.DOTALL | re.MULTILINE)
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """
+    Split markdown into its YAML frontmatter and body.
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Tuple of (frontmatter YAML without the ``---`` lines, or None if the
+        file has no closed frontmatter; the rest of the file)
+    """
+    match = FRONTMATTER.match(content)
+    if not match:
+        return None, content
+    return match.group(1), content[match.end() :]
+
 
 @dataclass
 class ComponentManifest:
@@ -60,16 +81,9 @@ class ManifestParser:
         with open(md_file, "r") as f:
             content = f.read()
 
-        # Check for frontmatter
-        if not content.startswith("---"):
-            return None
-
-        # Extract frontmatter
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+        frontmatter, _ = split_frontmatter(content)
+        if frontmatter is None:
             return None
-
-        frontmatter = parts[1].strip()
         return yaml.safe_load(frontmatter)
 
     @staticmethod
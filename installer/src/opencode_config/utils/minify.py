@@ -0,0 +1,129 @@
+"""
+Prompt minification for installed markdown.
+
+Agent, subagent and command files are sent to the model on every request,
+so with ``"minify": true`` in the configuration their bodies are installed
+without what only helps people editing the registry:
+
+- HTML comments
+- sections between ``<!-- authoring-only -->`` and ``<!-- /authoring-only -->``
+  lines
+- trailing whitespace, runs of spaces and of blank lines
+- horizontal rules
+
+Frontmatter and fenced code blocks are kept exactly as rendered.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+from .analyze import estimate_tokens
+from .manifest import split_frontmatter
+
+# Installed directories whose markdown is prompt text (shared fragments included)
+MINIFIED_DIRS = ("agents", "commands")
+
+AUTHORING_START = re.compile(r"^\s*<!--\s*authoring-only\s*-->\s*$")
+AUTHORING_END = re.compile(r"^\s*<!--\s*/authoring-only\s*-->\s*$")
+FENCE = re.compile(r"^\s*(`{3,}|~{3,})")
+COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+RULE = re.compile(r"^ {0,3}([-*_])(?:\s*\1){2,}\s*$")
+SPACES = re.compile(r"(?<=\S) {2,}")
+
+
+@dataclass
+class MinifyResult:
+    """Minified content and what it saved."""
+
+    content: str
+    saved_bytes: int
+    saved_tokens: int
+
+
+def should_minify(rel_path: Path) -> bool:
+    """Check whether an installed file is prompt markdown that can be minified."""
+    return rel_path.suffix == ".md" and bool(rel_path.parts) and rel_path.parts[0] in MINIFIED_DIRS
+
+
+def minify(content: str) -> MinifyResult:
+    """
+    Minify a rendered markdown file.
+
+    Args:
+        content: Rendered file content
+
+    Returns:
+        MinifyResult
+    """
+    minified = minify_markdown(content)
+    return MinifyResult(
+        content=minified,
+        saved_bytes=len(content.encode("utf-8")) - len(minified.encode("utf-8")),
+        saved_tokens=estimate_tokens(content) - estimate_tokens(minified),
+    )
+
+
+def minify_markdown(content: str) -> str:
+    """
+    Strip authoring-only text and redundant whitespace from markdown.
+
+    Args:
+        content: Markdown, optionally starting with YAML frontmatter
+
+    Returns:
+        Minified markdown ending in a single newline
+    """
+    _, body = split_frontmatter(content)
+    frontmatter = content[: len(content) - len(body)]
+    if frontmatter and not frontmatter.endswith("\n"):
+        frontmatter += "\n"
+
+    out: List[str] = []
+    prose: List[str] = []
+    fence: Tuple[str, int] = ("", 0)  # Open fence character and length
+    skipping = False
+
+    for line in body.split("\n"):
+        if skipping:
+            skipping = not AUTHORING_END.match(line)
+            continue
+        opener = FENCE.match(line)
+        if fence[1]:
+            out.append(line)
+            if opener and opener.group(1)[0] == fence[0] and len(opener.group(1)) >= fence[1]:
+                fence = ("", 0)
+        elif opener:
+            out.extend(_minify_prose(prose, out))
+            prose = []
+            out.append(line)
+            fence = (opener.group(1)[0], len(opener.group(1)))
+        elif AUTHORING_START.match(line):
+            skipping = True
+        else:
+            prose.append(line)
+    out.extend(_minify_prose(prose, out))
+
+    while out and not out[-1]:
+        out.pop()
+    while out and not out[0]:
+        out.pop(0)
+    return frontmatter + "\n".join(out) + "\n" if out else frontmatter
+
+
+def _minify_prose(lines: List[str], before: List[str]) -> List[str]:
+    """Minify lines outside code blocks; ``before`` is the output so far."""
+    text = COMMENT.sub("", "\n".join(lines))
+    result: List[str] = []
+    previous = before[-1] if before else ""
+    for line in text.split("\n"):
+        line = SPACES.sub(" ", line.rstrip())
+        # A rule right under text is a setext heading underline, not decoration
+        if RULE.match(line) and not previous:
+            continue
+        if not line and not previous:
+            continue
+        result.append(line)
+        previous = line
+    return result
@@ -0,0 +1,224 @@
+"""
+Transform pipeline for rendering registry files.
+
+A markdown file is installed by passing its text through a list of stages:
+
+- ``include``: expand ``{{include:_shared/x.md}}`` directives (see ``includes``)
+- ``render``: rewrite the ``model_tier:`` frontmatter line (or inject a
+  model override) and resolve ``{{tier:X}}``/``{{model:X}}`` placeholders,
+  in one pass over the compiled template
+- ``minify``: strip authoring-only text when ``"minify"`` is enabled
+
+Which stages run can be configured per file kind (agent, subagent, skill,
+command, shared, other) with the ``"transforms"`` setting, e.g.
+``{"skill": ["render"]}``. Time spent in each stage is added to
+``TIMINGS`` so ``install --timings`` can show which transforms are costly.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..config import Config
+from .catalog import component_for_path
+from .includes import expand_includes
+from .minify import minify, should_minify
+from .template import CompiledTemplate, TemplateEngine
+
+DEFAULT_STAGES = ["include", "render", "minify"]
+FILE_KINDS = ("agent", "subagent", "skill", "command", "shared", "other")
+
+
+@dataclass
+class TransformContext:
+    """What stages know about the file being transformed."""
+
+    rel_path: Path  # Destination path relative to the target directory
+    source: Path
+    engine: TemplateEngine  # Resolves tiers for this render
+    model_override: Optional[str] = None
+    tiers: List[str] = field(default_factory=list)  # Tiers the output depends on
+    includes: List[str] = field(default_factory=list)  # Package files inlined into the output
+    # (level, message) pairs logged after the pipeline, so logging is not timed
+    messages: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class Stage:
+    """One transform of a file's text."""
+
+    name = ""
+
+    def applies(self, context: TransformContext) -> bool:
+        """Check whether the stage should run for a file."""
+        return True
+
+    def apply(self, text: str, context: TransformContext) -> str:
+        """Transform text and return the result."""
+        raise NotImplementedError
+
+
+class IncludeStage(Stage):
+    """Inline or reference shared fragments."""
+
+    name = "include"
+
+    def apply(self, text: str, context: TransformContext) -> str:
+        if "{{include:" not in text:
+            return text
+        package_path = context.source.parents[len(context.rel_path.parts) - 1]
+        mode = context.engine.config.get("includes") or "inline"
+        expansion = expand_includes(text, package_path / "agents", mode)
+        context.includes = [f"agents/{name}" for name in expansion.included]
+        for problem in expansion.problems:
+            context.messages.append(("warning", f"Warning processing {context.source}: {problem}"))
+        return expansion.text
+
+
+class RenderStage(Stage):
+    """Resolve model tiers in frontmatter and placeholders."""
+
+    name = "render"
+
+    def __init__(self):
+        # Variants render the same text with several engines in a row. Compare
+        # by content: earlier stages (e.g. includes) build a new string per variant
+        self._last: Tuple[Optional[str], Optional[CompiledTemplate]] = (None, None)
+
+    def apply(self, text: str, context: TransformContext) -> str:
+        last_text, template = self._last
+        if template is None or last_text != text:
+            template = context.engine.compile(text)
+            self._last = (text, template)
+
+        context.tiers = template.tiers(context.engine.config, context.model_override)
+        try:
+            return template.render(context.engine, context.model_override)
+        except ValueError as e:
+            # Keep the resolved model line but leave {{tier:X}} / {{model:X}} as written
+            context.messages.append(("warning", f"Warning processing {context.source}: {e}"))
+            return template.render(context.engine, context.model_override, placeholders=False)
+
+
+class MinifyStage(Stage):
+    """Strip comments, authoring-only sections and extra whitespace."""
+
+    name = "minify"
+
+    def applies(self, context: TransformContext) -> bool:
+        return bool(context.engine.config.get("minify")) and should_minify(context.rel_path)
+
+    def apply(self, text: str, context: TransformContext) -> str:
+        result = minify(text)
+        context.messages.append(
+            (
+                "info",
+                f"Minified {context.rel_path.as_posix()}: {result.saved_bytes} bytes, "
+                f"~{result.saved_tokens} tokens saved",
+            )
+        )
+        return result.content
+
+
+STAGES: Dict[str, Callable[[], Stage]] = {
+    "include": IncludeStage,
+    "render": RenderStage,
+    "minify": MinifyStage,
+}
+
+
+class StageTimings:
+    """Thread-safe totals of time spent per stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Tuple[int, float]] = {}
+
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            calls, total = self._totals.get(name, (0, 0.0))
+            self._totals[name] = (calls + 1, total + seconds)
+
+    def snapshot(self) -> Dict[str, Tuple[int, float]]:
+        """Get stage name → (files transformed, seconds)."""
+        with self._lock:
+            return dict(self._totals)
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+
+
+# Process-wide: one CLI command renders through many CopyManagers
+TIMINGS = StageTimings()
+
+
+def file_kind(rel_path: Path) -> str:
+    """Classify an installed file for per-kind stage configuration."""
+    owner = component_for_path(rel_path)
+    if owner:
+        return owner[0]
+    if rel_path.parts[:2] == ("agents", "_shared"):
+        return "shared"
+    return "other"
+
+
+class TransformPipeline:
+    """Stages to run per file kind."""
+
+    def __init__(self, stages: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: File kind → stage names in order; kinds not listed use
+                ``DEFAULT_STAGES``
+
+        Raises:
+            ValueError: If a kind or stage name is unknown
+        """
+        instances: Dict[str, Stage] = {}
+
+        def build(names: List[str]) -> List[Stage]:
+            for name in names:
+                if name not in STAGES:
+                    raise ValueError(f"Unknown transform stage '{name}' (use {', '.join(STAGES)})")
+                if name not in instances:
+                    instances[name] = STAGES[name]()
+            return [instances[name] for name in names]
+
+        self.default = build(DEFAULT_STAGES)
+        self.stages: Dict[str, List[Stage]] = {}
+        for kind, names in (stages or {}).items():
+            if kind not in FILE_KINDS:
+                raise ValueError(f"Unknown file kind '{kind}' (use {', '.join(FILE_KINDS)})")
+            self.stages[kind] = build(list(names))
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TransformPipeline":
+        """Build the pipeline from the ``"transforms"`` setting."""
+        return cls(config.get("transforms") or {})
+
+    def stages_for(self, rel_path: Path) -> List[Stage]:
+        """Get the stages configured for a file."""
+        return self.stages.get(file_kind(rel_path), self.default)
+
+    def run(self, text: str, context: TransformContext) -> str:
+        """
+        Pass text through the stages that apply to the file, timing each.
+
+        Args:
+            text: Source file content
+            context: File being transformed
+
+        Returns:
+            Transformed content
+        """
+        for stage in self.stages_for(context.rel_path):
+            if not stage.applies(context):
+                continue
+            start = time.perf_counter()
+            text = stage.apply(text, context)
+            TIMINGS.add(stage.name, time.perf_counter() - start)
+        return text
@@ -0,0 +1,153 @@
+"""
+Small cached index of registry contents (component IDs and bundle names).
+
+The index is rebuilt only when one of the registry directories it was built
+from has a different mtime, so lookups cost a handful of ``stat`` calls.
+Bundle resolutions are cached in the same file, keyed by the mtimes of the
+files they are derived from.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .catalog import iter_component_files, registry_fingerprint
+
+INDEX_FILENAME = "opencode-registry-index.json"
+
+
+class RegistryIndex:
+    """Cached listing of component IDs and bundles for a registry."""
+
+    VERSION = 1
+
+    def __init__(self, registry_path: Path, index_path: Path):
+        """
+        Initialize registry index.
+
+        Args:
+            registry_path: Path to registry root
+            index_path: Path to the cached index file
+        """
+        self.registry_path = registry_path
+        self.index_path = index_path
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Index data, loaded from cache or rebuilt if the registry changed."""
+        if self._data is None:
+            cached = self._load()
+            if cached is not None and self._is_fresh(cached):
+                self._data = cached
+            else:
+                self._data = self.build()
+                self._save(self._data)
+        return self._data
+
+    def component_ids(self, component_type: Optional[str] = None) -> List[str]:
+        """
+        Get component IDs, optionally restricted to one type.
+
+        Args:
+            component_type: Component type (agent, subagent, skill, command)
+
+        Returns:
+            Sorted list of unique component IDs
+        """
+        components = self.data["components"]
+        if component_type:
+            return list(components.get(component_type, []))
+        return sorted({cid for ids in components.values() for cid in ids})
+
+    def component_types(self) -> Dict[str, List[str]]:
+        """Map each component ID to the types it is defined as."""
+        types: Dict[str, List[str]] = {}
+        for comp_type, ids in self.data["components"].items():
+            for cid in ids:
+                types.setdefault(cid, []).append(comp_type)
+        return types
+
+    def bundle_names(self) -> List[str]:
+        """Get names of bundles defined in ``bundles/``."""
+        return list(self.data["bundles"])
+
+    def bundle_resolution(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a bundle resolved to its components in dependency order.
+
+        All bundles are resolved together and cached until a bundle, component
+        or shared file changes.
+
+        Args:
+            name: Bundle name
+
+        Returns:
+            Resolution from ``bundles.resolve_bundles``, or None if there is
+            no such bundle
+        """
+        # Resolution pulls in the dependency graph; completion never needs it
+        from .bundles import resolution_fingerprint, resolve_bundles
+
+        fingerprint = resolution_fingerprint(self.registry_path)
+        cached = self.data.get("bundleResolutions")
+        if cached is None or cached.get("fingerprint") != fingerprint:
+            cached = {"fingerprint": fingerprint, "bundles": resolve_bundles(self.registry_path)}
+            self.data["bundleResolutions"] = cached
+            self._save(self.data)
+        return cached["bundles"].get(name)
+
+    def build(self) -> Dict[str, Any]:
+        """Scan the registry and build fresh index data."""
+        opencode_dir = self.registry_path / "opencode"
+        components: Dict[str, List[str]] = {}
+        for comp_type, comp_id, _ in iter_component_files(opencode_dir):
+            components.setdefault(comp_type, []).append(comp_id)
+
+        bundles_dir = self.registry_path / "bundles"
+        bundles = sorted(p.stem for p in bundles_dir.glob("*.yaml")) if bundles_dir.exists() else []
+
+        return {
+            "version": self.VERSION,
+            "registry": str(self.registry_path),
+            "fingerprint": registry_fingerprint(self.registry_path),
+            "components": {t: sorted(ids) for t, ids in components.items()},
+            "bundles": bundles,
+        }
+
+    def _is_fresh(self, cached: Dict[str, Any]) -> bool:
+        """Check a cached index against the registry using only stat calls."""
+        if cached.get("version") != self.VERSION:
+            return False
+        if cached.get("registry") != str(self.registry_path):
+            return False
+
+        fingerprint = cached.get("fingerprint", {})
+        for rel_dir, mtime in fingerprint.items():
+            try:
+                if (self.registry_path / rel_dir).stat().st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        # A top-level directory created after the index was built
+        for rel_dir in ("opencode/agents", "opencode/skills", "opencode/commands", "bundles"):
+            if rel_dir not in fingerprint and (self.registry_path / rel_dir).exists():
+                return False
+        return True
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Load cached index data, ignoring missing or corrupt files."""
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, data: Dict[str, Any]):
+        """Persist index data; failures only cost a rebuild next time."""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, "w") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
@@ -0,0 +1,197 @@
+"""
+Content-addressed object store shared by installation targets.
+
+With ``install_method`` set to ``link``, every installed file is stored once
+as a blob named by its content hash, and targets get hard links to the blob.
+Identical files across targets (and across users sharing tier configs) then
+take the disk space of one copy, and re-installing an unchanged file only
+compares inodes.
+
+Blobs are read-only so that an in-place edit of an installed file cannot
+silently change every other target linked to it. A blob whose link count has
+dropped to one is referenced by no target; ``gc`` removes those.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..config import Config
+from .hashing import hash_bytes, hash_file
+
+# Blobs are shared, so nobody may write through a link
+BLOB_MODE = 0o444
+EXECUTABLE_BLOB_MODE = 0o555
+
+
+class ObjectStore:
+    """Hash → blob store with hard-link installs."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize object store.
+
+        Args:
+            root: Store directory (created on first write)
+        """
+        self.root = root
+        self.objects_dir = root / "objects"
+
+    def blob_path(self, digest: str, executable: bool = False) -> Path:
+        """
+        Get the path of a blob.
+
+        The mode is part of an inode, so executable content is stored apart
+        from the same bytes without the executable bit.
+
+        Args:
+            digest: Content hash
+            executable: Whether the blob is executable
+
+        Returns:
+            Blob path (which may not exist)
+        """
+        name = digest[2:] + (".x" if executable else "")
+        return self.objects_dir / digest[:2] / name
+
+    def put_bytes(self, data: bytes, executable: bool = False) -> Path:
+        """
+        Store content, unless a blob with the same hash already exists.
+
+        Args:
+            data: File content
+            executable: Whether the installed file should be executable
+
+        Returns:
+            Blob path
+        """
+        blob = self.blob_path(hash_bytes(data), executable)
+        if not blob.exists():
+            self._write_blob(blob, lambda f: f.write(data), executable)
+        return blob
+
+    def put_file(self, source: Path) -> Path:
+        """
+        Store a file's content, keeping its executable bit.
+
+        Args:
+            source: File to store
+
+        Returns:
+            Blob path
+        """
+        executable = bool(source.stat().st_mode & 0o111)
+        blob = self.blob_path(hash_file(source), executable)
+        if not blob.exists():
+
+            def copy(f):
+                with open(source, "rb") as src:
+                    shutil.copyfileobj(src, f)
+
+            self._write_blob(blob, copy, executable)
+        return blob
+
+    def link(self, blob: Path, dest: Path):
+        """
+        Replace dest with a hard link to a blob.
+
+        Falls back to a (writable) copy when dest is on another filesystem.
+
+        Args:
+            blob: Blob path from ``put_bytes``/``put_file``
+            dest: Installed file path
+        """
+        try:
+            if dest.exists() and os.path.samefile(blob, dest):
+                return
+        except OSError:
+            pass
+
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.link")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            shutil.copyfile(blob, tmp)
+            os.chmod(tmp, 0o755 if blob.name.endswith(".x") else 0o644)
+        os.replace(tmp, dest)
+
+    def gc(self, dry_run: bool = False) -> Tuple[int, int]:
+        """
+        Remove blobs no target links to.
+
+        Args:
+            dry_run: If True, only count what would be removed
+
+        Returns:
+            Tuple of (blobs removed, bytes freed)
+        """
+        removed = freed = 0
+        for blob in self._iter_blobs():
+            stat = blob.stat()
+            if stat.st_nlink > 1:
+                continue
+            if not dry_run:
+                blob.unlink()
+            removed += 1
+            freed += stat.st_size
+
+        if not dry_run:
+            for shard in self._iter_shards():
+                try:
+                    shard.rmdir()  # Fails unless empty
+                except OSError:
+                    pass
+        return removed, freed
+
+    def stats(self) -> Tuple[int, int]:
+        """
+        Count stored blobs.
+
+        Returns:
+            Tuple of (blob count, total bytes)
+        """
+        count = size = 0
+        for blob in self._iter_blobs():
+            count += 1
+            size += blob.stat().st_size
+        return count, size
+
+    def _write_blob(self, blob: Path, write, executable: bool):
+        """
+        Write a blob atomically so concurrent installs never link a partial one.
+
+        The blob is published with link() rather than rename(): if another
+        writer stored the same content first, its inode (which targets may
+        already link to) is kept instead of being replaced.
+        """
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=blob.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.chmod(tmp, EXECUTABLE_BLOB_MODE if executable else BLOB_MODE)
+            try:
+                os.link(tmp, blob)
+            except FileExistsError:
+                pass
+        finally:
+            os.unlink(tmp)
+
+    def _iter_shards(self):
+        if self.objects_dir.is_dir():
+            yield from (shard for shard in self.objects_dir.iterdir() if shard.is_dir())
+
+    def _iter_blobs(self):
+        for shard in self._iter_shards():
+            for blob in shard.iterdir():
+                if not blob.name.startswith("."):
+                    yield blob
+
+
+def store_for(config: Config) -> Optional[ObjectStore]:
+    """Get the object store a config installs through, or None for plain copies."""
+    if config.get("install_method") == "link":
+        return ObjectStore(config.store_path)
+    return None
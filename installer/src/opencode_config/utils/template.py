@@ -3,9 +3,12 @@ Template processing for model tier resolution.
 """
 
 import re
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from ..config import Config
 
+# Frontmatter placeholder replaced by ``model: <resolved>`` on install
+MODEL_TIER_PATTERN = re.compile(r'^model_tier:\s*["\']?(\w+)["\']?\s*$', re.MULTILINE)
+
 
 class TemplateEngine:
     """Handle template replacement in component files."""
@@ -50,16 +53,7 @@ class TemplateEngine:
             # Check overrides first
             if tier in overrides:
                 return overrides[tier]
-            # Resolve from config
-            model = self.config.get_model_for_tier(tier)
-            if model is None:
-                # Fallback to medium tier
-                model = self.config.get_model_for_tier("medium")
-                if model is None:
-                    raise ValueError(
-                        f"Invalid tier '{tier}' and fallback 'medium' not configured"
-                    )
-            return model
+            return self.resolve_tier(tier)
 
         # Replace {{model:X}} patterns (literal replacement)
         def replace_model(match):
@@ -70,6 +64,31 @@ class TemplateEngine:
 
         return content
 
+    def resolve_tier(self, tier: str) -> str:
+        """
+        Resolve a ``{{tier:X}}`` placeholder from config.
+
+        Args:
+            tier: Tier name
+
+        Returns:
+            Configured model, falling back to the medium tier
+
+        Raises:
+            ValueError: If neither the tier nor the medium tier is configured
+        """
+        model = self.config.get_model_for_tier(tier)
+        if model is None:
+            # Fallback to medium tier
+            model = self.config.get_model_for_tier("medium")
+            if model is None:
+                raise ValueError(f"Invalid tier '{tier}' and fallback 'medium' not configured")
+        return model
+
+    def compile(self, content: str) -> "CompiledTemplate":
+        """Parse content once so it can be rendered for several configurations."""
+        return CompiledTemplate.parse(content)
+
     def extract_tier_from_frontmatter(self, frontmatter: Dict[str, Any]) -> Optional[str]:
         """
         Extract model_tier from frontmatter.
@@ -138,3 +157,117 @@ class TemplateEngine:
         """
         # Only process markdown files (agents, skills, commands)
         return file_path.endswith(".md")
+
+
+class CompiledTemplate:
+    """
+    Template content split into literal text and placeholders.
+
+    Parsing happens once; rendering for another tier configuration only
+    resolves the placeholders and joins the pieces. Output is identical to
+    replacing ``model_tier:`` lines and then calling ``process_content``.
+    """
+
+    LITERAL = "literal"
+    MODEL_LINE = "model_line"  # ``model_tier: X`` frontmatter line
+    TIER = "tier"  # ``{{tier:X}}``
+    MODEL = "model"  # ``{{model:X}}``
+
+    PLACEHOLDER_PATTERN = re.compile(r"\{\{tier:(\w+)\}\}|\{\{model:([^\}]+)\}\}")
+
+    def __init__(self, segments: List[Tuple[str, str, str]]):
+        """
+        Initialize compiled template.
+
+        Args:
+            segments: (kind, value, original text) tuples in content order
+        """
+        self.segments = segments
+
+    @classmethod
+    def parse(cls, content: str) -> "CompiledTemplate":
+        """Split content into segments."""
+        segments: List[Tuple[str, str, str]] = []
+        pos = 0
+        for match in MODEL_TIER_PATTERN.finditer(content):
+            cls._parse_text(content[pos : match.start()], segments)
+            segments.append((cls.MODEL_LINE, match.group(1), match.group(0)))
+            pos = match.end()
+        cls._parse_text(content[pos:], segments)
+        return cls(segments)
+
+    @classmethod
+    def _parse_text(cls, text: str, segments: List[Tuple[str, str, str]]):
+        pos = 0
+        for match in cls.PLACEHOLDER_PATTERN.finditer(text):
+            if match.start() > pos:
+                segments.append((cls.LITERAL, text[pos : match.start()], ""))
+            if match.group(1) is not None:
+                segments.append((cls.TIER, match.group(1), match.group(0)))
+            else:
+                segments.append((cls.MODEL, match.group(2), match.group(0)))
+            pos = match.end()
+        if pos < len(text):
+            segments.append((cls.LITERAL, text[pos:], ""))
+
+    def render(
+        self,
+        engine: TemplateEngine,
+        model_override: Optional[str] = None,
+        placeholders: bool = True,
+    ) -> str:
+        """
+        Render the template with an engine's tier configuration.
+
+        Args:
+            engine: Template engine to resolve tiers with
+            model_override: Literal model for the ``model:`` line; injected
+                after the opening ``---`` if there is no ``model_tier:`` line
+            placeholders: If False, leave ``{{tier:X}}``/``{{model:X}}`` as written
+
+        Returns:
+            Rendered content
+
+        Raises:
+            ValueError: If a ``{{tier:X}}`` placeholder cannot be resolved
+        """
+        inject = model_override is not None and not any(
+            kind == self.MODEL_LINE for kind, _, _ in self.segments
+        )
+        parts = []
+        for kind, value, raw in self.segments:
+            if kind == self.LITERAL:
+                if inject and "---\n" in value:
+                    value = value.replace("---\n", f"---\nmodel: {model_override}\n", 1)
+                    inject = False
+                parts.append(value)
+            elif kind == self.MODEL_LINE:
+                model = model_override or engine.resolve_model(value)
+                parts.append(f"model: {model}")
+            elif not placeholders:
+                parts.append(raw)
+            elif kind == self.TIER:
+                parts.append(engine.resolve_tier(value))
+            else:
+                parts.append(value)
+        return "".join(parts)
+
+    def tiers(self, config: Config, model_override: Optional[str] = None) -> List[str]:
+        """
+        Get the tiers the rendered content depends on.
+
+        Args:
+            config: Configuration the template is rendered with
+            model_override: Model override (``model_tier:`` lines then ignore tiers)
+
+        Returns:
+            Sorted tier names; unset tiers add the medium tier they fall back to
+        """
+        tiers = {
+            value
+            for kind, value, _ in self.segments
+            if kind == self.TIER or (kind == self.MODEL_LINE and not model_override)
+        }
+        if any(not config.get_model_for_tier(tier) for tier in tiers):
+            tiers.add("medium")
+        return sorted(tiers)
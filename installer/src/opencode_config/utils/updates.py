@@ -0,0 +1,98 @@
+"""
+Update availability: join the registry catalog against installed records.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .catalog import Catalog
+from .version import parse_version
+
+
+@dataclass
+class InstalledComponent:
+    """An installed component as recorded in the database."""
+
+    id: str
+    type: str
+    version: str
+
+
+@dataclass
+class PendingUpdate:
+    """An installed component with a newer version in the registry."""
+
+    id: str
+    type: str
+    installed: str
+    available: str
+
+
+@dataclass
+class UpdatePlan:
+    """Result of checking installed components against the registry."""
+
+    updates: List[PendingUpdate] = field(default_factory=list)
+    missing: List[InstalledComponent] = field(default_factory=list)  # Recorded, not on disk
+    orphans: List[InstalledComponent] = field(default_factory=list)  # No longer in the registry
+    invalid: List[str] = field(default_factory=list)  # Versions that could not be compared
+    versions: Dict[str, str] = field(default_factory=dict)  # Registry version per component ID
+
+    @property
+    def changes(self) -> int:
+        """Number of components an update would reinstall."""
+        return len(self.updates) + len(self.missing)
+
+
+def plan_updates(
+    catalog: Catalog, installed: Iterable[Dict[str, Any]], on_disk: Set[str]
+) -> UpdatePlan:
+    """
+    Find updates, missing components and orphans in one pass.
+
+    The catalog is indexed once by (type, ID); each installed record is then
+    a single lookup, so no registry file is probed or parsed per component.
+    ``versions`` covers the whole catalog, so callers can record versions
+    after reinstalling without scanning the registry again.
+
+    Args:
+        catalog: Registry catalog
+        installed: Records from ``InstalledDB.get_all_installed``
+        on_disk: IDs of components detected in the target directory
+
+    Returns:
+        UpdatePlan
+    """
+    plan = UpdatePlan()
+    index: Dict[Tuple[str, str], str] = {}
+    for entry in catalog.entries:
+        manifest = entry.manifest
+        index[(manifest.type, manifest.id)] = manifest.version
+        # Like Catalog.get, the first type in walk order wins for shared IDs
+        plan.versions.setdefault(manifest.id, manifest.version)
+
+    for record in installed:
+        component = InstalledComponent(
+            record["id"], record["type"], record.get("version", "unknown")
+        )
+        available = index.get((component.type, component.id))
+        if available is None:
+            plan.orphans.append(component)
+            continue
+        if component.id not in on_disk:
+            plan.missing.append(component)
+            continue
+        if component.version == "unknown":
+            continue
+
+        try:
+            newer = parse_version(available) > parse_version(component.version)
+        except ValueError as e:
+            plan.invalid.append(f"{component.id}: {e}")
+            continue
+        if newer:
+            plan.updates.append(
+                PendingUpdate(component.id, component.type, component.version, available)
+            )
+
+    return plan
@@ -0,0 +1,126 @@
+"""
+Detect drift between installed files and what the installer wrote.
+
+After an install or update the installer records the hash, size and
+modification time of every file it wrote. ``verify_files`` compares a target
+against those records: files whose size and mtime are unchanged are trusted
+without reading them, a different size is a modification without hashing, and
+only the remaining files are hashed (in parallel).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .hashing import hash_file
+
+# Directories the installer writes into; other files in the target are not ours
+MANAGED_DIRS = ("agents", "skills", "commands")
+
+
+@dataclass
+class VerifyReport:
+    """Result of comparing a target directory with its file records."""
+
+    modified: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        """True if every recorded file is present and unmodified."""
+        return not (self.modified or self.missing)
+
+
+def record_files(
+    target_dir: Path, rel_paths: Iterable[str], max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Hash installed files for later verification.
+
+    Args:
+        target_dir: Installation directory
+        rel_paths: File paths relative to the target directory
+        max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+    Returns:
+        Relative path → ``{"hash", "size", "mtime"}``; missing files are skipped
+    """
+
+    def record(rel: str):
+        path = target_dir / rel
+        try:
+            stat = path.stat()
+            return rel, {"hash": hash_file(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        except OSError:
+            return rel, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(record, sorted(set(rel_paths)))
+        return {rel: entry for rel, entry in results if entry is not None}
+
+
+def verify_files(
+    target_dir: Path,
+    records: Dict[str, Dict[str, Any]],
+    find_extra: bool = True,
+    max_workers: Optional[int] = None,
+) -> VerifyReport:
+    """
+    Compare installed files with their records.
+
+    Args:
+        target_dir: Installation directory
+        records: File records from ``record_files``
+        find_extra: Also list unrecorded files in the managed directories
+        max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+    Returns:
+        Verification report with sorted path lists
+    """
+    report = VerifyReport()
+    to_hash = []
+
+    for rel, record in sorted(records.items()):
+        try:
+            stat = (target_dir / rel).stat()
+        except OSError:
+            report.missing.append(rel)
+            continue
+
+        if stat.st_size != record["size"]:
+            report.modified.append(rel)
+        elif stat.st_mtime_ns == record["mtime"]:
+            report.unchanged.append(rel)
+        else:
+            to_hash.append(rel)
+
+    def matches(rel: str) -> bool:
+        try:
+            return hash_file(target_dir / rel) == records[rel]["hash"]
+        except OSError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for rel, same in zip(to_hash, executor.map(matches, to_hash)):
+            (report.unchanged if same else report.modified).append(rel)
+
+    if find_extra:
+        report.extra = [rel for rel in _managed_files(target_dir) if rel not in records]
+
+    report.modified.sort()
+    report.unchanged.sort()
+    return report
+
+
+def _managed_files(target_dir: Path) -> List[str]:
+    """List files under the installer's directories, relative to the target."""
+    found = []
+    for name in MANAGED_DIRS:
+        for dirpath, _, filenames in os.walk(target_dir / name):
+            rel_dir = Path(dirpath).relative_to(target_dir)
+            found.extend((rel_dir / filename).as_posix() for filename in filenames)
+    return sorted(found)
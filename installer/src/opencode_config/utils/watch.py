@@ -0,0 +1,429 @@
+"""
+Watch a registry package and apply edits to an installed target.
+
+``create_watcher`` uses Linux inotify (through ctypes, so no extra
+dependency) and falls back to polling file mtimes elsewhere.
+``collect_changes`` batches events until the tree has been quiet for a short
+debounce delay, and ``IncrementalInstaller`` re-renders, writes or removes
+only the changed files and updates the installation database in place.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .catalog import component_for_path
+from .copy import CopyManager, RenderedFile, is_ignored
+from .includes import FRAGMENTS, INCLUDE_PATTERN
+from .installed_db import InstalledDB
+from .manifest import ManifestParser
+from .verify import record_files
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """Recursive inotify watch of a directory tree (Linux only)."""
+
+    def __init__(self, root: Path):
+        """
+        Start watching a directory tree.
+
+        Args:
+            root: Directory to watch
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("C library not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self._libc = libc
+        self._dirs: Dict[int, Path] = {}
+        self._add_tree(root)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Changed, created or deleted paths (empty on timeout). A created
+            directory is reported together with the files already in it.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: report the whole tree
+                changed.update(self._add_tree(self.root))
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / name
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                changed.update(self._add_tree(path))
+            changed.add(path)
+        return changed
+
+    def close(self):
+        """Stop watching."""
+        os.close(self.fd)
+
+    def _add_tree(self, directory: Path) -> List[Path]:
+        """Watch a directory and its subdirectories; return the files in them."""
+        files = []
+        for dirpath, _, filenames in os.walk(directory):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = Path(dirpath)
+            files.extend(Path(dirpath) / name for name in filenames)
+        return files
+
+
+class PollingWatcher:
+    """Portable watcher comparing file mtimes and sizes at an interval."""
+
+    def __init__(self, root: Path, interval: float = 0.5):
+        """
+        Start watching a directory tree.
+
+        Args:
+            root: Directory to watch
+            interval: Seconds between scans
+        """
+        self.root = root
+        self.interval = interval
+        self._state = self._scan()
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Changed, created or deleted files (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {
+                path
+                for path in state.keys() | self._state.keys()
+                if state.get(path) != self._state.get(path)
+            }
+            self._state = state
+            if changed:
+                return changed
+
+            delay = self.interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def close(self):
+        """Stop watching."""
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        state = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+
+def create_watcher(root: Path, poll: bool = False, interval: float = 0.5):
+    """
+    Watch a directory tree with inotify, or by polling if unavailable.
+
+    Args:
+        root: Directory to watch
+        poll: Always poll, even where inotify is available
+        interval: Seconds between scans when polling
+
+    Returns:
+        InotifyWatcher or PollingWatcher
+    """
+    if not poll:
+        try:
+            return InotifyWatcher(root)
+        except OSError:
+            pass
+    return PollingWatcher(root, interval)
+
+
+def collect_changes(watcher, debounce: float = 0.1, timeout: Optional[float] = None) -> Set[Path]:
+    """
+    Wait for changes and batch them until the tree is quiet.
+
+    Editors often save with several writes and renames; collecting until no
+    event arrives for ``debounce`` seconds applies each save once.
+
+    Args:
+        watcher: Watcher from ``create_watcher``
+        debounce: Quiet period that ends a batch, in seconds
+        timeout: Seconds to wait for the first change (None waits indefinitely)
+
+    Returns:
+        Changed paths (empty on timeout)
+    """
+    changed = watcher.wait(timeout)
+    while changed:
+        more = watcher.wait(debounce)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+@dataclass
+class WatchBatch:
+    """Files applied to the target for one batch of changes."""
+
+    written: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    success: bool = True
+    elapsed: float = 0.0
+
+
+class IncrementalInstaller:
+    """Apply changed registry files to an installed target."""
+
+    def __init__(
+        self,
+        manager: CopyManager,
+        db: Optional[InstalledDB] = None,
+        package: str = "opencode",
+        model_override: Optional[str] = None,
+    ):
+        """
+        Initialize incremental installer.
+
+        Args:
+            manager: CopyManager for the registry and target
+            db: Database of the target, updated after each batch (optional)
+            package: Name of package directory
+            model_override: Optional model replacing tier resolution
+        """
+        self.manager = manager
+        self.db = db
+        self.package = package
+        self.package_path = manager.registry_path / package
+        self.model_override = model_override
+        # Fragment → files that inline it; built on the first fragment change
+        self._includers: Optional[Dict[str, Set[str]]] = None
+
+    def apply(self, changed: Iterable[Path]) -> WatchBatch:
+        """
+        Re-render and write changed files; remove deleted ones from the target.
+
+        Args:
+            changed: Changed paths inside the package directory
+
+        Returns:
+            Files written and removed
+        """
+        start = time.perf_counter()
+        sources: Dict[Path, Path] = {}
+        deleted: Set[str] = set()
+
+        for path in changed:
+            try:
+                rel_path = path.relative_to(self.package_path)
+            except ValueError:
+                continue
+            if is_ignored(rel_path):
+                continue
+            FRAGMENTS.discard(path)
+            if path.is_dir():
+                for item in path.rglob("*"):
+                    item_rel = item.relative_to(self.package_path)
+                    if item.is_file() and not is_ignored(item_rel):
+                        sources[item_rel] = item
+            elif path.is_file():
+                sources[rel_path] = path
+            else:
+                deleted.add(rel_path.as_posix())
+
+        for rel_path in self._including_files({rel.as_posix() for rel in sources} | deleted) - set(
+            sources
+        ):
+            sources[rel_path] = self.package_path / rel_path
+
+        batch = WatchBatch()
+        rendered = []
+        for rel_path, source in sorted(sources.items()):
+            try:
+                rendered.append(self.manager.render_file(source, rel_path, self.model_override))
+            except OSError as e:
+                # Deleted again before we got to it; the next batch removes it
+                self.manager.log("warning", f"Warning: could not read {rel_path}: {e}")
+            except Exception as e:
+                # A half-saved or broken file must not stop the watch; the next save retries it
+                self.manager.log("warning", f"Warning: could not render {rel_path}: {e}")
+                batch.success = False
+
+        if self._includers is not None:
+            for item in rendered:
+                self._index_includes(item.rel_path.as_posix(), item.includes)
+
+        if rendered:
+            batch.written, written_ok = self.manager.write_rendered(
+                rendered, self.manager.target_dir
+            )
+            batch.success = batch.success and written_ok
+        if deleted:
+            batch.removed = self.manager.remove_files(self._expand_deleted(deleted))
+
+        if self.db is not None and (batch.written or batch.removed):
+            self._update_db(rendered, batch)
+        batch.elapsed = time.perf_counter() - start
+        return batch
+
+    def _including_files(self, changed: Set[str]) -> Set[Path]:
+        """Find files that inline changed fragments, directly or through other fragments."""
+        fragments = {rel for rel in changed if rel.startswith("agents/") and rel.endswith(".md")}
+        if not fragments:
+            return set()
+        if self._includers is None:
+            self._includers = {}
+            for source in self.package_path.rglob("*.md"):
+                rel_path = source.relative_to(self.package_path)
+                if is_ignored(rel_path):
+                    continue
+                try:
+                    text = source.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    continue
+                names = [f"agents/{name}" for name in INCLUDE_PATTERN.findall(text)]
+                self._index_includes(rel_path.as_posix(), names)
+
+        found: Set[str] = set()
+        queue = list(fragments)
+        while queue:
+            for rel in self._includers.get(queue.pop(), set()) - found:
+                found.add(rel)
+                queue.append(rel)
+        return {Path(rel) for rel in found if (self.package_path / rel).is_file()}
+
+    def _index_includes(self, rel: str, includes: List[str]):
+        """Record which fragments a file inlines, replacing what was known before."""
+        for includers in self._includers.values():
+            includers.discard(rel)
+        for name in includes:
+            self._includers.setdefault(name, set()).add(rel)
+
+    def _expand_deleted(self, deleted: Set[str]) -> List[str]:
+        """Turn deleted registry paths (files or directories) into target files."""
+        records = self.db.get_file_records() if self.db is not None else {}
+        files = set()
+        for rel in deleted:
+            files.add(rel)
+            target = self.manager.target_dir / rel
+            if records:
+                files.update(path for path in records if path.startswith(rel + "/"))
+            elif target.is_dir():
+                files.update(
+                    item.relative_to(self.manager.target_dir).as_posix()
+                    for item in target.rglob("*")
+                    if item.is_file()
+                )
+        return sorted(files)
+
+    def _update_db(self, rendered: List[RenderedFile], batch: WatchBatch):
+        """Record the batch in the database, touching only the changed files."""
+        with self.db.batch():
+            self._record_batch(rendered, batch)
+
+    def _record_batch(self, rendered: List[RenderedFile], batch: WatchBatch):
+        db = self.db
+        written = [rel.as_posix() for rel in batch.written]
+        removed = [rel.as_posix() for rel in batch.removed]
+
+        file_tiers = {item.rel_path.as_posix(): item.tiers for item in rendered}
+        file_tiers.update({rel: [] for rel in removed})
+        db.update_tier_index(file_tiers)
+
+        records = dict(db.get_file_records())
+        new_files = [rel for rel in written if rel not in records]
+        for rel in removed:
+            records.pop(rel, None)
+        records.update(record_files(self.manager.target_dir, written))
+        db.set_file_records(records)
+
+        versions = {}
+        for rel in written:
+            owner = component_for_path(Path(rel))
+            if owner and (owner[0] != "skill" or rel.endswith("/SKILL.md")):
+                try:
+                    manifest = ManifestParser.create_from_md(self.package_path / rel, owner[0])
+                except Exception as e:
+                    self.manager.log("warning", f"Warning: could not parse {rel}: {e}")
+                    continue
+                versions[owner[1]] = manifest.version
+        db.sync_from_detected(
+            self.manager.detect_installed_components(), self.manager.install_method, versions
+        )
+
+        # Ownership only changes when files appear or disappear
+        if new_files or removed:
+            db.set_file_ownership(
+                [rel.as_posix() for _, rel in self.manager.collect_package_files(self.package)]
+            )
@@ -0,0 +1,83 @@
+"""
+Tests for analyze.py - Prompt size analysis.
+"""
+
+import pytest
+
+from opencode_config.utils.analyze import (
+    analyze_registry,
+    estimate_tokens,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+
+
+@pytest.fixture
+def registry(mock_registry):
+    agents = mock_registry / "opencode" / "agents"
+    (agents / "_shared").mkdir()
+    (agents / "_shared" / "rules.md").write_text("one two three four, see `_shared/style.md`\n")
+    (agents / "_shared" / "style.md").write_text("be brief\n")
+    (agents / "build.md").write_text(
+        "---\ndescription: a very long description that is not part of the prompt\n---\n"
+        "Follow `_shared/rules.md`.\n"
+    )
+    (agents / "plan.md").write_text("Just plan.\n")
+    return mock_registry
+
+
+def sizes(analysis):
+    return {c.key: c for c in analysis.components}
+
+
+class TestEstimateTokens:
+    def test_counts_words_numbers_and_punctuation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("the cat") == 2
+        assert estimate_tokens("internationalization") == 5
+        assert estimate_tokens("1234567") == 3
+        assert estimate_tokens("**bold**") == 3
+        assert estimate_tokens("|---|---|") == 5
+
+
+class TestAnalyzeRegistry:
+    def test_shared_fragments_counted_transitively(self, registry):
+        analysis = analyze_registry(registry)
+        build = sizes(analysis)["agent:build"]
+
+        assert build.fragments == ["rules.md", "style.md"]
+        assert build.own == estimate_tokens("\nFollow `_shared/rules.md`.\n")
+        assert build.shared == analysis.fragments["rules.md"] + analysis.fragments["style.md"]
+        assert sizes(analysis)["agent:plan"].shared == 0
+        assert analysis.users("style.md") == 1
+
+    def test_heaviest_ranks_by_total(self, registry):
+        analysis = analyze_registry(registry)
+
+        ranked = analysis.heaviest({"agent"}, limit=2)
+        assert [c.id for c in ranked] == ["build", "plan"]
+        assert analysis.heaviest({"skill"}) == []
+
+
+class TestBaseline:
+    def test_growth_past_threshold_is_a_regression(self, registry, temp_dir):
+        baseline_path = temp_dir / "sizes.json"
+        save_baseline(analyze_registry(registry), baseline_path)
+        baseline = load_baseline(baseline_path)
+
+        # Shared fragments count against every component that uses them
+        (registry / "opencode" / "agents" / "_shared" / "style.md").write_text("be brief " * 20)
+        (registry / "opencode" / "agents" / "new.md").write_text("brand new " * 50)
+        analysis = analyze_registry(registry)
+
+        regressions = find_regressions(analysis, baseline, threshold=10)
+        assert [r.key for r in regressions] == ["agent:build"]
+        assert regressions[0].growth > 10
+        assert find_regressions(analysis, baseline, threshold=1000) == []
+
+    def test_invalid_baseline_rejected(self, temp_dir):
+        path = temp_dir / "sizes.json"
+        path.write_text('{"version": 99}')
+        with pytest.raises(ValueError):
+            load_baseline(path)
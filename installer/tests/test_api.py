@@ -0,0 +1,179 @@
+"""
+Tests for api.py - Programmatic API.
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from opencode_config import api
+from opencode_config.config import Config
+from opencode_config.utils.installed_db import InstalledDB
+
+TIERS = {
+    "high": "provider/big",
+    "medium": "provider/mid",
+    "low": "provider/small",
+    "free": "provider/free",
+}
+
+
+@pytest.fixture
+def config(temp_dir):
+    """In-memory config that never touches the home directory."""
+    return Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+
+
+@pytest.fixture
+def registry(mock_registry, mock_agent_md, mock_skill_md, mock_command_md):
+    (mock_registry / "opencode" / "agents" / "tiered.md").write_text(
+        '---\nname: "Tiered"\nversion: "2.0.0"\nmodel_tier: high\n---\n# Tiered\n'
+    )
+    (mock_registry / "bundles" / "basic.yaml").write_text(
+        "name: Basic\ncomponents: [tiered, test-agent]\n"
+    )
+    return mock_registry
+
+
+@pytest.fixture
+def target(temp_dir):
+    return temp_dir / "target"
+
+
+class TestInstall:
+    def test_installs_and_renders(self, registry, target, config, capsys):
+        result = api.install(registry, target, config)
+
+        assert result.success
+        assert Path("agents/tiered.md") in result.written
+        assert "model: provider/big" in (target / "agents" / "tiered.md").read_text()
+        assert capsys.readouterr() == ("", "")
+
+    def test_records_in_explicit_db(self, registry, target, config, temp_dir):
+        db = InstalledDB(temp_dir / "db.json")
+        result = api.install(registry, target, config, db=db, bundle="basic")
+
+        assert "tiered" in result.delta["added"]
+        assert db.data["targetDirectory"] == str(target)
+        assert db.data["bundles"]["basic"]["components"] == ["test-agent", "tiered"]
+        assert (temp_dir / "db.json").exists()
+        assert "agents/tiered.md" in db.get_file_records()
+
+    def test_bundle_installs_only_its_components(self, registry, target, config, temp_dir):
+        db = InstalledDB(temp_dir / "db.json")
+        result = api.install(registry, target, config, db=db, bundle="basic")
+
+        assert result.success
+        assert sorted(result.written) == [Path("agents/test-agent.md"), Path("agents/tiered.md")]
+        assert not (target / "skills" / "test-skill").exists()
+        assert not db.is_installed("test-skill")
+        assert db.get_files_for_tiers(["high"]) == ["agents/tiered.md"]
+
+    def test_unknown_bundle_raises(self, registry, target, config):
+        with pytest.raises(ValueError):
+            api.install(registry, target, config, bundle="nope")
+
+    def test_missing_package_reported(self, temp_dir, target, config):
+        result = api.install(temp_dir, target, config)
+        assert not result.success
+        assert result.errors
+
+    def test_concurrent_installs(self, registry, temp_dir, config):
+        targets = [temp_dir / f"t{i}" for i in range(8)]
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(lambda t: api.install(registry, t, config), targets))
+
+        assert all(r.success for r in results)
+        assert all((t / "agents" / "tiered.md").exists() for t in targets)
+
+
+class TestPlan:
+    def test_plan_on_empty_target(self, registry, target, config):
+        result = api.plan(registry, target, config)
+        assert Path("agents/tiered.md") in result.create
+        assert not result.overwrite
+        assert not target.exists()
+
+    def test_plan_after_install(self, registry, target, config):
+        api.install(registry, target, config)
+        assert api.plan(registry, target, config).changes == []
+
+        config.data["model_tiers"]["high"] = "provider/bigger"
+        assert api.plan(registry, target, config).changes == [Path("agents/tiered.md")]
+
+
+class TestUpdate:
+    def test_update_reapplies_tiers_and_versions(self, registry, target, config, temp_dir):
+        db = InstalledDB(temp_dir / "db.json")
+        api.install(registry, target, config, db=db)
+        config.data["model_tiers"]["high"] = "provider/bigger"
+
+        result = api.update(registry, target, config, db=db)
+
+        assert result.success
+        assert "model: provider/bigger" in (target / "agents" / "tiered.md").read_text()
+        assert db.get_installed_version("tiered") == "2.0.0"
+        assert "tiered" in result.delta["updated"]
+
+
+class TestUninstall:
+    def test_uninstall_removes_files_and_records(self, registry, target, config, temp_dir):
+        db = InstalledDB(temp_dir / "db.json")
+        api.install(registry, target, config, db=db)
+
+        result = api.uninstall(registry, target, config, db=db)
+
+        assert Path("agents/tiered.md") in result.removed
+        assert not (target / "agents" / "tiered.md").exists()
+        assert "tiered" in result.delta["removed"]
+        assert db.get_all_installed() == []
+
+    def test_uninstall_forgets_file_state(self, registry, target, config, temp_dir):
+        db = InstalledDB(temp_dir / "db.json")
+        api.install(registry, target, config, db=db)
+        assert db.get_files_for_tiers(["high"])
+
+        api.uninstall(registry, target, config, db=db)
+
+        assert db.get_files_for_tiers(["high"]) == []
+        assert db.get_file_records() == {}
+
+    def test_dry_run_keeps_files(self, registry, target, config):
+        api.install(registry, target, config)
+        result = api.uninstall(registry, target, config, dry_run=True)
+        assert result.removed
+        assert (target / "agents" / "tiered.md").exists()
+
+
+class TestQueries:
+    def test_list_components(self, registry):
+        ids = [e.manifest.id for e in api.list_components(registry, "agent")]
+        assert ids == ["test-agent", "tiered"]
+
+    def test_detect(self, registry, target, config):
+        api.install(registry, target, config)
+        detected = api.detect(target, config)
+        assert detected["agents"] == ["test-agent", "tiered"]
+        assert detected["skills"] == ["test-skill"]
+
+    def test_detect_writes_nothing(self, registry, target, config):
+        api.install(registry, target, config)
+        before = sorted(target.rglob("*"))
+        api.detect(target, config)
+        assert sorted(target.rglob("*")) == before
+
+
+def test_api_import_does_not_load_click_or_rich():
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    code = (
+        "import sys, opencode_config.api; "
+        "print(sorted(m for m in ('click', 'rich') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,139 @@
+"""
+Tests for archive.py - Pre-rendered archives.
+"""
+
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import archive
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def registry(mock_registry, mock_agent_md, mock_skill_md):
+    (mock_registry / "opencode" / "agents" / "tiered.md").write_text(
+        '---\nname: "Tiered"\nversion: "2.0.0"\nmodel_tier: high\n---\n# Tiered\n'
+    )
+    script = mock_registry / "opencode" / "skills" / "test-skill" / "run.sh"
+    script.write_text("echo hi\n")
+    script.chmod(0o755)
+    return mock_registry
+
+
+@pytest.fixture
+def packed(registry, temp_dir):
+    config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+    path = temp_dir / "out" / "pack.tar.gz"
+    manifest = archive.pack(registry, config, path, profile="work")
+    return path, manifest
+
+
+class TestPack:
+    def test_manifest_is_first_member(self, packed):
+        path, manifest = packed
+        with tarfile.open(path) as tar:
+            names = tar.getnames()
+        assert names[0] == archive.MANIFEST_NAME
+        assert "files/agents/tiered.md" in names
+        assert manifest["profile"] == "work"
+        assert manifest["components"]["agents"]["tiered"]["version"] == "2.0.0"
+
+    def test_unsupported_compression_leaves_nothing(self, registry, temp_dir, monkeypatch):
+        monkeypatch.setitem(archive.COMPRESSION, ".zz", "nope")
+        config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+        with pytest.raises(ValueError):
+            archive.pack(registry, config, temp_dir / "pack.tar.zz")
+        assert list(temp_dir.glob("*pack*")) == []
+
+
+class TestInstallArchive:
+    def test_installs_into_every_target(self, packed, temp_dir):
+        path, manifest = packed
+        targets = [temp_dir / "t1", temp_dir / "t2"]
+
+        _, results = archive.install_archive(path, targets)
+
+        for target in targets:
+            assert results[target].success
+            assert len(results[target].written) == len(manifest["files"])
+            assert "model: provider/big" in (target / "agents" / "tiered.md").read_text()
+            assert os.access(target / "skills" / "test-skill" / "run.sh", os.X_OK)
+
+    def test_second_install_skips_matching_files(self, packed, temp_dir):
+        path, manifest = packed
+        target = temp_dir / "t"
+        archive.install_archive(path, [target])
+        (target / "agents" / "tiered.md").write_text("edited")
+
+        _, results = archive.install_archive(path, [target])
+
+        assert [p.as_posix() for p in results[target].written] == ["agents/tiered.md"]
+        assert len(results[target].unchanged) == len(manifest["files"]) - 1
+
+    def test_dry_run_writes_nothing(self, packed, temp_dir):
+        path, _ = packed
+        _, results = archive.install_archive(path, [temp_dir / "t"], dry_run=True)
+        assert results[temp_dir / "t"].written
+        assert not (temp_dir / "t").exists()
+
+    def test_tampered_file_not_written(self, packed, temp_dir):
+        path, manifest = packed
+        tampered = temp_dir / "tampered.tar.gz"
+        with tarfile.open(path) as src, tarfile.open(tampered, "w:gz") as dst:
+            for member in src.getmembers():
+                data = src.extractfile(member).read()
+                if member.name == "files/agents/tiered.md":
+                    data = data.replace(b"provider/big", b"provider/bad")
+                    member.size = len(data)
+                dst.addfile(member, io.BytesIO(data))
+
+        _, results = archive.install_archive(tampered, [temp_dir / "t"])
+
+        assert not results[temp_dir / "t"].success
+        assert not (temp_dir / "t" / "agents" / "tiered.md").exists()
+
+    def test_rejects_foreign_archive(self, temp_dir):
+        path = temp_dir / "other.tar.gz"
+        with tarfile.open(path, "w:gz") as tar:
+            data = json.dumps({"version": 1}).encode()
+            info = tarfile.TarInfo("something.json")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+        with pytest.raises(ValueError):
+            archive.install_archive(path, [temp_dir / "t"])
+
+    def test_bad_member_after_good_ones_writes_nothing(self, packed, temp_dir):
+        path, _ = packed
+        bad = temp_dir / "bad.tar.gz"
+        with tarfile.open(path) as src, tarfile.open(bad, "w:gz") as dst:
+            for member in src.getmembers():
+                dst.addfile(member, src.extractfile(member))
+            info = tarfile.TarInfo("files/../escape.md")
+            dst.addfile(info, io.BytesIO(b""))
+
+        with pytest.raises(ValueError):
+            archive.install_archive(bad, [temp_dir / "t"])
+        assert not (temp_dir / "t").exists()
+
+    def test_member_modes_masked(self, packed, temp_dir):
+        path, _ = packed
+        setuid = temp_dir / "setuid.tar.gz"
+        with tarfile.open(path) as src, tarfile.open(setuid, "w:gz") as dst:
+            for member in src.getmembers():
+                if member.name.startswith(archive.FILES_PREFIX):
+                    member.mode = 0o4777 if member.name.endswith(".sh") else 0o666
+                dst.addfile(member, src.extractfile(member))
+
+        _, results = archive.install_archive(setuid, [temp_dir / "t"])
+
+        assert results[temp_dir / "t"].success
+        script = temp_dir / "t" / "skills" / "test-skill" / "run.sh"
+        assert script.stat().st_mode & 0o7777 == 0o755
+        assert (temp_dir / "t" / "agents" / "tiered.md").stat().st_mode & 0o7777 == 0o644
@@ -0,0 +1,85 @@
+"""
+Tests for bundles.py - Bundle resolution and switching.
+"""
+
+import os
+import time
+
+import pytest
+
+from opencode_config.utils import bundles
+from opencode_config.utils.installed_db import InstalledDB
+from opencode_config.utils.registry_index import RegistryIndex
+
+
+@pytest.fixture
+def registry(mock_registry):
+    opencode = mock_registry / "opencode"
+    (opencode / "agents" / "build.md").write_text("Delegates to `subagents/01-core/helper`.\n")
+    (opencode / "agents" / "plan.md").write_text("# Plan\n")
+    (opencode / "agents" / "subagents" / "01-core").mkdir()
+    (opencode / "agents" / "subagents" / "01-core" / "helper.md").write_text("# Helper\n")
+    (mock_registry / "bundles" / "small.yaml").write_text("components: [plan]\n")
+    (mock_registry / "bundles" / "large.yaml").write_text("components: [plan, build, gone]\n")
+    return mock_registry
+
+
+@pytest.fixture
+def db(temp_dir):
+    return InstalledDB(temp_dir / "installed.json")
+
+
+def install(db, bundle, components):
+    for cid in components:
+        db.add_component("agent", cid, {"version": "1.0.0"})
+    db.add_bundle(bundle, sorted(components))
+
+
+class TestResolveBundles:
+    def test_bundle_resolves_to_closure(self, registry):
+        resolved = bundles.resolve_bundles(registry)
+
+        assert resolved["small"]["layers"] == [["plan"]]
+        assert resolved["large"]["layers"] == [["helper", "plan"], ["build"]]
+        assert resolved["large"]["unknown"] == ["gone"]
+
+    def test_resolution_cached_until_a_bundle_changes(self, registry, temp_dir, monkeypatch):
+        index = RegistryIndex(registry, temp_dir / "index.json")
+        assert index.bundle_resolution("small")["layers"] == [["plan"]]
+
+        calls = []
+        resolve = bundles.resolve_bundles
+        monkeypatch.setattr(
+            bundles, "resolve_bundles", lambda path: calls.append(path) or resolve(path)
+        )
+        index = RegistryIndex(registry, temp_dir / "index.json")
+        index.bundle_resolution("small")
+        assert calls == []
+
+        small = registry / "bundles" / "small.yaml"
+        small.write_text("components: [build]\n")
+        future = time.time_ns() + 10_000_000_000
+        os.utime(small, ns=(future, future))
+        index = RegistryIndex(registry, temp_dir / "index.json")
+        assert index.bundle_resolution("small")["layers"] == [["helper"], ["build"]]
+        assert len(calls) == 1
+
+
+class TestPlanSwitch:
+    def test_growing_only_adds(self, db):
+        install(db, "small", {"plan"})
+        switch = bundles.plan_switch(db, "large", {"plan", "build", "helper"})
+
+        assert switch.add == {"build", "helper"}
+        assert switch.remove == set()
+        assert switch.keep == {"plan"}
+        assert switch.replaced == ["small"]
+
+    def test_shrinking_removes_only_replaced_bundle_components(self, db):
+        install(db, "large", {"plan", "build", "helper"})
+        db.add_component("agent", "mine", {"version": "1.0.0"})  # Installed on its own
+
+        switch = bundles.plan_switch(db, "small", {"plan"})
+
+        assert switch.add == set()
+        assert switch.remove == {"build", "helper"}
@@ -0,0 +1,115 @@
+"""
+Tests for catalog.py - Registry catalog.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from opencode_config.utils.catalog import (
+    Catalog,
+    component_for_path,
+    find_component,
+    iter_component_files,
+)
+
+
+@pytest.fixture
+def registry(mock_registry, mock_agent_md, mock_skill_md, mock_command_md):
+    """Registry with an agent, a subagent, a skill and a command."""
+    category = mock_registry / "opencode" / "agents" / "subagents" / "01-core"
+    category.mkdir()
+    (category / "backend-architect.md").write_text(
+        '---\nname: "Backend"\ndescription: "Backend design"\nversion: "1.1.0"\n'
+        'tags: ["backend"]\n---\n# Backend\n'
+    )
+    return mock_registry
+
+
+class TestIterComponentFiles:
+    def test_yields_every_type(self, registry):
+        found = [(t, cid) for t, cid, _ in iter_component_files(registry / "opencode")]
+        assert found == [
+            ("agent", "test-agent"),
+            ("subagent", "backend-architect"),
+            ("skill", "test-skill"),
+            ("command", "test-command"),
+        ]
+
+    def test_missing_directories_are_skipped(self, temp_dir):
+        assert list(iter_component_files(temp_dir / "opencode")) == []
+
+
+class TestCatalog:
+    def test_scan_parses_manifests(self, registry):
+        catalog = Catalog.scan(registry)
+        entry = catalog.get("test-skill")
+        assert entry.manifest.type == "skill"
+        assert entry.manifest.version == "2.0.0"
+        assert entry.path.name == "SKILL.md"
+
+    def test_get_prefers_agents(self, registry):
+        (registry / "opencode" / "commands" / "test-agent.md").write_text("# Command\n")
+        catalog = Catalog.scan(registry)
+        assert catalog.get("test-agent").manifest.type == "agent"
+        assert catalog.get("test-agent", "command").manifest.type == "command"
+
+    def test_get_missing_returns_none(self, registry):
+        assert Catalog.scan(registry).get("nope") is None
+
+    def test_filter_by_type_and_tag(self, registry):
+        catalog = Catalog.scan(registry)
+        assert [e.manifest.id for e in catalog.filter("subagent")] == ["backend-architect"]
+        assert [e.manifest.id for e in catalog.filter(tag="mock")] == ["test-agent"]
+        assert len(catalog.filter()) == 4
+
+    def test_dict_round_trip(self, registry):
+        catalog = Catalog.scan(registry)
+        restored = Catalog.from_dict(catalog.to_dict())
+        assert restored.registry_path == catalog.registry_path
+        assert [e.manifest for e in restored.entries] == [e.manifest for e in catalog.entries]
+        assert [e.path for e in restored.entries] == [e.path for e in catalog.entries]
+
+    def test_fingerprint_changes_on_edit(self, registry, mock_agent_md):
+        import os
+
+        catalog = Catalog.scan(registry)
+        before = catalog.fingerprint()
+        os.utime(mock_agent_md, ns=(1, 1))
+        assert catalog.fingerprint() != before
+
+
+class TestFindComponent:
+    @pytest.mark.parametrize(
+        "component_id, component_type",
+        [
+            ("test-agent", "agent"),
+            ("backend-architect", "subagent"),
+            ("test-skill", "skill"),
+            ("test-command", "command"),
+        ],
+    )
+    def test_finds_each_type(self, registry, component_id, component_type):
+        entry = find_component(registry, component_id)
+        assert entry.manifest.id == component_id
+        assert entry.manifest.type == component_type
+
+    def test_missing_returns_none(self, registry):
+        assert find_component(registry, "nope") is None
+
+
+class TestComponentForPath:
+    @pytest.mark.parametrize(
+        "rel_path, owner",
+        [
+            ("agents/debug.md", ("agent", "debug")),
+            ("agents/subagents/01-core/backend.md", ("subagent", "backend")),
+            ("skills/pdf/SKILL.md", ("skill", "pdf")),
+            ("skills/pdf/scripts/fill.py", ("skill", "pdf")),
+            ("commands/commit.md", ("command", "commit")),
+            ("agents/_shared/rules.md", None),
+            ("README.md", None),
+        ],
+    )
+    def test_owner(self, rel_path, owner):
+        assert component_for_path(Path(rel_path)) == owner
@@ -0,0 +1,90 @@
+"""
+Tests for cli.py - Lazy subcommand loading and startup cost.
+"""
+
+import os
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from opencode_config.cli import LAZY_SUBCOMMANDS, LazyGroup, main
+
+# Import-time budget for `opencode_config.cli`, in milliseconds
+IMPORT_BUDGET_MS = 100
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter that sees the same import path as the tests."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+
+# ---------------------------------------------------------------------------
+# LazyGroup
+# ---------------------------------------------------------------------------
+
+class TestLazyGroup:
+    def test_lists_all_lazy_commands(self):
+        ctx = click.Context(main)
+        assert main.list_commands(ctx) == sorted(LAZY_SUBCOMMANDS)
+
+    @pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+    def test_loads_command(self, name):
+        command = main.get_command(click.Context(main), name)
+        assert isinstance(command, click.Command)
+
+    @pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+    def test_static_help_matches_command(self, name):
+        """The short help shown by --help must not drift from the real command."""
+        command = main.get_command(click.Context(main), name)
+        assert command.get_short_help_str(limit=200) == LAZY_SUBCOMMANDS[name][1]
+
+    def test_unknown_command_returns_none(self):
+        assert main.get_command(click.Context(main), "nope") is None
+
+    def test_invalid_import_path_raises(self):
+        group = LazyGroup(lazy_subcommands={"bad": ("opencode_config.cli:CONTEXT_SETTINGS", "")})
+        with pytest.raises(ValueError):
+            group.get_command(click.Context(group), "bad")
+
+    def test_help_lists_commands(self):
+        result = CliRunner().invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in LAZY_SUBCOMMANDS:
+            assert name in result.output
+
+
+# ---------------------------------------------------------------------------
+# Startup benchmark
+# ---------------------------------------------------------------------------
+
+class TestStartup:
+    def test_help_does_not_import_commands_or_heavy_dependencies(self):
+        result = _run_python(
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from opencode_config.cli import main\n"
+            "CliRunner().invoke(main, ['--help'])\n"
+            "print('\\n'.join(sys.modules))\n"
+        )
+        loaded = result.stdout.split()
+        assert not [m for m in loaded if m.startswith("opencode_config.commands.")]
+        assert not [m for m in loaded if m.split(".")[0] in ("rich", "yaml")]
+
+    def test_cli_import_within_budget(self):
+        """Importing the CLI entry point must stay within the startup budget."""
+
+        def import_ms() -> float:
+            result = _run_python("import opencode_config.cli", "-X", "importtime")
+            for line in result.stderr.splitlines():
+                if line.rstrip().endswith("| opencode_config.cli"):
+                    return int(line.split("|")[1]) / 1000
+            raise AssertionError("opencode_config.cli missing from -X importtime output")
+
+        best = min(import_ms() for _ in range(3))
+        assert best < IMPORT_BUDGET_MS, f"CLI import took {best:.1f}ms"
@@ -0,0 +1,75 @@
+"""
+Tests for completion.py - Shell completion callbacks.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import completion
+from opencode_config.utils.installed_db import InstalledDB
+
+
+@pytest.fixture
+def config(temp_dir, mock_registry):
+    """Config pointing at the mock registry with an isolated config file."""
+    cfg = Config(config_file=temp_dir / "config" / "config.json")
+    cfg.data["registry_path"] = str(mock_registry)
+    opencode = mock_registry / "opencode"
+    (opencode / "agents" / "build-code.md").write_text("# B\n")
+    (opencode / "agents" / "build-infrastructure.md").write_text("# B\n")
+    (opencode / "commands" / "review.md").write_text("# R\n")
+    (mock_registry / "bundles" / "basic.yaml").write_text("name: basic\n")
+    with patch.object(completion, "Config", return_value=cfg):
+        yield cfg
+
+
+def _values(items):
+    return [item.value for item in items]
+
+
+class TestCompletion:
+    def test_complete_component_ids(self, config):
+        items = completion.complete_component_ids(None, None, "build")
+        assert _values(items) == ["build-code", "build-infrastructure"]
+        assert items[0].help == "agent"
+
+    def test_complete_component_ids_writes_index(self, config):
+        completion.complete_component_ids(None, None, "")
+        assert (config.config_file.parent / completion.INDEX_FILENAME).exists()
+
+    def test_complete_bundles(self, config):
+        assert _values(completion.complete_bundles(None, None, "b")) == ["basic"]
+
+    def test_no_registry_returns_empty(self, config):
+        config.data["registry_path"] = None
+        with patch.object(Config, "detect_registry_path", return_value=None):
+            assert completion.complete_component_ids(None, None, "") == []
+
+    def test_errors_are_swallowed(self, config):
+        with patch.object(completion, "RegistryIndex", side_effect=RuntimeError("boom")):
+            assert completion.complete_component_ids(None, None, "") == []
+
+    def test_complete_installed_ids(self, temp_dir):
+        db = InstalledDB(temp_dir / "installed.json")
+        db.add_component("agent", "build-code", {"version": "1.0.0"})
+        db.add_component("skill", "mcp-builder", {"version": "1.0.0"})
+        with patch("opencode_config.utils.installed_db.InstalledDB", return_value=db):
+            items = completion.complete_installed_ids(None, None, "b")
+        assert _values(items) == ["build-code"]
+        assert items[0].help == "agent"
+
+
+class TestCompleteTiers:
+    def test_completes_tier_names(self, monkeypatch):
+        monkeypatch.delenv("COMP_WORDS", raising=False)
+        param = MagicMock(opts=["--set"])
+        assert _values(completion.complete_tiers(None, param, "m")) == ["medium"]
+
+    def test_completes_models_after_tier(self, monkeypatch, config):
+        config.data["model_tiers"]["high"] = "provider/big"
+        monkeypatch.setenv("COMP_WORDS", "opencode-config models --set high ")
+        monkeypatch.setenv("COMP_CWORD", "4")
+        param = MagicMock(opts=["--set"])
+        assert _values(completion.complete_tiers(None, param, "")) == ["provider/big"]
@@ -3,6 +3,9 @@ Tests for config.py - Configuration management.
 """
 
 import json
+
+import pytest
+
 from opencode_config.config import Config
 
 
@@ -162,3 +165,23 @@ class TestConfig:
 
         result = config.get_model_for_tier("invalid")
         assert result is None
+
+    def test_profiles(self, temp_dir):
+        """Test named tier profiles layered over the base tiers."""
+        config_file = temp_dir / "config.json"
+        config = Config(config_file)
+        config.set_model_tier("high", "base/high")
+        config.set_model_tier("low", "base/low")
+        config.set_profile_tier("cheap", "high", "cheap/high")
+
+        reloaded = Config(config_file)
+        assert reloaded.list_profiles() == {"cheap": {"high": "cheap/high"}}
+        cheap = reloaded.profile_config("cheap")
+        assert cheap.get_model_for_tier("high") == "cheap/high"
+        assert cheap.get_model_for_tier("low") == "base/low"
+        assert reloaded.get_model_for_tier("high") == "base/high"
+
+    def test_unknown_profile(self, temp_dir):
+        """Test that an unknown profile is rejected."""
+        with pytest.raises(ValueError):
+            Config(temp_dir / "config.json").profile_config("nope")
@@ -2,6 +2,7 @@
 Tests for copy.py - CopyManager file installation.
 """
 
+import os
 import pytest
 import tempfile
 import shutil
@@ -9,6 +10,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.template import CompiledTemplate
 from opencode_config.config import Config
 
 
@@ -156,6 +158,99 @@ class TestInstallPackage:
         result = copy_manager.install_package("opencode")
         assert result is True
 
+    def test_unwritable_directory_reported_not_raised(self, copy_manager, registry, target_dir):
+        skill = registry / "opencode" / "skills" / "blocked"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text("# Blocked\n")
+        (registry / "opencode" / "commands" / "ok.md").write_text("# Ok\n")
+        (target_dir / "skills").mkdir(parents=True)
+        (target_dir / "skills" / "blocked").write_text("a file where a directory goes")
+
+        assert copy_manager.install_package("opencode") is False
+        assert (target_dir / "commands" / "ok.md").exists()
+
+
+# ---------------------------------------------------------------------------
+# install_package_to_targets
+# ---------------------------------------------------------------------------
+
+class TestInstallPackageToTargets:
+    def test_writes_identical_files_to_every_target(self, copy_manager, registry, temp_dir):
+        (registry / "opencode" / "agents" / "tiered.md").write_text(
+            "---\nname: Tiered\ndescription: t\ntype: agent\nmodel_tier: low\n---\n# Tiered\n"
+        )
+        (registry / "opencode" / "skills" / "my-skill" / "run.sh").write_text("echo hi\n")
+        targets = [temp_dir / "a", temp_dir / "b", temp_dir / "c"]
+
+        results = copy_manager.install_package_to_targets("opencode", targets)
+
+        assert results == {t: True for t in targets}
+        for target in targets:
+            content = (target / "agents" / "tiered.md").read_text()
+            assert "model: github-copilot/claude-haiku-4.5" in content
+            assert (target / "skills" / "my-skill" / "run.sh").read_text() == "echo hi\n"
+
+    def test_renders_each_file_once(self, copy_manager, registry, temp_dir):
+        (registry / "opencode" / "agents" / "a.md").write_text("---\nmodel_tier: high\n---\n")
+        targets = [temp_dir / "a", temp_dir / "b"]
+
+        with patch.object(copy_manager, "render_file", wraps=copy_manager.render_file) as render:
+            copy_manager.install_package_to_targets("opencode", targets)
+
+        assert render.call_count == 1
+
+    def test_missing_package_fails_every_target(self, copy_manager, temp_dir):
+        targets = [temp_dir / "a", temp_dir / "b"]
+        assert copy_manager.install_package_to_targets("missing", targets) == {
+            t: False for t in targets
+        }
+
+    def test_unwritable_target_reported(self, copy_manager, registry, temp_dir):
+        (registry / "opencode" / "agents" / "a.md").write_text("# A\n")
+        blocked = temp_dir / "blocked"
+        blocked.write_text("not a directory")
+        ok = temp_dir / "ok"
+
+        results = copy_manager.install_package_to_targets("opencode", [ok, blocked])
+
+        assert results == {ok: True, blocked: False}
+        assert (ok / "agents" / "a.md").exists()
+
+
+# ---------------------------------------------------------------------------
+# render_variants / write_variants
+# ---------------------------------------------------------------------------
+
+class TestRenderVariants:
+    @pytest.fixture
+    def configs(self, temp_dir):
+        return {
+            name: Config(temp_dir / f"{name}.json", data={"model_tiers": {"high": f"{name}/h"}})
+            for name in ("cheap", "premium")
+        }
+
+    def test_each_variant_uses_its_tiers(self, copy_manager, registry, temp_dir, configs):
+        (registry / "opencode" / "agents" / "a.md").write_text("---\nmodel_tier: high\n---\n")
+        (registry / "opencode" / "skills" / "my-skill" / "run.sh").write_text("echo\n")
+        targets = {name: temp_dir / name for name in configs}
+
+        variants, ok = copy_manager.render_variants("opencode", configs)
+        results = copy_manager.write_variants(variants, targets)
+
+        assert ok and results == {"cheap": True, "premium": True}
+        for name, target in targets.items():
+            assert "model: " + name + "/h" in (target / "agents" / "a.md").read_text()
+            assert (target / "skills" / "my-skill" / "run.sh").read_text() == "echo\n"
+
+    def test_sources_parsed_once(self, copy_manager, registry, configs):
+        (registry / "opencode" / "agents" / "a.md").write_text("---\nmodel_tier: high\n---\n")
+
+        with patch.object(CompiledTemplate, "parse", wraps=CompiledTemplate.parse) as parse:
+            variants, _ = copy_manager.render_variants("opencode", configs)
+
+        assert parse.call_count == 1
+        assert variants["cheap"][0].content != variants["premium"][0].content
+
 
 # ---------------------------------------------------------------------------
 # uninstall_package
@@ -198,6 +293,40 @@ class TestUninstallPackage:
         # agents/ dir should be gone since it's empty
         assert not (target_dir / "agents").exists()
 
+    def test_uninstall_keeps_unrelated_empty_dirs(self, copy_manager, registry, target_dir):
+        """Only directories emptied by the uninstall are pruned."""
+        (registry / "opencode" / "agents" / "a.md").write_text("---\nname: A\n---\n")
+        copy_manager.install_package("opencode")
+        (target_dir / "plugins" / "cache").mkdir(parents=True)
+
+        copy_manager.uninstall_package("opencode")
+
+        assert not (target_dir / "agents").exists()
+        assert (target_dir / "plugins" / "cache").is_dir()
+
+    def test_remove_files_prunes_only_emptied_dirs(self, copy_manager, target_dir):
+        skill = target_dir / "skills" / "gone" / "scripts"
+        skill.mkdir(parents=True)
+        (skill / "run.sh").write_text("echo\n")
+        (target_dir / "skills" / "keep.md").write_text("keep\n")
+        (target_dir / "unrelated").mkdir()
+
+        removed = copy_manager.remove_files(["skills/gone/scripts/run.sh", "skills/missing.md"])
+
+        assert removed == [Path("skills/gone/scripts/run.sh")]
+        assert not (target_dir / "skills" / "gone").exists()
+        assert (target_dir / "skills" / "keep.md").exists()
+        assert (target_dir / "unrelated").is_dir()
+
+    def test_remove_files_dry_run(self, copy_manager, target_dir):
+        (target_dir / "agents").mkdir()
+        (target_dir / "agents" / "a.md").write_text("a\n")
+
+        removed = copy_manager.remove_files(["agents/a.md"], dry_run=True)
+
+        assert removed == [Path("agents/a.md")]
+        assert (target_dir / "agents" / "a.md").exists()
+
 
 # ---------------------------------------------------------------------------
 # detect_installed_components
@@ -260,11 +389,55 @@ class TestDetectInstalledComponents:
         assert "deploy" in result["commands"]
 
 
+    def test_snapshot_written(self, copy_manager, target_dir):
+        (target_dir / "commands").mkdir()
+        (target_dir / "commands" / "deploy.md").write_text("# Deploy\n")
+
+        copy_manager.detect_installed_components()
+        assert copy_manager.snapshot_path.exists()
+
+    def test_unchanged_dirs_served_from_snapshot(self, copy_manager, target_dir):
+        """Directories whose mtime did not change are not rescanned."""
+        commands_dir = target_dir / "commands"
+        commands_dir.mkdir()
+        (commands_dir / "deploy.md").write_text("# Deploy\n")
+        os.utime(commands_dir, ns=(1_000_000_000, 1_000_000_000))
+        copy_manager.detect_installed_components()
+
+        # Add a file but restore the old mtime: the cached listing is reused
+        (commands_dir / "sneaky.md").write_text("# Sneaky\n")
+        os.utime(commands_dir, ns=(1_000_000_000, 1_000_000_000))
+        result = copy_manager.detect_installed_components()
+        assert result["commands"] == ["deploy"]
+
+        result = copy_manager.detect_installed_components(use_snapshot=False)
+        assert result["commands"] == ["deploy", "sneaky"]
+
+    def test_changed_dirs_rescanned(self, copy_manager, target_dir):
+        skills_dir = target_dir / "skills"
+        (skills_dir / "first").mkdir(parents=True)
+        (skills_dir / "first" / "SKILL.md").write_text("# First\n")
+        os.utime(skills_dir, ns=(1_000_000_000, 1_000_000_000))
+        assert copy_manager.detect_installed_components()["skills"] == ["first"]
+
+        (skills_dir / "second").mkdir()
+        (skills_dir / "second" / "SKILL.md").write_text("# Second\n")
+        assert copy_manager.detect_installed_components()["skills"] == ["first", "second"]
+
+    def test_corrupt_snapshot_ignored(self, copy_manager, target_dir):
+        (target_dir / "commands").mkdir()
+        (target_dir / "commands" / "deploy.md").write_text("# Deploy\n")
+        copy_manager.snapshot_path.write_text("{not json")
+
+        result = copy_manager.detect_installed_components()
+        assert result["commands"] == ["deploy"]
+
+
 # ---------------------------------------------------------------------------
-# _copy_and_process_file (via install_package)
+# render_file (via install_package)
 # ---------------------------------------------------------------------------
 
-class TestCopyAndProcessFile:
+class TestRenderFile:
     def test_medium_tier_resolved(self, copy_manager, registry, target_dir):
         agent = registry / "opencode" / "agents" / "medium.md"
         agent.write_text(
@@ -306,6 +479,33 @@ class TestCopyAndProcessFile:
         assert "model: github-copilot/claude-haiku-4.5" in content
         assert "model_tier" not in content
 
+    def test_render_reports_tiers(self, copy_manager, registry):
+        source = registry / "opencode" / "agents" / "mixed.md"
+        source.write_text("---\nmodel_tier: high\n---\nFallback: {{tier:low}}\n")
+        rendered = copy_manager.render_file(source, Path("agents/mixed.md"))
+        assert rendered.tiers == ["high", "low"]
+
+    def test_render_with_override_has_no_tier_dependency(self, copy_manager, registry):
+        source = registry / "opencode" / "agents" / "pinned.md"
+        source.write_text("---\nmodel_tier: high\n---\n")
+        rendered = copy_manager.render_file(source, Path("agents/pinned.md"), "x/y")
+        assert rendered.tiers == []
+
+    def test_rerender_files_rewrites_selected(
+        self, copy_manager, registry, target_dir, mock_config
+    ):
+        (registry / "opencode" / "agents" / "a.md").write_text("---\nmodel_tier: high\n---\n")
+        (registry / "opencode" / "agents" / "b.md").write_text("---\nmodel_tier: low\n---\n")
+        copy_manager.install_package("opencode")
+        (target_dir / "agents" / "b.md").write_text("untouched")
+        mock_config.get_model_for_tier.side_effect = lambda tier: "new/model"
+
+        written = copy_manager.rerender_files(["agents/a.md", "agents/gone.md"])
+
+        assert written == [Path("agents/a.md")]
+        assert "model: new/model" in (target_dir / "agents" / "a.md").read_text()
+        assert (target_dir / "agents" / "b.md").read_text() == "untouched"
+
     def test_non_md_file_copied_without_processing(self, copy_manager, registry, target_dir):
         """Non-markdown files should be copied as-is."""
         binary_like = registry / "opencode" / "agents" / "config.json"
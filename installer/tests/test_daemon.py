@@ -0,0 +1,127 @@
+"""
+Tests for daemon.py - Resident catalog daemon and client.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import daemon
+from opencode_config.utils.catalog import Catalog
+from opencode_config.utils.installed_db import InstalledDB
+
+
+@pytest.fixture
+def socket_file(temp_dir, monkeypatch):
+    path = temp_dir / "daemon.sock"
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(path))
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    return path
+
+
+@pytest.fixture
+def running_daemon(socket_file, monkeypatch):
+    """Serve a daemon in a background thread for the duration of a test."""
+    server = daemon.DaemonServer(socket_file)
+    thread = threading.Thread(target=server.serve_until_shutdown, daemon=True)
+    thread.start()
+    yield server
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    daemon.request("shutdown")
+    thread.join(timeout=5)
+
+
+class TestClientWithoutDaemon:
+    def test_request_returns_none_without_socket(self, socket_file):
+        assert daemon.request("ping") is None
+
+    def test_request_returns_none_for_stale_socket(self, socket_file):
+        socket_file.write_text("")
+        assert daemon.request("ping") is None
+
+    def test_load_catalog_falls_back_to_scan(self, socket_file, mock_registry, mock_agent_md):
+        catalog = daemon.load_catalog(mock_registry)
+        assert catalog.get("test-agent") is not None
+
+    def test_load_component_falls_back_to_probe(self, socket_file, mock_registry, mock_agent_md):
+        assert daemon.load_component(mock_registry, "test-agent").manifest.type == "agent"
+
+
+class TestDaemon:
+    def test_ping(self, running_daemon):
+        assert "pid" in daemon.request("ping")
+
+    def test_socket_is_private(self, running_daemon, socket_file):
+        assert socket_file.stat().st_mode & 0o077 == 0
+
+    def test_second_daemon_refused(self, running_daemon, socket_file):
+        with pytest.raises(RuntimeError):
+            daemon.DaemonServer(socket_file)
+
+    def test_serves_catalog(self, running_daemon, mock_registry, mock_agent_md):
+        catalog = daemon.load_catalog(mock_registry)
+        assert isinstance(catalog, Catalog)
+        assert catalog.get("test-agent").manifest.version == "1.2.3"
+
+    def test_serves_component(self, running_daemon, mock_registry, mock_skill_md):
+        entry = daemon.load_component(mock_registry, "test-skill")
+        assert entry.path == mock_skill_md
+        assert daemon.load_component(mock_registry, "missing") is None
+
+    def test_catalog_reloaded_after_registry_change(
+        self, running_daemon, mock_registry, mock_agent_md
+    ):
+        assert daemon.load_catalog(mock_registry).get("new-agent") is None
+
+        (mock_registry / "opencode" / "agents" / "new-agent.md").write_text("# New\n")
+        assert daemon.load_catalog(mock_registry).get("new-agent") is not None
+
+    def test_catalog_reloaded_after_file_edit(self, running_daemon, mock_registry, mock_agent_md):
+        daemon.load_catalog(mock_registry)
+        mock_agent_md.write_text(mock_agent_md.read_text().replace("1.2.3", "1.3.0"))
+        os.utime(mock_agent_md, ns=(1, 1))  # rule out a same-tick mtime
+
+        entry = daemon.load_catalog(mock_registry).get("test-agent")
+        assert entry.manifest.version == "1.3.0"
+
+    def test_serves_installed_db_and_reloads(self, running_daemon, temp_dir):
+        db_path = temp_dir / "installed.json"
+        InstalledDB(db_path).add_component("agent", "a1", {"version": "1.0.0"})
+        assert "a1" in daemon.request("installed", file=str(db_path))["installed"]["agents"]
+
+        InstalledDB(db_path).add_component("agent", "a2", {"version": "1.0.0"})
+        assert "a2" in daemon.request("installed", file=str(db_path))["installed"]["agents"]
+
+    def test_serves_config(self, running_daemon, temp_dir):
+        config_file = temp_dir / "config.json"
+        Config(config_file).set_model_tier("high", "provider/big")
+        data = daemon.request("config", file=str(config_file))
+        assert data["model_tiers"]["high"] == "provider/big"
+
+    def test_unknown_query_returns_none(self, running_daemon):
+        assert daemon.request("nope") is None
+
+    def test_disable_env_skips_daemon(self, running_daemon, monkeypatch):
+        monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+        assert daemon.request("ping") is None
+
+    def test_shutdown_removes_socket(self, socket_file):
+        server = daemon.DaemonServer(socket_file)
+        thread = threading.Thread(target=server.serve_until_shutdown, daemon=True)
+        thread.start()
+        assert daemon.request("shutdown") == {}
+        thread.join(timeout=5)
+        assert not socket_file.exists()
+
+
+class TestCatalogServer:
+    def test_malformed_query_raises(self):
+        with pytest.raises(KeyError):
+            daemon.CatalogServer().handle({"op": "catalog"})
+
+    def test_result_is_json_serializable(self, mock_registry, mock_agent_md):
+        result = daemon.CatalogServer().handle({"op": "catalog", "registry": str(mock_registry)})
+        json.dumps(result)
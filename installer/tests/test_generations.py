@@ -0,0 +1,86 @@
+"""
+Tests for generations.py - Generation-based installs and rollback.
+"""
+
+import os
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.generations import GENERATIONS_DIRNAME, Generations, install_generation
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def target(temp_dir):
+    return temp_dir / "target"
+
+
+@pytest.fixture
+def manager(mock_registry, mock_agent_md, target, temp_dir):
+    config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+    return CopyManager(mock_registry, target, config, log=lambda *args: None)
+
+
+def install(manager):
+    return manager.install_package("opencode")
+
+
+def set_agent(mock_registry, text):
+    (mock_registry / "opencode" / "agents" / "test-agent.md").write_text(text)
+
+
+class TestGenerations:
+    def test_install_links_managed_dirs_through_current(self, manager, target):
+        (target / "agents").mkdir(parents=True)
+        (target / "agents" / "mine.md").write_text("user file")
+
+        assert install_generation(manager, 3, install) == 1
+
+        assert os.readlink(target / "agents") == f"{GENERATIONS_DIRNAME}/current/agents"
+        assert (target / "agents" / "test-agent.md").exists()
+        assert (target / "agents" / "mine.md").read_text() == "user file"
+        assert Generations(target).current() == 1
+
+    def test_rollback_restores_previous_content(self, manager, mock_registry, target):
+        set_agent(mock_registry, "old\n")
+        install_generation(manager, 3, install)
+        set_agent(mock_registry, "new\n")
+        install_generation(manager, 3, install)
+        assert (target / "agents" / "test-agent.md").read_text() == "new\n"
+
+        generations = Generations(target)
+        generations.activate(generations.previous())
+
+        assert generations.current() == 1
+        assert (target / "agents" / "test-agent.md").read_text() == "old\n"
+
+    def test_prune_keeps_newest_and_active(self, manager, target):
+        for _ in range(4):
+            install_generation(manager, 2, install)
+        assert Generations(target).list() == [3, 4]
+
+        generations = Generations(target)
+        generations.activate(3)
+        install_generation(manager, 2, install)
+        assert generations.list() == [4, 5]
+
+    def test_failed_install_discarded(self, manager, target):
+        install_generation(manager, 3, install)
+
+        assert install_generation(manager, 3, lambda m: False) is None
+        assert Generations(target).list() == [1]
+        assert Generations(target).current() == 1
+
+    def test_saved_database_round_trips(self, manager, target):
+        number = install_generation(manager, 3, install)
+        Generations(target).save_db(number, {"installed": {"agents": {"a": {}}}})
+
+        assert Generations(target).load_db(number) == {"installed": {"agents": {"a": {}}}}
+        assert Generations(target).load_db(99) is None
+
+    def test_activate_unknown_generation(self, target):
+        with pytest.raises(ValueError):
+            Generations(target).activate(7)
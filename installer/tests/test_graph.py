@@ -0,0 +1,91 @@
+"""
+Tests for graph.py - Component dependency graph.
+"""
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils.catalog import Catalog
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.graph import CycleError, DependencyGraph
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def registry(mock_registry):
+    opencode = mock_registry / "opencode"
+    write(
+        opencode / "agents" / "build.md",
+        '---\nversion: "1.0.0"\n---\nSee `_shared/rules.md`.\n',
+    )
+    write(opencode / "agents" / "other.md", '---\nversion: "1.0.0"\n---\nNo delegation.\n')
+    write(opencode / "agents" / "_shared" / "rules.md", "Also `_shared/more.md`.\n")
+    write(
+        opencode / "agents" / "_shared" / "more.md",
+        'task(subagent_type="subagents/03-infra/terraform-expert")\n',
+    )
+    write(
+        opencode / "agents" / "subagents" / "03-infra" / "terraform-expert.md",
+        '---\nversion: "1.0.0"\ndependencies: ["lint"]\n---\nTerraform.\n',
+    )
+    write(opencode / "skills" / "lint" / "SKILL.md", "---\nname: lint\n---\nLint.\n")
+    write(opencode / "commands" / "unused.md", "---\ndescription: x\n---\nUnused.\n")
+    return mock_registry
+
+
+class TestDependencyGraph:
+    def test_closure_follows_shared_files_and_dependencies(self, registry):
+        graph = DependencyGraph.from_catalog(Catalog.scan(registry))
+
+        assert graph.closure(["build"]) == {"build", "terraform-expert", "lint"}
+        assert graph.closure(["other"]) == {"other"}
+
+    def test_layers_put_dependencies_first(self, registry):
+        graph = DependencyGraph.from_catalog(Catalog.scan(registry))
+        closure = graph.closure(["build"])
+
+        assert graph.layers(closure) == [["lint"], ["terraform-expert"], ["build"]]
+        assert graph.order(closure) == ["lint", "terraform-expert", "build"]
+
+    def test_independent_components_share_a_layer(self):
+        graph = DependencyGraph({"a": {"c"}, "b": {"c"}, "c": set()})
+        assert graph.layers() == [["c"], ["a", "b"]]
+
+    def test_cycle_detected(self):
+        graph = DependencyGraph({"a": {"b"}, "b": {"c"}, "c": {"a"}, "d": {"a"}})
+
+        assert graph.closure(["d"]) == {"a", "b", "c", "d"}
+        with pytest.raises(CycleError) as excinfo:
+            graph.layers()
+        assert excinfo.value.cycle == ["a", "b", "c", "a"]
+
+    def test_unknown_references_kept_apart(self):
+        graph = DependencyGraph({"a": {"missing", "a"}})
+
+        assert graph.edges == {"a": set()}
+        assert graph.unresolved == {"a": {"missing"}}
+        with pytest.raises(KeyError):
+            graph.closure(["missing"])
+
+
+class TestInstallComponents:
+    def test_installs_only_the_closure(self, registry, temp_dir):
+        config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+        target = temp_dir / "target"
+        manager = CopyManager(registry, target, config, log=lambda *args: None)
+        graph = DependencyGraph.from_catalog(Catalog.scan(registry))
+
+        assert manager.install_components("opencode", graph.layers(graph.closure(["build"])))
+
+        assert (target / "agents" / "build.md").exists()
+        assert (target / "agents" / "_shared" / "more.md").exists()
+        assert (target / "agents" / "subagents" / "03-infra" / "terraform-expert.md").exists()
+        assert (target / "skills" / "lint" / "SKILL.md").exists()
+        assert not (target / "agents" / "other.md").exists()
+        assert not (target / "commands" / "unused.md").exists()
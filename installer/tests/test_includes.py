@@ -0,0 +1,115 @@
+"""
+Tests for includes.py - Shared fragment includes.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.includes import FragmentCache, expand_includes
+from opencode_config.utils.template import CompiledTemplate
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def agents_dir(mock_registry):
+    agents = mock_registry / "opencode" / "agents"
+    (agents / "_shared").mkdir()
+    (agents / "_shared" / "rules.md").write_text("Rules.\n{{include:_shared/style.md}}\n")
+    (agents / "_shared" / "style.md").write_text(
+        "---\nname: Style\n---\nUse {{tier:low}} for lookups.\n"
+    )
+    return agents
+
+
+class TestExpandIncludes:
+    def test_inline_expands_nested_fragments(self, agents_dir):
+        expansion = expand_includes("# A\n{{include:_shared/rules.md}}\nEnd\n", agents_dir)
+
+        assert expansion.text == "# A\nRules.\nUse {{tier:low}} for lookups.\nEnd\n"
+        assert expansion.included == ["_shared/rules.md", "_shared/style.md"]
+        assert expansion.problems == []
+
+    def test_reference_points_at_fragment(self, agents_dir):
+        expansion = expand_includes("{{include:_shared/rules.md}}\n", agents_dir, "reference")
+
+        assert expansion.text == "See `_shared/rules.md`.\n"
+        assert expansion.included == []
+
+    def test_bad_directives_left_as_written(self, agents_dir):
+        (agents_dir / "_shared" / "loop.md").write_text("{{include:_shared/loop.md}}")
+        text = "{{include:_shared/missing.md}} {{include:../../x.md}} {{include:_shared/loop.md}}"
+
+        expansion = expand_includes(text, agents_dir)
+
+        assert expansion.text == text
+        assert len(expansion.problems) == 3
+        assert "include cycle: _shared/loop.md -> _shared/loop.md" in expansion.problems
+
+    def test_unknown_mode_rejected(self, agents_dir):
+        with pytest.raises(ValueError):
+            expand_includes("x", agents_dir, "embed")
+
+    def test_fragments_read_once_until_changed(self, agents_dir):
+        cache = FragmentCache()
+        for _ in range(20):
+            expand_includes("{{include:_shared/rules.md}}", agents_dir, cache=cache)
+        assert cache.reads == 2
+
+        (agents_dir / "_shared" / "style.md").write_text("Changed and longer.\n")
+        expansion = expand_includes("{{include:_shared/rules.md}}", agents_dir, cache=cache)
+        assert expansion.text == "Rules.\nChanged and longer."
+        assert cache.reads == 3
+
+
+class TestIncludeStage:
+    def install(self, mock_registry, temp_dir, includes):
+        config = Config(
+            temp_dir / "config.json", data={"model_tiers": dict(TIERS), "includes": includes}
+        )
+        manager = CopyManager(mock_registry, temp_dir / "target", config, log=lambda *args: None)
+        source = mock_registry / "opencode" / "agents" / "build.md"
+        return manager.render_file(source, Path("agents/build.md"))
+
+    def test_inlined_fragments_rendered_with_tiers(self, mock_registry, agents_dir, temp_dir):
+        (agents_dir / "build.md").write_text(
+            "---\nmodel_tier: high\n---\n{{include:_shared/rules.md}}\n"
+        )
+
+        rendered = self.install(mock_registry, temp_dir, "inline")
+
+        assert rendered.content == (
+            "---\nmodel: provider/big\n---\nRules.\nUse provider/small for lookups.\n"
+        )
+        assert rendered.tiers == ["high", "low"]
+        assert rendered.includes == ["agents/_shared/rules.md", "agents/_shared/style.md"]
+
+    def test_reference_mode(self, mock_registry, agents_dir, temp_dir):
+        (agents_dir / "build.md").write_text("{{include:_shared/rules.md}}\n")
+
+        rendered = self.install(mock_registry, temp_dir, "reference")
+
+        assert rendered.content == "See `_shared/rules.md`.\n"
+        assert rendered.includes == []
+
+    def test_variants_parse_expanded_text_once(self, mock_registry, agents_dir, temp_dir):
+        (agents_dir / "build.md").write_text(
+            "---\nmodel_tier: high\n---\n{{include:_shared/rules.md}}\n"
+        )
+        configs = {
+            name: Config(temp_dir / f"{name}.json", data={"model_tiers": {**TIERS, "low": name}})
+            for name in ("a", "b", "c")
+        }
+        manager = CopyManager(mock_registry, temp_dir / "target", configs["a"])
+
+        with patch.object(CompiledTemplate, "parse", wraps=CompiledTemplate.parse) as parse:
+            variants, success = manager.render_variants("opencode", configs, {"build"})
+
+        assert success
+        assert parse.call_count == len(variants["a"])  # Once per file, not per variant
+        build = next(item for item in variants["c"] if item.rel_path == Path("agents/build.md"))
+        assert build.content == "---\nmodel: provider/big\n---\nRules.\nUse c for lookups.\n"
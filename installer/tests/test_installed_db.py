@@ -2,6 +2,12 @@
 Tests for installed_db.py - Installation database management.
 """
 
+import json
+from unittest.mock import patch
+
+from opencode_config.commands.install import _record_install
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
 from opencode_config.utils.installed_db import InstalledDB
 
 
@@ -218,6 +224,36 @@ class TestInstalledDB:
         db.set_registry_path("/path/to/registry")
         assert db.data["registry"]["path"] == "/path/to/registry"
 
+    def test_tier_index(self, temp_dir):
+        """Test recording and querying the tier → files index."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.set_tier_index({"high": ["agents/a.md", "commands/c.md"], "low": ["agents/a.md"]})
+
+        reloaded = InstalledDB(temp_dir / "installed.json")
+        assert reloaded.get_files_for_tiers(["high", "low"]) == ["agents/a.md", "commands/c.md"]
+        assert reloaded.get_files_for_tiers(["medium"]) == []
+        assert reloaded.get_model_override() is None
+
+    def test_file_ownership(self, temp_dir):
+        """Test recording which installed files belong to each component."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.add_component("agent", "a", {"version": "1.0.0"})
+        db.add_component("skill", "s", {"version": "1.0.0"})
+        db.set_tier_index({"high": ["agents/a.md"]})
+
+        db.set_file_ownership(["agents/a.md", "agents/_shared/x.md", "skills/s/SKILL.md"])
+
+        assert db.get_component_type("s") == "skill"
+        assert db.get_component_type("missing") is None
+        assert db.get_component("skill", "s")["files"] == ["skills/s/SKILL.md"]
+        assert db.data["sharedFiles"] == ["agents/_shared/x.md"]
+
+        db.set_file_records({"agents/a.md": {"hash": "h", "size": 1, "mtime": 0}})
+
+        db.remove_component("agent", "a")
+        assert db.get_files_for_tiers(["high"]) == []
+        assert db.get_file_records() == {}
+
     def test_sync_from_detected(self, temp_dir):
         """Test syncing database from detected components."""
         db = InstalledDB(temp_dir / "installed.json")
@@ -241,6 +277,21 @@ class TestInstalledDB:
         # Check default version
         assert db.data["installed"]["agents"]["agent1"]["version"] == "1.0.0"
 
+    def test_sync_from_detected_forgets_removed_files(self, temp_dir):
+        """Test that components dropped by a sync lose their tiers and file records."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.add_component("agent", "a", {"version": "1.0.0"})
+        db.add_component("agent", "b", {"version": "1.0.0"})
+        db.set_file_ownership(["agents/a.md", "agents/b.md"])
+        db.set_tier_index({"high": ["agents/a.md", "agents/b.md"]})
+        record = {"hash": "h", "size": 1, "mtime": 0}
+        db.set_file_records({"agents/a.md": record, "agents/b.md": record})
+
+        db.sync_from_detected({"agents": ["b"]}, "copy")
+
+        assert db.get_files_for_tiers(["high"]) == ["agents/b.md"]
+        assert list(db.get_file_records()) == ["agents/b.md"]
+
     def test_sync_from_detected_with_versions(self, temp_dir):
         """Test syncing with component versions provided."""
         db = InstalledDB(temp_dir / "installed.json")
@@ -255,6 +306,59 @@ class TestInstalledDB:
         assert db.data["installed"]["agents"]["agent1"]["version"] == "1.5.0"
         assert db.data["installed"]["skills"]["skill1"]["version"] == "2.0.0"
 
+    def test_sync_from_detected_preserves_unchanged_records(self, temp_dir):
+        """Test that unchanged records keep their metadata across syncs."""
+        db = InstalledDB(temp_dir / "installed.json")
+
+        db.sync_from_detected({"agents": ["agent1"]}, "copy", component_versions={"agent1": "2.1.0"})
+        original = dict(db.data["installed"]["agents"]["agent1"])
+
+        # A later sync without versions must not reset the record
+        delta = db.sync_from_detected({"agents": ["agent1"]}, "copy")
+
+        assert db.data["installed"]["agents"]["agent1"] == original
+        assert delta["unchanged"] == ["agent1"]
+        assert delta["added"] == [] and delta["removed"] == [] and delta["updated"] == []
+
+    def test_sync_from_detected_reports_delta(self, temp_dir):
+        """Test that sync returns added, removed and updated components."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.sync_from_detected({"agents": ["keep", "gone"], "skills": ["skill1"]}, "copy")
+
+        delta = db.sync_from_detected(
+            {"agents": ["keep", "new"], "skills": ["skill1"]},
+            "copy",
+            component_versions={"skill1": "3.0.0"},
+        )
+
+        assert delta["added"] == ["new"]
+        assert delta["removed"] == ["gone"]
+        assert delta["updated"] == ["skill1"]
+        assert delta["unchanged"] == ["keep"]
+        assert db.data["installed"]["skills"]["skill1"]["version"] == "3.0.0"
+
+    def test_sync_from_detected_skips_save_when_unchanged(self, temp_dir):
+        """Test that an unchanged sync does not rewrite the database file."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.sync_from_detected({"agents": ["agent1"]}, "copy")
+        last_updated = db.data["lastUpdated"]
+
+        db.sync_from_detected({"agents": ["agent1"]}, "copy")
+
+        assert db.data["lastUpdated"] == last_updated
+
+    def test_sync_from_detected_dry_run(self, temp_dir):
+        """Test that a dry run computes the delta without modifying records."""
+        db = InstalledDB(temp_dir / "installed.json")
+        db.add_component("agent", "old-agent", {"version": "1.0.0"})
+
+        delta = db.sync_from_detected({"agents": ["agent1"]}, "copy", dry_run=True)
+
+        assert delta["added"] == ["agent1"]
+        assert delta["removed"] == ["old-agent"]
+        assert "old-agent" in db.data["installed"]["agents"]
+        assert "agent1" not in db.data["installed"]["agents"]
+
     def test_timestamp_format(self, temp_dir):
         """Test timestamp format is ISO 8601."""
         db = InstalledDB(temp_dir / "installed.json")
@@ -279,3 +383,34 @@ class TestInstalledDB:
         db2 = InstalledDB(db_path)
         assert db2.is_installed("test")
         assert db2.get_installed_version("test") == "1.0.0"
+
+    def test_batch_saves_once(self, temp_dir):
+        """Test that updates inside batch() write the file once, at the end."""
+        db_path = temp_dir / "installed.json"
+        db = InstalledDB(db_path)
+
+        with patch("opencode_config.utils.installed_db.json.dump", wraps=json.dump) as dump:
+            with db.batch():
+                db.set_install_method("copy")
+                with db.batch():
+                    db.set_target_directory("/tmp/target")
+                db.add_bundle("basic", ["a"])
+                assert not db_path.exists()
+
+        assert dump.call_count == 1
+        assert InstalledDB(db_path).data["bundles"]["basic"]["components"] == ["a"]
+
+    def test_record_install_saves_once(self, temp_dir, mock_registry, mock_agent_md):
+        """Test that recording an install writes the database file once."""
+        config = Config(temp_dir / "config.json", data={})
+        manager = CopyManager(mock_registry, temp_dir / "target", config, log=lambda *args: None)
+        assert manager.install_package("opencode")
+        db = InstalledDB(temp_dir / "installed.json")
+
+        with patch("opencode_config.utils.installed_db.json.dump", wraps=json.dump) as dump:
+            _record_install(db, manager, mock_registry, ["test-agent"], ("basic", ["test-agent"]))
+
+        # The detection snapshot is written with json.dump too
+        writes = [c for c in dump.call_args_list if c.args[1].name == str(db.db_path)]
+        assert len(writes) == 1
+        assert InstalledDB(temp_dir / "installed.json").is_installed("test-agent")
@@ -5,6 +5,7 @@ Tests the full pipeline: config → template resolution → copy → installed f
 """
 
 import json
+import os
 import pytest
 import tempfile
 import shutil
@@ -13,7 +14,9 @@ from click.testing import CliRunner
 
 from opencode_config.config import Config, DEFAULT_CONFIG
 from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.installed_db import InstalledDB
 from opencode_config.utils.template import TemplateEngine
+from opencode_config.utils.verify import record_files, verify_files
 from opencode_config.commands.models import models
 
 
@@ -206,11 +209,14 @@ class TestFullInstallPipeline:
 
 class TestModelsCommandIntegration:
     def _invoke(self, args, config_file):
-        """Invoke models command with isolated config."""
+        """Invoke models command with isolated config and database."""
         runner = CliRunner()
-        # Patch Config to use our temp file
+        # Patch Config and InstalledDB to use our temp files
         from unittest.mock import patch
-        with patch("opencode_config.commands.models.Config") as MockConfig:
+        db = InstalledDB(config_file.parent / "installed.json")
+        with patch("opencode_config.commands.models.Config") as MockConfig, patch(
+            "opencode_config.commands.models.InstalledDB", return_value=db
+        ):
             cfg = Config(config_file=config_file)
             MockConfig.return_value = cfg
             result = runner.invoke(models, args, catch_exceptions=False)
@@ -242,3 +248,74 @@ class TestModelsCommandIntegration:
         result, _ = self._invoke([], config_file)
         assert result.exit_code == 0
         assert "--list" in result.output or "No action" in result.output
+
+
+# ---------------------------------------------------------------------------
+# Targeted re-render after a tier change
+# ---------------------------------------------------------------------------
+
+class TestTierRerender:
+    @pytest.fixture
+    def installed(self, config_file, real_config, registry, target_dir):
+        """Install a high-tier and a low-tier agent and record the tier index."""
+        for tier in ["high", "medium", "low", "free"]:
+            real_config.set_model_tier(tier, f"provider/{tier}")
+        for name, body in [
+            ("architect", "model_tier: high\n"),
+            ("writer", "model_tier: low\n"),
+            ("plain", "description: none\n"),
+        ]:
+            (registry / "opencode" / "agents" / f"{name}.md").write_text(f"---\n{body}---\n")
+        (registry / "opencode" / "commands" / "review.md").write_text("Use {{tier:high}}\n")
+
+        cm = CopyManager(registry, target_dir, real_config)
+        cm.install_package("opencode")
+        db = InstalledDB(config_file.parent / "installed.json")
+        db.set_target_directory(str(target_dir))
+        db.set_registry_path(str(registry))
+        db.set_tier_index(cm.tier_index)
+        db.set_file_records(record_files(target_dir, [p.as_posix() for p in cm.written]))
+        return cm.tier_index
+
+    def test_index_maps_tiers_to_files(self, installed):
+        assert installed == {
+            "high": ["agents/architect.md", "commands/review.md"],
+            "low": ["agents/writer.md"],
+        }
+
+    def test_rerender_rewrites_only_affected_files(self, installed, config_file, target_dir):
+        writer = target_dir / "agents" / "writer.md"
+        os.utime(writer, ns=(1, 1))
+
+        result, _ = TestModelsCommandIntegration()._invoke(
+            ["--set", "high", "provider/bigger", "--rerender"], config_file
+        )
+
+        assert result.exit_code == 0
+        assert "Re-rendered 2 file(s)" in result.output
+        assert "model: provider/bigger" in (target_dir / "agents" / "architect.md").read_text()
+        assert "Use provider/bigger" in (target_dir / "commands" / "review.md").read_text()
+        assert writer.stat().st_mtime_ns == 1
+
+    def test_rerender_refreshes_records_and_keeps_edits(self, installed, config_file, target_dir):
+        architect = target_dir / "agents" / "architect.md"
+        architect.write_text("hand edited\n")
+
+        result, _ = TestModelsCommandIntegration()._invoke(
+            ["--set", "high", "provider/bigger", "--rerender"], config_file
+        )
+
+        assert "Re-rendered 1 file(s)" in result.output
+        assert architect.read_text() == "hand edited\n"
+        db = InstalledDB(config_file.parent / "installed.json")
+        check = verify_files(target_dir, db.get_file_records(), find_extra=False)
+        assert check.modified == ["agents/architect.md"]
+        assert db.get_files_for_tiers(["high"]) == ["agents/architect.md", "commands/review.md"]
+
+    def test_no_rerender_leaves_files(self, installed, config_file, target_dir):
+        result, _ = TestModelsCommandIntegration()._invoke(
+            ["--set", "high", "provider/bigger", "--no-rerender"], config_file
+        )
+
+        assert result.exit_code == 0
+        assert "model: provider/high" in (target_dir / "agents" / "architect.md").read_text()
@@ -0,0 +1,91 @@
+"""
+Tests for lint.py - Registry linting.
+"""
+
+import pytest
+
+from opencode_config.utils import lint
+from opencode_config.utils.lint import Linter
+
+
+@pytest.fixture
+def registry(mock_registry, mock_agent_md):
+    opencode = mock_registry / "opencode"
+    (opencode / "agents" / "subagents" / "01-core").mkdir()
+    (opencode / "agents" / "subagents" / "01-core" / "helper.md").write_text(
+        '---\ndescription: "Helps"\nmodel_tier: low\n---\n# Helper\n'
+    )
+    (opencode / "agents" / "_shared").mkdir()
+    (opencode / "agents" / "_shared" / "rules.md").write_text("Use subagents/01-core/helper.\n")
+    (mock_registry / "bundles" / "basic.yaml").write_text("components: [test-agent, helper]\n")
+    return mock_registry
+
+
+def messages(report):
+    return {(issue.path, issue.message) for issue in report.issues}
+
+
+class TestLinter:
+    def test_clean_registry(self, registry):
+        report = Linter(registry).run()
+        assert report.issues == []
+        assert report.checked == 3
+
+    def test_file_checks(self, registry):
+        agent = registry / "opencode" / "agents" / "broken.md"
+        agent.write_text("---\nmodel_tier: huge\ndescription: x\nversion: one\n---\n{{tier:top}}\n")
+        (registry / "opencode" / "commands" / "bad-yaml.md").write_text("---\na: [b\n---\n")
+
+        found = messages(Linter(registry).run())
+
+        assert ("opencode/agents/broken.md", "Unknown tier placeholder: {{tier:top}}") in found
+        assert any("Unknown model_tier 'huge'" in message for _, message in found)
+        assert any("Version 'one'" in message for _, message in found)
+        assert any(
+            path == "opencode/commands/bad-yaml.md" and message.startswith("Invalid frontmatter")
+            for path, message in found
+        )
+
+    def test_registry_checks(self, registry):
+        opencode = registry / "opencode"
+        (opencode / "commands" / "test-agent.md").write_text("---\ndescription: x\n---\n")
+        (opencode / "agents" / "_shared" / "rules.md").write_text(
+            "See subagents/01-core/missing and _shared/nope.md\n"
+        )
+        (registry / "bundles" / "basic.yaml").write_text("components: [helper, helper, ghost]\n")
+
+        report = Linter(registry).run()
+        found = messages(report)
+
+        assert (
+            "opencode/agents/test-agent.md",
+            "ID 'test-agent' is also defined by opencode/commands/test-agent.md",
+        ) in found
+        assert (
+            "opencode/agents/_shared/rules.md",
+            "Unknown subagent: subagents/01-core/missing",
+        ) in found
+        assert ("opencode/agents/_shared/rules.md", "Unknown shared file: _shared/nope.md") in found
+        assert ("bundles/basic.yaml", "'helper' listed twice") in found
+        assert ("bundles/basic.yaml", "Unknown component: ghost") in found
+        assert len(report.errors) == 3
+
+    def test_cached_results_reused_until_file_changes(self, registry, temp_dir, monkeypatch):
+        cache = temp_dir / "lint.json"
+        assert Linter(registry, cache).run().cached == 0
+
+        calls = []
+        original = lint.lint_file
+        monkeypatch.setattr(lint, "lint_file", lambda *args: calls.append(args) or original(*args))
+
+        report = Linter(registry, cache).run()
+        assert report.cached == report.checked
+        assert calls == []
+
+        (registry / "opencode" / "agents" / "test-agent.md").write_text(
+            "---\ndescription: x\nmodel_tier: bogus\n---\n"
+        )
+        report = Linter(registry, cache).run()
+        assert [args[1] for args in calls] == ["test-agent"]
+        assert report.cached == report.checked - 1
+        assert len(report.errors) == 1
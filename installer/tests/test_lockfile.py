@@ -0,0 +1,128 @@
+"""
+Tests for lockfile.py - Lockfile generation and frozen installs.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import lockfile
+from opencode_config.utils.hashing import hash_bytes, hash_file
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def config(temp_dir):
+    return Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+
+
+@pytest.fixture
+def registry(mock_registry, mock_agent_md, mock_skill_md):
+    (mock_registry / "opencode" / "agents" / "tiered.md").write_text(
+        '---\nname: "Tiered"\nversion: "2.0.0"\nmodel_tier: high\n---\n# Tiered\n'
+    )
+    (mock_registry / "opencode" / "skills" / "test-skill" / "run.sh").write_text("echo hi\n")
+    return mock_registry
+
+
+@pytest.fixture
+def lock(registry, config):
+    return lockfile.build_lock(registry, config)
+
+
+@pytest.fixture
+def target(temp_dir):
+    return temp_dir / "target"
+
+
+class TestHashing:
+    def test_file_and_bytes_agree(self, temp_dir):
+        path = temp_dir / "f"
+        path.write_bytes(b"content")
+        assert hash_file(path) == hash_bytes(b"content")
+        assert hash_bytes(b"content") != hash_bytes(b"other")
+
+
+class TestBuildLock:
+    def test_records_components_tiers_and_files(self, lock):
+        assert lock["tiers"] == TIERS
+        assert lock["components"]["agents"]["tiered"] == {
+            "version": "2.0.0",
+            "files": ["agents/tiered.md"],
+        }
+        assert lock["components"]["skills"]["test-skill"]["files"] == [
+            "skills/test-skill/SKILL.md",
+            "skills/test-skill/run.sh",
+        ]
+
+    def test_rendered_hash_differs_for_templates(self, lock):
+        tiered = lock["files"]["agents/tiered.md"]
+        assert tiered["template"] and tiered["rendered"] != tiered["source"]
+        script = lock["files"]["skills/test-skill/run.sh"]
+        assert not script["template"] and script["rendered"] == script["source"]
+
+    def test_round_trip(self, lock, temp_dir):
+        path = temp_dir / lockfile.LOCK_FILENAME
+        lockfile.write_lock(lock, path)
+        assert lockfile.load_lock(path) == lock
+
+    def test_unsupported_version_rejected(self, temp_dir):
+        path = temp_dir / "old.lock"
+        path.write_text('{"version": 99}')
+        with pytest.raises(ValueError):
+            lockfile.load_lock(path)
+
+
+class TestInstallFrozen:
+    def test_installs_locked_render(self, registry, lock, target):
+        result = lockfile.install_frozen(registry, target, lock)
+
+        assert result.success
+        assert len(result.written) == len(lock["files"])
+        assert "model: provider/big" in (target / "agents" / "tiered.md").read_text()
+
+    def test_ignores_current_config_tiers(self, registry, config, target):
+        lock = lockfile.build_lock(registry, config)
+        config.data["model_tiers"]["high"] = "provider/changed"
+
+        lockfile.install_frozen(registry, target, lock)
+        assert "model: provider/big" in (target / "agents" / "tiered.md").read_text()
+
+    def test_locked_transforms_applied(self, registry, config, target):
+        config.data["transforms"] = {"agent": []}
+        lock = lockfile.build_lock(registry, config)
+
+        result = lockfile.install_frozen(registry, target, lock)
+
+        assert result.success
+        assert "model_tier: high" in (target / "agents" / "tiered.md").read_text()
+
+    def test_only_mismatched_files_rewritten(self, registry, lock, target):
+        lockfile.install_frozen(registry, target, lock)
+        (target / "agents" / "tiered.md").write_text("edited")
+
+        result = lockfile.install_frozen(registry, target, lock)
+
+        assert result.written == [Path("agents/tiered.md")]
+        assert len(result.unchanged) == len(lock["files"]) - 1
+
+    def test_changed_registry_file_fails_without_writing(self, registry, lock, target):
+        (registry / "opencode" / "agents" / "tiered.md").write_text("---\nmodel_tier: low\n---\n")
+
+        result = lockfile.install_frozen(registry, target, lock)
+
+        assert not result.success
+        assert "agents/tiered.md" in result.errors[0]
+        assert not target.exists()
+
+    def test_dry_run_writes_nothing(self, registry, lock, target):
+        result = lockfile.install_frozen(registry, target, lock, dry_run=True)
+        assert len(result.written) == len(lock["files"])
+        assert not target.exists()
+
+    def test_locked_versions(self, lock):
+        versions = lockfile.locked_versions(lock)
+        assert versions["tiered"] == "2.0.0"
+        assert versions["test-skill"] == "2.0.0"
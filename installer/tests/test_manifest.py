@@ -2,7 +2,7 @@
 Tests for manifest.py - Component manifest parsing and validation.
 """
 
-from opencode_config.utils.manifest import ComponentManifest, ManifestParser
+from opencode_config.utils.manifest import ComponentManifest, ManifestParser, split_frontmatter
 
 
 class TestComponentManifest:
@@ -295,3 +295,21 @@ model_tier: "low"
 
         assert manifest.model_tier == "high"
         assert manifest.model == "claude-opus-4-5"
+
+
+class TestSplitFrontmatter:
+    """Test split_frontmatter."""
+
+    def test_splits_yaml_and_body(self):
+        """Test that only a line of its own closes the frontmatter."""
+        content = "---\ndescription: a---b\n---\n# Body\n---\n"
+        assert split_frontmatter(content) == ("description: a---b\n", "# Body\n---\n")
+
+    def test_empty_frontmatter(self):
+        """Test frontmatter with nothing between the delimiters."""
+        assert split_frontmatter("---\n---\nBody") == ("", "Body")
+
+    def test_missing_or_unclosed(self):
+        """Test content without closed frontmatter is all body."""
+        assert split_frontmatter("# Title\n") == (None, "# Title\n")
+        assert split_frontmatter("---\nname: x\n") == (None, "---\nname: x\n")
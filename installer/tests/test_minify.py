@@ -0,0 +1,106 @@
+"""
+Tests for minify.py - Prompt minification.
+"""
+
+from pathlib import Path
+
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.minify import minify, minify_markdown, should_minify
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+SOURCE = """---
+description: "Keep   these  spaces"
+model: provider/big
+---
+
+
+# Agent   Title   <!-- TODO: rename -->
+
+Some    text.
+
+---
+
+<!-- authoring-only -->
+Notes for registry editors.
+<!-- /authoring-only -->
+Heading
+---
+
+
+```bash
+echo "a    b"
+<!-- kept in code -->
+```
+<!--
+multi-line comment
+-->
+End.
+"""
+
+EXPECTED = """---
+description: "Keep   these  spaces"
+model: provider/big
+---
+# Agent Title
+
+Some text.
+
+Heading
+---
+
+```bash
+echo "a    b"
+<!-- kept in code -->
+```
+
+End.
+"""
+
+
+class TestMinifyMarkdown:
+    def test_minifies_body_only(self):
+        assert minify_markdown(SOURCE) == EXPECTED
+
+    def test_reports_savings(self):
+        result = minify(SOURCE)
+
+        assert result.content == EXPECTED
+        assert result.saved_bytes == len(SOURCE) - len(EXPECTED)
+        assert result.saved_tokens > 0
+
+    def test_unclosed_fence_kept_verbatim(self):
+        assert minify_markdown("a  b\n```\nx   y\n\n\n") == "a b\n```\nx   y\n"
+
+    def test_only_prompt_directories(self):
+        assert should_minify(Path("agents/subagents/01-core/helper.md"))
+        assert should_minify(Path("agents/_shared/rules.md"))
+        assert should_minify(Path("commands/review.md"))
+        assert not should_minify(Path("skills/lint/SKILL.md"))
+        assert not should_minify(Path("agents/notes.txt"))
+
+
+class TestCopyManagerMinify:
+    def install(self, registry, temp_dir, minify_setting):
+        config = Config(
+            temp_dir / "config.json", data={"model_tiers": dict(TIERS), "minify": minify_setting}
+        )
+        messages = []
+        manager = CopyManager(
+            registry, temp_dir / "target", config, log=lambda *args: messages.append(args)
+        )
+        assert manager.install_package("opencode")
+        return messages
+
+    def test_minify_setting_applies_on_install(self, mock_registry, temp_dir):
+        agent = mock_registry / "opencode" / "agents" / "build.md"
+        agent.write_text('---\nmodel_tier: "high"\n---\nDo   it. <!-- note -->\n')
+        installed = temp_dir / "target" / "agents" / "build.md"
+
+        self.install(mock_registry, temp_dir, False)
+        assert installed.read_text() == "---\nmodel: provider/big\n---\nDo   it. <!-- note -->\n"
+
+        messages = self.install(mock_registry, temp_dir, True)
+        assert installed.read_text() == "---\nmodel: provider/big\n---\nDo it.\n"
+        assert ("info", "Minified agents/build.md: 16 bytes, ~5 tokens saved") in messages
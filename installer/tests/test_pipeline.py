@@ -0,0 +1,95 @@
+"""
+Tests for pipeline.py - Transform pipeline.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.pipeline import TIMINGS, TransformPipeline, file_kind
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+AGENT = '---\nmodel_tier: "high"\n---\nUse {{tier:low}}.   <!-- note -->\n'
+
+
+def manager(registry, temp_dir, **settings):
+    config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS), **settings})
+    return CopyManager(registry, temp_dir / "target", config, log=lambda *args: None)
+
+
+@pytest.fixture
+def registry(mock_registry):
+    (mock_registry / "opencode" / "agents" / "build.md").write_text(AGENT)
+    (mock_registry / "opencode" / "commands" / "go.md").write_text(AGENT)
+    return mock_registry
+
+
+class TestTransformPipeline:
+    def test_file_kinds(self):
+        assert file_kind(Path("agents/build.md")) == "agent"
+        assert file_kind(Path("agents/subagents/01-core/helper.md")) == "subagent"
+        assert file_kind(Path("agents/_shared/rules.md")) == "shared"
+        assert file_kind(Path("skills/lint/SKILL.md")) == "skill"
+        assert file_kind(Path("README.md")) == "other"
+
+    def test_stages_configurable_per_kind(self, registry, temp_dir):
+        copy_manager = manager(registry, temp_dir, minify=True, transforms={"command": ["render"]})
+
+        agent = copy_manager.render_file(registry / "opencode/agents/build.md", Path("agents/b.md"))
+        command = copy_manager.render_file(
+            registry / "opencode/commands/go.md", Path("commands/go.md")
+        )
+
+        assert agent.content == "---\nmodel: provider/big\n---\nUse provider/small.\n"
+        assert command.content == (
+            "---\nmodel: provider/big\n---\nUse provider/small.   <!-- note -->\n"
+        )
+        assert agent.tiers == command.tiers == ["high", "low"]
+
+    def test_without_render_stage_text_is_untouched(self, registry, temp_dir):
+        copy_manager = manager(registry, temp_dir, transforms={"agent": []})
+
+        rendered = copy_manager.render_file(
+            registry / "opencode/agents/build.md", Path("agents/build.md")
+        )
+        assert rendered.content == AGENT
+        assert rendered.tiers == []
+
+    def test_unknown_stage_or_kind_rejected(self):
+        with pytest.raises(ValueError, match="Unknown transform stage 'compress'"):
+            TransformPipeline({"agent": ["render", "compress"]})
+        with pytest.raises(ValueError, match="Unknown file kind 'widget'"):
+            TransformPipeline({"widget": ["render"]})
+
+    def test_stages_timed(self, registry, temp_dir):
+        TIMINGS.reset()
+        assert manager(registry, temp_dir, minify=True).install_package("opencode")
+
+        timings = TIMINGS.snapshot()
+        assert timings["render"][0] == 2
+        assert timings["minify"][0] == 2
+        assert all(seconds >= 0 for _, seconds in timings.values())
+
+    def test_variants_minified_per_configuration(self, registry, temp_dir):
+        copy_manager = manager(registry, temp_dir)
+        configs = {
+            "plain": Config(temp_dir / "a.json", data={"model_tiers": dict(TIERS)}),
+            "small": Config(temp_dir / "b.json", data={"model_tiers": dict(TIERS), "minify": True}),
+        }
+
+        variants, success = copy_manager.render_variants("opencode", configs)
+
+        assert success
+        assert "<!-- note -->" in variants["plain"][0].content
+        assert "<!-- note -->" not in variants["small"][0].content
+
+    def test_variants_limited_to_components(self, registry, temp_dir):
+        copy_manager = manager(registry, temp_dir)
+        configs = {"plain": Config(temp_dir / "a.json", data={"model_tiers": dict(TIERS)})}
+
+        variants, success = copy_manager.render_variants("opencode", configs, {"go"})
+
+        assert success
+        assert [item.rel_path for item in variants["plain"]] == [Path("commands/go.md")]
@@ -0,0 +1,117 @@
+"""
+Tests for registry_index.py - Cached registry index.
+"""
+
+import os
+import time
+
+import pytest
+
+from opencode_config.utils.registry_index import RegistryIndex
+
+
+@pytest.fixture
+def registry(mock_registry):
+    """Registry with one component of each type and two bundles."""
+    opencode = mock_registry / "opencode"
+    (opencode / "agents" / "build-code.md").write_text("---\nname: Build\n---\n")
+    (opencode / "agents" / "subagents" / "01-core").mkdir()
+    (opencode / "agents" / "subagents" / "01-core" / "backend-architect.md").write_text("# B\n")
+    (opencode / "skills" / "mcp-builder").mkdir()
+    (opencode / "skills" / "mcp-builder" / "SKILL.md").write_text("# S\n")
+    (opencode / "commands" / "review.md").write_text("# R\n")
+    (mock_registry / "bundles" / "basic.yaml").write_text("name: basic\n")
+    (mock_registry / "bundles" / "advanced.yaml").write_text("name: advanced\n")
+    return mock_registry
+
+
+@pytest.fixture
+def index_path(temp_dir):
+    return temp_dir / "index.json"
+
+
+def _age(path):
+    """Push a directory's mtime into the past so later changes are visible."""
+    past = time.time_ns() - 10_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+class TestRegistryIndex:
+    def test_lists_components_by_type(self, registry, index_path):
+        index = RegistryIndex(registry, index_path)
+        assert index.component_ids("agent") == ["build-code"]
+        assert index.component_ids("subagent") == ["backend-architect"]
+        assert index.component_ids("skill") == ["mcp-builder"]
+        assert index.component_ids("command") == ["review"]
+
+    def test_all_component_ids_unique_and_sorted(self, registry, index_path):
+        (registry / "opencode" / "agents" / "review.md").write_text("# R\n")
+        index = RegistryIndex(registry, index_path)
+        assert index.component_ids() == [
+            "backend-architect",
+            "build-code",
+            "mcp-builder",
+            "review",
+        ]
+        assert index.component_types()["review"] == ["agent", "command"]
+
+    def test_lists_bundles(self, registry, index_path):
+        index = RegistryIndex(registry, index_path)
+        assert index.bundle_names() == ["advanced", "basic"]
+
+    def test_skill_without_skill_md_ignored(self, registry, index_path):
+        (registry / "opencode" / "skills" / "incomplete").mkdir()
+        index = RegistryIndex(registry, index_path)
+        assert "incomplete" not in index.component_ids("skill")
+
+    def test_index_is_cached(self, registry, index_path):
+        assert RegistryIndex(registry, index_path).component_ids("agent") == ["build-code"]
+        assert index_path.exists()
+
+        cached = RegistryIndex(registry, index_path)
+        cached.build = None  # a rebuild would fail loudly
+        assert cached.component_ids("agent") == ["build-code"]
+
+    def test_index_refreshed_when_registry_changes(self, registry, index_path):
+        agents_dir = registry / "opencode" / "agents"
+        _age(agents_dir)
+        assert RegistryIndex(registry, index_path).component_ids("agent") == ["build-code"]
+
+        (agents_dir / "debug.md").write_text("# D\n")
+        index = RegistryIndex(registry, index_path)
+        assert index.component_ids("agent") == ["build-code", "debug"]
+
+    def test_index_refreshed_when_skill_md_added(self, registry, index_path):
+        skill_dir = registry / "opencode" / "skills" / "late-skill"
+        skill_dir.mkdir()
+        _age(skill_dir)
+        assert "late-skill" not in RegistryIndex(registry, index_path).component_ids("skill")
+
+        (skill_dir / "SKILL.md").write_text("# Late\n")
+        assert "late-skill" in RegistryIndex(registry, index_path).component_ids("skill")
+
+    def test_index_for_other_registry_rebuilt(self, registry, index_path, temp_dir):
+        assert RegistryIndex(registry, index_path).component_ids("command") == ["review"]
+        other = temp_dir / "other"
+        (other / "opencode" / "commands").mkdir(parents=True)
+        (other / "opencode" / "commands" / "deploy.md").write_text("# D\n")
+
+        assert RegistryIndex(other, index_path).component_ids() == ["deploy"]
+
+    def test_corrupt_index_rebuilt(self, registry, index_path):
+        index_path.write_text("{broken")
+        assert RegistryIndex(registry, index_path).component_ids("command") == ["review"]
+
+    def test_cached_lookup_fast_on_large_registry(self, registry, index_path):
+        """Cached lookups only stat directories, so they stay fast on large registries."""
+        commands_dir = registry / "opencode" / "commands"
+        for i in range(2000):
+            (commands_dir / f"command-{i:04d}.md").write_text("# C\n")
+        assert len(RegistryIndex(registry, index_path).component_ids("command")) == 2001
+
+        start = time.perf_counter()
+        ids = RegistryIndex(registry, index_path).component_ids()
+        elapsed = time.perf_counter() - start
+
+        assert len(ids) == 2004
+        assert elapsed < 0.05
@@ -0,0 +1,98 @@
+"""
+Tests for store.py - Content-addressed object store.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.store import ObjectStore, store_for
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def store(temp_dir):
+    return ObjectStore(temp_dir / "store")
+
+
+@pytest.fixture
+def link_config(temp_dir):
+    data = {
+        "model_tiers": dict(TIERS),
+        "install_method": "link",
+        "store_path": str(temp_dir / "store"),
+    }
+    return Config(temp_dir / "config.json", data=data)
+
+
+class TestObjectStore:
+    def test_identical_content_stored_once(self, store, temp_dir):
+        a, b = temp_dir / "a", temp_dir / "b"
+        store.link(store.put_bytes(b"same"), a)
+        store.link(store.put_bytes(b"same"), b)
+
+        assert os.path.samefile(a, b)
+        assert store.stats() == (1, 4)
+        assert os.stat(a).st_mode & 0o222 == 0
+
+    def test_executable_bit_kept(self, store, temp_dir):
+        script = temp_dir / "run.sh"
+        script.write_text("echo\n")
+        script.chmod(0o755)
+
+        dest = temp_dir / "dest.sh"
+        store.link(store.put_file(script), dest)
+        assert os.access(dest, os.X_OK)
+        assert store.put_bytes(b"echo\n") != store.put_file(script)
+
+    def test_gc_removes_unreferenced_blobs(self, store, temp_dir):
+        store.link(store.put_bytes(b"kept"), temp_dir / "kept")
+        store.link(store.put_bytes(b"dropped"), temp_dir / "dropped")
+        (temp_dir / "dropped").unlink()
+
+        assert store.gc(dry_run=True) == (1, len(b"dropped"))
+        assert store.gc() == (1, len(b"dropped"))
+        assert store.stats() == (1, len(b"kept"))
+
+    def test_concurrent_puts_share_one_inode(self, store, temp_dir):
+        dests = [temp_dir / f"d{i}" for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda d: store.link(store.put_bytes(b"race"), d), dests))
+
+        assert all(os.path.samefile(dests[0], d) for d in dests)
+        assert os.stat(dests[0]).st_nlink == len(dests) + 1
+
+
+class TestLinkInstall:
+    def test_store_for_follows_install_method(self, link_config, temp_dir):
+        assert store_for(link_config).root == temp_dir / "store"
+        assert store_for(Config(temp_dir / "c.json", data={})) is None
+
+    def test_targets_share_inodes(self, mock_registry, mock_agent_md, link_config, temp_dir):
+        targets = [temp_dir / "t1", temp_dir / "t2"]
+        manager = CopyManager(mock_registry, targets[0], link_config, log=lambda *args: None)
+        results = manager.install_package_to_targets("opencode", targets)
+
+        assert all(results.values())
+        assert manager.install_method == "link"
+        agent = "agents/test-agent.md"
+        assert os.path.samefile(targets[0] / agent, targets[1] / agent)
+
+    def test_copy_install_does_not_write_through_links(
+        self, mock_registry, mock_agent_md, link_config, store, temp_dir
+    ):
+        target = temp_dir / "t"
+        CopyManager(mock_registry, target, link_config).install_package("opencode")
+        blobs_before = store.stats()
+
+        link_config.data["install_method"] = "copy"
+        (mock_registry / "opencode" / "agents" / "test-agent.md").write_text("changed\n")
+        CopyManager(mock_registry, target, link_config).install_package("opencode")
+
+        assert (target / "agents" / "test-agent.md").read_text() == "changed\n"
+        assert os.stat(target / "agents" / "test-agent.md").st_nlink == 1
+        assert store.stats() == blobs_before
@@ -5,7 +5,7 @@ Tests for template engine functionality.
 import pytest
 from pathlib import Path
 from opencode_config.config import Config
-from opencode_config.utils.template import TemplateEngine
+from opencode_config.utils.template import MODEL_TIER_PATTERN, TemplateEngine
 
 
 @pytest.fixture
@@ -182,3 +182,50 @@ def test_multiple_replacements(temp_config):
     assert "test-model-high" in result
     assert "test-model-medium" in result
     assert "literal-model" in result
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "---\nname: A\nmodel_tier: high\n---\n# A\n",
+        "---\nmodel_tier: 'low'\n---\nUse {{tier:high}} or {{model:x/literal}}.\n",
+        "No templates at all\n",
+        "{{tier:free}}{{tier:medium}}",
+    ],
+)
+def test_compiled_template_matches_process_content(temp_config, content):
+    """Compiled rendering equals model_tier substitution followed by process_content."""
+    engine = TemplateEngine(temp_config)
+    expected = MODEL_TIER_PATTERN.sub(
+        lambda m: f"model: {engine.resolve_model(m.group(1))}", content
+    )
+    expected = engine.process_content(expected)
+    assert engine.compile(content).render(engine) == expected
+
+
+def test_compiled_template_renders_several_configs(temp_config, tmp_path):
+    """One parse renders differently for each configuration."""
+    compiled = TemplateEngine(temp_config).compile("---\nmodel_tier: high\n---\n{{tier:low}}\n")
+    other = Config(tmp_path / "other.json", data={"model_tiers": {"high": "big", "low": "small"}})
+
+    assert compiled.render(TemplateEngine(temp_config)) == (
+        "---\nmodel: test-model-high\n---\ntest-model-low\n"
+    )
+    assert compiled.render(TemplateEngine(other)) == "---\nmodel: big\n---\nsmall\n"
+
+
+def test_compiled_template_injects_override(temp_config):
+    """An override without a model_tier line is injected after the opening ---."""
+    engine = TemplateEngine(temp_config)
+    compiled = engine.compile("---\nname: A\n---\n{{tier:high}}\n")
+    assert compiled.render(engine, "x/y") == "---\nmodel: x/y\nname: A\n---\ntest-model-high\n"
+    assert compiled.tiers(temp_config, "x/y") == ["high"]
+
+
+def test_compiled_template_keeps_placeholders_on_request(temp_config):
+    """placeholders=False leaves {{...}} untouched but still resolves model_tier lines."""
+    engine = TemplateEngine(temp_config)
+    compiled = engine.compile("model_tier: low\n{{tier:high}} {{model:m}}")
+    assert compiled.render(engine, placeholders=False) == (
+        "model: test-model-low\n{{tier:high}} {{model:m}}"
+    )
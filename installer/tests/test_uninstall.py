@@ -0,0 +1,64 @@
+"""
+Tests for the uninstall command.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from opencode_config.commands.install import _record_install
+from opencode_config.commands.uninstall import uninstall
+from opencode_config.config import Config
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.installed_db import InstalledDB
+
+
+@pytest.fixture
+def installed(mock_registry, temp_dir):
+    """Install an agent and a command that share the ID ``review``."""
+    opencode = mock_registry / "opencode"
+    (opencode / "agents" / "review.md").write_text("---\nmodel_tier: high\n---\n# Agent\n")
+    (opencode / "commands" / "review.md").write_text("# Command\n")
+    (opencode / "commands" / "other.md").write_text("# Other\n")
+    target = temp_dir / "target"
+    config = Config(
+        temp_dir / "config.json", data={"target": str(target), "registry_path": str(mock_registry)}
+    )
+    db = InstalledDB(temp_dir / "installed.json")
+    manager = CopyManager(mock_registry, target, config, log=lambda *args: None)
+    assert manager.install_package("opencode")
+    _record_install(db, manager, mock_registry, ["review", "other"], tier_index=manager.tier_index)
+    return config, db, target
+
+
+def run(installed, args, input=None):
+    config, db, _ = installed
+    with patch("opencode_config.commands.uninstall.Config", return_value=config), patch(
+        "opencode_config.commands.uninstall.InstalledDB", return_value=db
+    ):
+        return CliRunner().invoke(uninstall, args, input=input, catch_exceptions=False)
+
+
+class TestUninstall:
+    def test_id_installed_under_several_types(self, installed):
+        _, db, target = installed
+
+        run(installed, ["review"])
+
+        assert not (target / "agents" / "review.md").exists()
+        assert not (target / "commands" / "review.md").exists()
+        assert not db.is_installed("review")
+        assert list(db.get_file_records()) == ["commands/other.md"]
+        assert db.get_files_for_tiers(["high"]) == []
+
+    def test_all_clears_file_state(self, installed):
+        _, db, target = installed
+
+        run(installed, ["--all"], input="yes\n")
+
+        assert db.get_all_installed() == []
+        assert db.get_file_records() == {}
+        assert db.get_files_for_tiers(["high"]) == []
+        assert "sharedFiles" not in db.data
+        assert not (target / "commands" / "other.md").exists()
@@ -0,0 +1,124 @@
+"""
+Tests for updates.py - Update availability planning.
+"""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from opencode_config.commands.install import _record_install
+from opencode_config.commands.update import update
+from opencode_config.config import Config
+from opencode_config.utils.catalog import Catalog
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.installed_db import InstalledDB
+from opencode_config.utils.updates import InstalledComponent, PendingUpdate, plan_updates
+
+AGENT = '---\nname: "{0}"\ntype: "agent"\nversion: "{1}"\n---\n# {0} {1}\n'
+
+
+def record(component_id, component_type, version):
+    return {"id": component_id, "type": component_type, "version": version}
+
+
+class TestPlanUpdates:
+    def test_newer_registry_version_is_an_update(self, mock_registry, mock_agent_md):
+        catalog = Catalog.scan(mock_registry)
+        plan = plan_updates(catalog, [record("test-agent", "agent", "1.0.0")], {"test-agent"})
+
+        assert plan.updates == [PendingUpdate("test-agent", "agent", "1.0.0", "1.2.3")]
+        assert plan.changes == 1
+        assert plan.versions["test-agent"] == "1.2.3"
+
+    def test_current_and_unknown_versions_not_updated(self, mock_registry, mock_agent_md):
+        catalog = Catalog.scan(mock_registry)
+        for version in ("1.2.3", "2.0.0", "unknown"):
+            plan = plan_updates(catalog, [record("test-agent", "agent", version)], {"test-agent"})
+            assert plan.updates == []
+
+    def test_missing_and_orphaned(self, mock_registry, mock_agent_md):
+        catalog = Catalog.scan(mock_registry)
+        installed = [record("test-agent", "agent", "1.2.3"), record("gone", "command", "1.0.0")]
+
+        plan = plan_updates(catalog, installed, set())
+
+        assert plan.missing == [InstalledComponent("test-agent", "agent", "1.2.3")]
+        assert plan.orphans == [InstalledComponent("gone", "command", "1.0.0")]
+
+    def test_type_must_match(self, mock_registry, mock_agent_md):
+        catalog = Catalog.scan(mock_registry)
+        plan = plan_updates(catalog, [record("test-agent", "command", "1.0.0")], {"test-agent"})
+        assert plan.updates == []
+        assert [o.id for o in plan.orphans] == ["test-agent"]
+
+    def test_unparsable_version_reported(self, mock_registry, mock_agent_md):
+        catalog = Catalog.scan(mock_registry)
+        plan = plan_updates(catalog, [record("test-agent", "agent", "beta")], {"test-agent"})
+
+        assert plan.updates == []
+        assert len(plan.invalid) == 1
+        assert plan.invalid[0].startswith("test-agent:")
+
+
+class TestUpdateCommand:
+    def test_only_installed_components_rerendered(self, mock_registry, temp_dir):
+        agents = mock_registry / "opencode" / "agents"
+        (agents / "a.md").write_text(AGENT.format("a", "1.0.0"))
+        (agents / "b.md").write_text(AGENT.format("b", "1.0.0"))
+        target = temp_dir / "target"
+        config = Config(
+            temp_dir / "config.json",
+            data={"target": str(target), "registry_path": str(mock_registry)},
+        )
+        db = InstalledDB(temp_dir / "installed.json")
+        manager = CopyManager(mock_registry, target, config, log=lambda *args: None)
+        assert manager.install_components("opencode", [["a"]])
+        _record_install(
+            db,
+            manager,
+            mock_registry,
+            ["a"],
+            component_versions={"a": "1.0.0"},
+            files=["agents/a.md"],
+            partial=True,
+        )
+        (agents / "a.md").write_text(AGENT.format("a", "2.0.0"))
+
+        with patch("opencode_config.commands.update.Config", return_value=config), patch(
+            "opencode_config.commands.update.InstalledDB", return_value=db
+        ):
+            result = CliRunner().invoke(update, ["--all"], catch_exceptions=False)
+
+        assert "Successfully updated 1 component(s)" in result.output
+        assert (target / "agents" / "a.md").read_text().endswith("# a 2.0.0\n")
+        assert not (target / "agents" / "b.md").exists()
+        assert db.get_installed_version("a") == "2.0.0"
+        assert not db.is_installed("b")
+        assert list(db.get_file_records()) == ["agents/a.md"]
+
+    def test_components_gone_from_registry_kept(self, mock_registry, temp_dir):
+        agents = mock_registry / "opencode" / "agents"
+        (agents / "a.md").write_text(AGENT.format("a", "1.0.0"))
+        (agents / "gone.md").write_text(AGENT.format("gone", "1.0.0"))
+        target = temp_dir / "target"
+        config = Config(
+            temp_dir / "config.json",
+            data={"target": str(target), "registry_path": str(mock_registry)},
+        )
+        db = InstalledDB(temp_dir / "installed.json")
+        manager = CopyManager(mock_registry, target, config, log=lambda *args: None)
+        assert manager.install_package("opencode")
+        _record_install(db, manager, mock_registry, ["a", "gone"], {"a": "1.0.0", "gone": "1.0.0"})
+        (agents / "gone.md").unlink()
+        (agents / "a.md").write_text(AGENT.format("a", "2.0.0"))
+
+        with patch("opencode_config.commands.update.Config", return_value=config), patch(
+            "opencode_config.commands.update.InstalledDB", return_value=db
+        ):
+            result = CliRunner().invoke(update, ["--all"], catch_exceptions=False)
+
+        assert "No Longer in Registry (1)" in result.output
+        assert (target / "agents" / "gone.md").exists()
+        assert db.is_installed("gone")
+        assert "agents/gone.md" in db.get_file_records()
+        assert db.get_installed_version("a") == "2.0.0"
@@ -0,0 +1,79 @@
+"""
+Tests for verify.py - Installed file drift detection.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import verify
+from opencode_config.utils.copy import CopyManager, RenderedFile
+
+
+@pytest.fixture
+def target(temp_dir):
+    target = temp_dir / "target"
+    (target / "agents").mkdir(parents=True)
+    (target / "agents" / "a.md").write_text("alpha\n")
+    (target / "agents" / "b.md").write_text("beta\n")
+    return target
+
+
+@pytest.fixture
+def records(target):
+    return verify.record_files(target, ["agents/a.md", "agents/b.md", "agents/gone.md"])
+
+
+class TestRecordFiles:
+    def test_records_existing_files_only(self, records):
+        assert sorted(records) == ["agents/a.md", "agents/b.md"]
+        assert records["agents/a.md"]["size"] == len("alpha\n")
+
+
+class TestVerifyFiles:
+    def test_clean_target(self, target, records):
+        report = verify.verify_files(target, records)
+        assert report.clean
+        assert report.unchanged == ["agents/a.md", "agents/b.md"]
+
+    def test_detects_modified_missing_and_extra(self, target, records):
+        (target / "agents" / "a.md").write_text("changed\n")
+        (target / "agents" / "b.md").unlink()
+        (target / "agents" / "mine.md").write_text("mine\n")
+
+        report = verify.verify_files(target, records)
+
+        assert not report.clean
+        assert report.modified == ["agents/a.md"]
+        assert report.missing == ["agents/b.md"]
+        assert report.extra == ["agents/mine.md"]
+
+    def test_same_size_edit_detected_by_hash(self, target, records):
+        path = target / "agents" / "a.md"
+        path.write_text("ALPHA\n")
+        os.utime(path, ns=(0, records["agents/a.md"]["mtime"] + 1))
+
+        assert verify.verify_files(target, records).modified == ["agents/a.md"]
+
+    def test_touched_file_with_same_content_unchanged(self, target, records):
+        path = target / "agents" / "a.md"
+        os.utime(path, ns=(0, records["agents/a.md"]["mtime"] + 1))
+
+        assert verify.verify_files(target, records).unchanged == ["agents/a.md", "agents/b.md"]
+
+
+class TestModifiedFilesProtected:
+    def test_modified_file_not_overwritten_or_removed(self, target, temp_dir):
+        config = Config(temp_dir / "config.json", data={})
+        manager = CopyManager(target, target, config, log=lambda level, message: None)
+        manager.modified_files = {"agents/a.md"}
+        item = RenderedFile(Path("agents/a.md"), target / "x", content="new\n")
+
+        written, _ = manager.write_rendered([item], target)
+        removed = manager.remove_files(["agents/a.md", "agents/b.md"])
+
+        assert written == []
+        assert (target / "agents" / "a.md").read_text() == "alpha\n"
+        assert [p.as_posix() for p in removed] == ["agents/b.md"]
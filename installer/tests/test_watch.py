@@ -0,0 +1,137 @@
+"""
+Tests for watch.py - Incremental installs on registry edits.
+"""
+
+import shutil
+
+import pytest
+
+from opencode_config.config import Config
+from opencode_config.utils import watch
+from opencode_config.utils.copy import CopyManager
+from opencode_config.utils.installed_db import InstalledDB
+
+TIERS = {"high": "provider/big", "medium": "provider/mid", "low": "provider/small", "free": "x/y"}
+
+
+@pytest.fixture
+def package(mock_registry, mock_agent_md):
+    return mock_registry / "opencode"
+
+
+@pytest.fixture
+def target(temp_dir):
+    return temp_dir / "target"
+
+
+@pytest.fixture
+def db(temp_dir):
+    return InstalledDB(temp_dir / "installed.json")
+
+
+@pytest.fixture
+def installer(mock_registry, target, db, temp_dir):
+    config = Config(temp_dir / "config.json", data={"model_tiers": dict(TIERS)})
+    manager = CopyManager(mock_registry, target, config, log=lambda level, message: None)
+    return watch.IncrementalInstaller(manager, db)
+
+
+class TestIncrementalInstaller:
+    def test_new_file_rendered_and_recorded(self, installer, package, target, db):
+        agent = package / "agents" / "fresh.md"
+        agent.write_text('---\nname: Fresh\nversion: "1.3.0"\nmodel_tier: high\n---\n# Fresh\n')
+
+        batch = installer.apply({agent})
+
+        assert [p.as_posix() for p in batch.written] == ["agents/fresh.md"]
+        assert "model: provider/big" in (target / "agents" / "fresh.md").read_text()
+        assert db.get_installed_version("fresh") == "1.3.0"
+        assert db.get_files_for_tiers(["high"]) == ["agents/fresh.md"]
+        assert db.get_component("agent", "fresh")["files"] == ["agents/fresh.md"]
+        assert "agents/fresh.md" in db.get_file_records()
+
+    def test_broken_file_skipped_and_others_applied(self, installer, package, target, db):
+        messages = []
+        installer.manager.log = lambda level, message: messages.append((level, message))
+        broken = package / "agents" / "broken.md"
+        broken.write_bytes(b"---\nname: \xff\n---\n")
+        fresh = package / "agents" / "fresh.md"
+        fresh.write_text("---\nname: Fresh\n---\n# Fresh\n")
+
+        batch = installer.apply({broken, fresh})
+
+        assert not batch.success
+        assert [p.as_posix() for p in batch.written] == ["agents/fresh.md"]
+        assert not (target / "agents" / "broken.md").exists()
+        assert any("agents/broken.md" in message for level, message in messages)
+        assert db.get_component("agent", "fresh")["files"] == ["agents/fresh.md"]
+
+    def test_deleted_directory_removed_from_target(self, installer, package, target, db):
+        skill_dir = package / "skills" / "temp"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: Temp\n---\n")
+        (skill_dir / "scripts" / "run.sh").write_text("echo\n")
+        installer.apply({skill_dir})
+        assert (target / "skills" / "temp" / "scripts" / "run.sh").exists()
+
+        shutil.rmtree(skill_dir)
+        batch = installer.apply({skill_dir})
+
+        assert len(batch.removed) == 2
+        assert not (target / "skills" / "temp").exists()
+        assert not db.is_installed("temp")
+
+    def test_fragment_change_rerenders_files_that_inline_it(self, installer, package, target):
+        shared = package / "agents" / "_shared"
+        shared.mkdir()
+        (shared / "outer.md").write_text("Outer {{include:_shared/inner.md}}\n")
+        (shared / "inner.md").write_text("old rules\n")
+        agent = package / "agents" / "build.md"
+        agent.write_text("# Build\n{{include:_shared/outer.md}}\n")
+        installer.apply({agent})
+
+        (shared / "inner.md").write_text("new rules\n")
+        batch = installer.apply({shared / "inner.md"})
+
+        assert sorted(p.as_posix() for p in batch.written) == [
+            "agents/_shared/inner.md",
+            "agents/_shared/outer.md",
+            "agents/build.md",
+        ]
+        assert (target / "agents" / "build.md").read_text() == "# Build\nOuter new rules\n"
+
+    def test_hidden_and_outside_paths_ignored(self, installer, package, temp_dir):
+        (package / "agents" / ".draft.md").write_text("x")
+        (temp_dir / "elsewhere.md").write_text("x")
+
+        batch = installer.apply({package / "agents" / ".draft.md", temp_dir / "elsewhere.md"})
+        assert batch.written == [] and batch.removed == []
+
+
+class TestWatchers:
+    def test_polling_watcher_reports_changes(self, package):
+        watcher = watch.PollingWatcher(package, interval=0.01)
+        assert watcher.wait(timeout=0.02) == set()
+
+        new_file = package / "commands" / "new.md"
+        new_file.parent.mkdir(exist_ok=True)
+        new_file.write_text("# new\n")
+        assert watch.collect_changes(watcher, debounce=0.02, timeout=1) == {new_file}
+
+        new_file.unlink()
+        assert watcher.wait(timeout=1) == {new_file}
+
+    def test_inotify_watcher_reports_new_directories(self, package):
+        try:
+            watcher = watch.InotifyWatcher(package)
+        except OSError:
+            pytest.skip("inotify not available")
+        try:
+            skill_dir = package / "skills" / "added"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text("---\nname: Added\n---\n")
+
+            changed = watch.collect_changes(watcher, debounce=0.05, timeout=1)
+            assert skill_dir in changed
+        finally:
+            watcher.close()